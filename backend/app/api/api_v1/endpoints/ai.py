@@ -2,11 +2,11 @@
 Enhanced AI service endpoints for testing and sprint planning.
 """
 from typing import Any, Dict, List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from app.services.ai_service import ai_service
-from app.services.vector_service import vector_service
+from app.services.ai_service import AIService, get_ai_service
+from app.services.vector_service import VectorService, get_vector_service
 
 router = APIRouter()
 
@@ -27,7 +27,10 @@ class SprintPlanRequest(BaseModel):
     sprint_goal_context: str = ""
 
 @router.post("/analyze-backlog")
-async def analyze_backlog_item(request: AnalyzeBacklogRequest) -> Any:
+async def analyze_backlog_item(
+    request: AnalyzeBacklogRequest,
+    ai_service: AIService = Depends(get_ai_service)
+) -> Any:
     """Analyze a backlog item using AI."""
     try:
         item_data = {
@@ -50,7 +53,10 @@ async def analyze_backlog_item(request: AnalyzeBacklogRequest) -> Any:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 @router.post("/suggest-sprint-plan")
-async def suggest_sprint_plan(request: SprintPlanRequest) -> Any:
+async def suggest_sprint_plan(
+    request: SprintPlanRequest,
+    ai_service: AIService = Depends(get_ai_service)
+) -> Any:
     """Generate AI sprint planning suggestions."""
     try:
         suggestion = await ai_service.suggest_sprint_plan(
@@ -72,7 +78,10 @@ async def suggest_sprint_plan(request: SprintPlanRequest) -> Any:
         raise HTTPException(status_code=500, detail=f"Sprint planning failed: {str(e)}")
 
 @router.post("/test-standup-summary")
-async def test_standup_summary(request: StandupSummaryRequest) -> Any:
+async def test_standup_summary(
+    request: StandupSummaryRequest,
+    ai_service: AIService = Depends(get_ai_service)
+) -> Any:
     """Test standup summary generation."""
     try:
         summary = await ai_service.generate_standup_summary(
@@ -93,7 +102,7 @@ async def test_standup_summary(request: StandupSummaryRequest) -> Any:
         raise HTTPException(status_code=500, detail=f"Summary generation failed: {str(e)}")
 
 @router.get("/vector-stats")
-async def get_vector_stats() -> Any:
+async def get_vector_stats(vector_service: VectorService = Depends(get_vector_service)) -> Any:
     """Get vector database statistics."""
     try:
         stats = await vector_service.get_collection_stats()
@@ -102,7 +111,10 @@ async def get_vector_stats() -> Any:
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
 
 @router.post("/health-check")
-async def ai_health_check() -> Any:
+async def ai_health_check(
+    ai_service: AIService = Depends(get_ai_service),
+    vector_service: VectorService = Depends(get_vector_service)
+) -> Any:
     """Check AI services health."""
     return {
         "ai_service": "operational",
@@ -3,10 +3,11 @@ Analytics API endpoints for burndown charts, velocity tracking, and sprint metri
 """
 from typing import List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.services.analytics_service import analytics_service
+from app.services.analytics_service import analytics_service, velocity_trend
 from app.models.sprint import Sprint
 from app.models.team import Team
 
@@ -28,15 +29,16 @@ async def get_burndown_chart(
         if not sprint:
             raise HTTPException(status_code=404, detail="Sprint not found")
         
-        chart_data = await analytics_service.get_burndown_chart_data(sprint_id)
+        chart_data = await analytics_service.get_burndown_chart_data(db, sprint_id)
         
         if "error" in chart_data:
             raise HTTPException(status_code=500, detail=chart_data["error"])
         
-        return {
+        # Already JSON-ready; skip FastAPI's jsonable_encoder pass over the series
+        return ORJSONResponse({
             "success": True,
             "data": chart_data
-        }
+        })
         
     except HTTPException:
         raise
@@ -60,7 +62,7 @@ async def get_velocity_chart(
         if not team:
             raise HTTPException(status_code=404, detail="Team not found")
         
-        chart_data = await analytics_service.get_velocity_chart_data(team_id)
+        chart_data = await analytics_service.get_velocity_chart_data(db, team_id)
         
         if "error" in chart_data:
             raise HTTPException(status_code=500, detail=chart_data["error"])
@@ -91,7 +93,7 @@ async def get_sprint_metrics(
         if not sprint:
             raise HTTPException(status_code=404, detail="Sprint not found")
         
-        metrics = await analytics_service.get_sprint_metrics(sprint_id)
+        metrics = await analytics_service.get_sprint_metrics(db, sprint_id)
         
         if not metrics:
             raise HTTPException(status_code=500, detail="Failed to calculate sprint metrics")
@@ -137,7 +139,7 @@ async def get_sprint_report(
         if not sprint:
             raise HTTPException(status_code=404, detail="Sprint not found")
         
-        report = await analytics_service.generate_sprint_report(sprint_id)
+        report = await analytics_service.generate_sprint_report(db, sprint_id)
         
         if "error" in report:
             raise HTTPException(status_code=500, detail=report["error"])
@@ -169,7 +171,7 @@ async def get_team_velocity_history(
         if not team:
             raise HTTPException(status_code=404, detail="Team not found")
         
-        velocity_history = await analytics_service.get_team_velocity_history(team_id, num_sprints)
+        velocity_history = await analytics_service.get_team_velocity_history(db, team_id, num_sprints)
         
         formatted_history = []
         for v in velocity_history:
@@ -234,7 +236,7 @@ async def get_dashboard_metrics(
         
         if current_sprint:
             # Get current sprint metrics
-            sprint_metrics = await analytics_service.get_sprint_metrics(current_sprint.id)
+            sprint_metrics = await analytics_service.get_sprint_metrics(db, current_sprint.id)
             
             if sprint_metrics:
                 dashboard_data["current_sprint"] = {
@@ -248,20 +250,14 @@ async def get_dashboard_metrics(
                 }
         
         # Get velocity trend
-        velocity_history = await analytics_service.get_team_velocity_history(team_id, 3)
+        velocity_history = await analytics_service.get_team_velocity_history(db, team_id, 3)
         if velocity_history:
             velocities = [v.velocity for v in velocity_history]
             avg_velocity = sum(velocities) / len(velocities)
             
-            # Determine trend
-            if len(velocities) >= 2:
-                trend = "improving" if velocities[0] > velocities[-1] else "declining" if velocities[0] < velocities[-1] else "stable"
-            else:
-                trend = "stable"
-            
             dashboard_data["velocity_trend"] = {
                 "average_velocity": round(avg_velocity, 2),
-                "trend": trend,
+                "trend": velocity_trend(velocities),
                 "last_sprint_velocity": round(velocities[0], 2) if velocities else 0
             }
         
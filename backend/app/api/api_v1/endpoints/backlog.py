@@ -7,8 +7,8 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.core.database import get_db
-from app.services.ai_service import ai_service
-from app.services.vector_service import vector_service
+from app.services.ai_service import get_ai_service
+from app.services.vector_service import get_vector_service
 
 router = APIRouter()
 
@@ -330,7 +330,7 @@ async def apply_ai_suggestions(
 async def _analyze_item_async(title: str, description: str, item_type: str):
     """Analyze a single item in the background."""
     try:
-        analysis = await ai_service.analyze_backlog_item({
+        analysis = await get_ai_service().analyze_backlog_item({
             "title": title,
             "description": description,
             "item_type": item_type
@@ -338,7 +338,7 @@ async def _analyze_item_async(title: str, description: str, item_type: str):
         
         # Store insights in vector database
         insights = f"Backlog analysis: {title} - Clarity: {analysis.clarity_score}, Complexity: {analysis.estimated_complexity}"
-        await vector_service.store_backlog_insights(
+        await get_vector_service().store_backlog_insights(
             insights=insights,
             project_id=1,  # TODO: Get actual project ID
             item_id=999,   # TODO: Get actual item ID
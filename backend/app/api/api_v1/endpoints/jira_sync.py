@@ -3,6 +3,7 @@ Jira synchronization API endpoints for data sync and automation.
 """
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -29,7 +30,7 @@ async def sync_backlog_items(
             raise HTTPException(status_code=400, detail="Invalid project key")
         
         # Check if Jira client is available
-        if not jira_service.client:
+        if not jira_service.is_configured:
             raise HTTPException(
                 status_code=503, 
                 detail="Jira integration not configured. Please check your credentials."
@@ -67,7 +68,7 @@ async def sync_sprint_data(
             raise HTTPException(status_code=400, detail="Invalid project key")
         
         # Check if Jira client is available
-        if not jira_service.client:
+        if not jira_service.is_configured:
             raise HTTPException(
                 status_code=503, 
                 detail="Jira integration not configured. Please check your credentials."
@@ -105,7 +106,7 @@ async def auto_sync_project(
             raise HTTPException(status_code=400, detail="Invalid project key")
         
         # Check if Jira client is available
-        if not jira_service.client:
+        if not jira_service.is_configured:
             raise HTTPException(
                 status_code=503, 
                 detail="Jira integration not configured. Please check your credentials."
@@ -143,7 +144,7 @@ async def sync_project_now(
             raise HTTPException(status_code=400, detail="Invalid project key")
         
         # Check if Jira client is available
-        if not jira_service.client:
+        if not jira_service.is_configured:
             raise HTTPException(
                 status_code=503, 
                 detail="Jira integration not configured. Please check your credentials."
@@ -185,7 +186,7 @@ async def create_jira_ticket(
     """
     try:
         # Check if Jira client is available
-        if not jira_service.client:
+        if not jira_service.is_configured:
             raise HTTPException(
                 status_code=503, 
                 detail="Jira integration not configured. Please check your credentials."
@@ -229,7 +230,7 @@ async def update_ticket_status(
     """
     try:
         # Check if Jira client is available
-        if not jira_service.client:
+        if not jira_service.is_configured:
             raise HTTPException(
                 status_code=503, 
                 detail="Jira integration not configured. Please check your credentials."
@@ -273,7 +274,7 @@ async def get_jira_projects() -> Dict[str, Any]:
     """
     try:
         # Check if Jira client is available
-        if not jira_service.client:
+        if not jira_service.is_configured:
             raise HTTPException(
                 status_code=503, 
                 detail="Jira integration not configured. Please check your credentials."
@@ -300,7 +301,7 @@ async def test_jira_connection() -> Dict[str, Any]:
     Useful for verifying credentials and configuration.
     """
     try:
-        if not jira_service.client:
+        if not jira_service.is_configured:
             return {
                 "success": False,
                 "connected": False,
@@ -352,18 +353,18 @@ async def get_sync_status(
             raise HTTPException(status_code=404, detail=f"Project {project_key} not found")
         
         # Count synced items
-        backlog_count = db.query(BacklogItem).filter(
+        backlog_count = db.query(func.count(BacklogItem.id)).filter(
             BacklogItem.project_id == project.id,
             BacklogItem.jira_key.isnot(None)
-        ).count()
+        ).scalar()
         
-        sprint_count = db.query(Sprint).filter(
+        sprint_count = db.query(func.count(Sprint.id)).filter(
             Sprint.jira_sprint_id.isnot(None)
-        ).count()
+        ).scalar()
         
         # Get recent sync info from vector database
-        from app.services.vector_service import vector_service
-        recent_syncs = await vector_service.get_relevant_context(
+        from app.services.vector_service import get_vector_service
+        recent_syncs = await get_vector_service().get_relevant_context(
             f"sync project {project_key}",
             limit=1,
             document_type="sync_log"
@@ -380,7 +381,7 @@ async def get_sync_status(
                 "sprints_synced": sprint_count,
                 "last_sync_info": last_sync_info
             },
-            "jira_connection": await jira_service.test_connection() if jira_service.client else False
+            "jira_connection": await jira_service.test_connection() if jira_service.is_configured else False
         }
         
     except HTTPException:
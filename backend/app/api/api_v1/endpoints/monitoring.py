@@ -356,7 +356,7 @@ async def get_system_alerts(
             "data": {
                 "alerts": alerts,
                 "total_alerts": len(alerts),
-                "high_severity_count": len([a for a in alerts if a.get("severity") == "high"]),
+                "high_severity_count": sum(1 for a in alerts if a.get("severity") == "high"),
                 "generated_at": datetime.now().isoformat()
             }
         }
@@ -8,7 +8,6 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.core.database import get_db
-from app.services.ai_service import ai_service
 
 router = APIRouter()
 
@@ -2,20 +2,38 @@
 Standup endpoints for daily standup coordination and AI summaries.
 This is the core MVP feature implementing the AI-powered standup workflow.
 """
+import json
+import logging
+import time
 from typing import List, Any, Optional
 from datetime import datetime, date
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
+from cachetools import TTLCache
 
-from app.core.database import get_db
-from app.services.ai_service import ai_service
+from app.core.cache import async_cached
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.services.ai_service import AIService, IncrementalJSONParser, StandupSummary, FALLBACK_STANDUP_SUMMARY, get_ai_service
 from app.services.slack_service import slack_service
 from app.services.jira_service import jira_service
-from app.services.vector_service import vector_service
+from app.services.vector_service import VectorService, get_vector_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Slack history shared by the collect and generate-summary endpoints, so the
+# common "collect, then summarize" flow only hits the Slack API once
+SLACK_COLLECT_BUCKET_SECONDS = 300
+slack_messages_cache: TTLCache = TTLCache(maxsize=128, ttl=SLACK_COLLECT_BUCKET_SECONDS)
+
+# Team configuration rarely changes, so keep it in memory for a short window.
+# Write paths must pop the team_id to invalidate.
+team_context_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
 # Pydantic models for API requests/responses
 class StandupEntryCreate(BaseModel):
     user_id: int
@@ -46,7 +64,7 @@ class GenerateStandupRequest(BaseModel):
 async def get_team_standup_summaries(
     team_id: int,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> List[StandupSummaryResponse]:
     """Get recent standup summaries for a team."""
     # TODO: Implement database query for standup summaries
@@ -70,7 +88,7 @@ async def get_team_standup_summaries(
 async def create_standup_entry(
     team_id: int,
     entry: StandupEntryCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Create a new standup entry for a team member."""
     # TODO: Implement database insertion
@@ -98,7 +116,9 @@ async def generate_standup_summary(
     team_id: int,
     request: GenerateStandupRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    ai_service: AIService = Depends(get_ai_service),
+    vector_service: VectorService = Depends(get_vector_service)
 ) -> Any:
     """
     Generate AI-powered standup summary for a team.
@@ -122,12 +142,29 @@ async def generate_standup_summary(
         # 3. Get team context
         team_context = await _get_team_context(team_id)
         
-        # 4. Generate AI summary
-        ai_summary = await ai_service.generate_standup_summary(
-            standup_entries=standup_entries,
-            team_context=team_context,
-            jira_updates=jira_updates
+        # 4. Reuse a cached summary for near-identical input, otherwise generate one
+        canonical_input = _canonicalize_standup_input(team_id, standup_entries, jira_updates)
+        cached_summary = await vector_service.get_cached_standup_summary(
+            canonical_input,
+            team_id,
+            threshold=settings.STANDUP_CACHE_SIMILARITY_THRESHOLD
         )
+        cache_hit = cached_summary is not None
+        
+        if cache_hit:
+            ai_summary = StandupSummary.model_validate_json(cached_summary)
+        else:
+            ai_summary = await ai_service.generate_standup_summary(
+                standup_entries=standup_entries,
+                team_context=team_context,
+                jira_updates=jira_updates
+            )
+            if ai_summary.summary != FALLBACK_STANDUP_SUMMARY:
+                await vector_service.cache_standup_summary(
+                    canonical_input,
+                    ai_summary.model_dump_json(),
+                    team_id
+                )
         
         # 5. Store summary in database
         summary_id = await _store_summary(team_id, ai_summary, len(standup_entries))
@@ -142,11 +179,12 @@ async def generate_standup_summary(
             )
         
         # 7. Store context in vector database for future reference
-        background_tasks.add_task(
-            _store_summary_context,
-            team_id,
-            ai_summary
-        )
+        if not cache_hit:
+            background_tasks.add_task(
+                _store_summary_context,
+                team_id,
+                ai_summary
+            )
         
         return {
             "message": "Standup summary generated successfully",
@@ -156,7 +194,8 @@ async def generate_standup_summary(
             "blockers": ai_summary.blockers,
             "action_items": ai_summary.action_items,
             "team_sentiment": ai_summary.team_sentiment,
-            "posted_to_slack": bool(request.slack_channel_id)
+            "posted_to_slack": bool(request.slack_channel_id),
+            "cache_hit": cache_hit
         }
         
     except Exception as e:
@@ -165,6 +204,87 @@ async def generate_standup_summary(
             detail=f"Failed to generate standup summary: {str(e)}"
         )
 
+@router.post("/teams/{team_id}/generate-summary/stream")
+async def stream_standup_summary(
+    team_id: int,
+    request: GenerateStandupRequest,
+    background_tasks: BackgroundTasks,
+    ai_service: AIService = Depends(get_ai_service)
+) -> StreamingResponse:
+    """
+    Stream an AI-powered standup summary as server-sent events.
+    
+    Emits `token` events while the model is generating, plus a `partial`
+    event with the fields parsed so far whenever they change, then a single
+    `summary` event with the stored summary ID and structured fields.
+    """
+    standup_entries = await _collect_standup_data(team_id, request.slack_channel_id)
+    
+    if not standup_entries:
+        raise HTTPException(
+            status_code=404,
+            detail="No standup entries found for today"
+        )
+    
+    jira_updates = None
+    if request.include_jira_updates:
+        jira_updates = await _get_jira_updates(team_id)
+    
+    team_context = await _get_team_context(team_id)
+    
+    # Filled in by the stream so the post-response tasks can see the result
+    result = {}
+    
+    async def event_stream():
+        # Parsed as tokens arrive, so the summary is ready when the stream ends
+        json_stream = IncrementalJSONParser(eager=True)
+        async for token, partial in ai_service.stream_standup_summary_partials(
+            standup_entries=standup_entries,
+            team_context=team_context,
+            jira_updates=jira_updates,
+            json_stream=json_stream
+        ):
+            yield _sse_event("token", {"token": token})
+            if partial is not None:
+                yield _sse_event("partial", partial.model_dump(exclude_none=True))
+        
+        ai_summary = ai_service.standup_summary_from_stream(json_stream)
+        summary_id = await _store_summary(team_id, ai_summary, len(standup_entries))
+        result["summary"] = ai_summary
+        result["summary_id"] = summary_id
+        
+        yield _sse_event("summary", {
+            "summary_id": summary_id,
+            "summary": ai_summary.summary,
+            "key_achievements": ai_summary.key_achievements,
+            "blockers": ai_summary.blockers,
+            "action_items": ai_summary.action_items,
+            "team_sentiment": ai_summary.team_sentiment,
+            "posted_to_slack": bool(request.slack_channel_id)
+        })
+    
+    async def finalize():
+        ai_summary = result.get("summary")
+        if ai_summary is None:
+            return
+        if request.slack_channel_id:
+            await _post_summary_to_slack(
+                request.slack_channel_id,
+                ai_summary.summary,
+                result["summary_id"]
+            )
+        await _store_summary_context(team_id, ai_summary)
+    
+    # Runs once the stream has been fully sent
+    background_tasks.add_task(finalize)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # An explicit encoding keeps GZipMiddleware from buffering the token stream
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity"}
+    )
+
 @router.post("/slack/collect/{team_id}")
 async def collect_slack_standup_messages(
     team_id: int,
@@ -176,11 +296,11 @@ async def collect_slack_standup_messages(
     """
     try:
         # Collect messages from Slack
-        messages = await slack_service.collect_standup_messages(
-            channel_id=channel_id,
-            since_hours=hours_back,
-            keywords=["yesterday", "today", "blockers", "standup"]
-        )
+        keywords = ("yesterday", "today", "blockers", "standup")
+        messages = [
+            message for message in await _collect_slack_messages(channel_id, hours_back)
+            if any(keyword in message["message"].lower() for keyword in keywords)
+        ]
         
         # Parse messages into standup entries
         entries = []
@@ -242,6 +362,10 @@ async def send_standup_reminder(
         )
 
 # Helper functions
+def _sse_event(event: str, data: dict) -> str:
+    """Format a server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 async def _collect_standup_data(team_id: int, slack_channel_id: Optional[str] = None) -> List[dict]:
     """Collect standup data from database and/or Slack."""
     entries = []
@@ -249,10 +373,7 @@ async def _collect_standup_data(team_id: int, slack_channel_id: Optional[str] =
     # Try to get from Slack first if channel provided
     if slack_channel_id:
         try:
-            slack_messages = await slack_service.collect_standup_messages(
-                channel_id=slack_channel_id,
-                since_hours=24
-            )
+            slack_messages = await _collect_slack_messages(slack_channel_id, 24)
             
             for message in slack_messages:
                 parsed = await slack_service.parse_standup_from_message(message["message"])
@@ -264,7 +385,7 @@ async def _collect_standup_data(team_id: int, slack_channel_id: Optional[str] =
                     "source": "slack"
                 })
         except Exception as e:
-            print(f"Failed to collect from Slack: {e}")
+            logger.warning("Failed to collect from Slack: %s", e)
     
     # TODO: Also collect from database entries
     # db_entries = get_todays_standup_entries(team_id)
@@ -291,6 +412,40 @@ async def _collect_standup_data(team_id: int, slack_channel_id: Optional[str] =
     
     return entries
 
+def _canonicalize_standup_input(
+    team_id: int,
+    entries: List[dict],
+    jira_updates: Optional[List[dict]] = None
+) -> str:
+    """Build a stable text representation of a standup for semantic cache lookups."""
+    lines = [f"team:{team_id}", f"date:{date.today().isoformat()}"]
+    
+    for entry in sorted(entries, key=lambda e: e.get("user", "")):
+        lines.append("|".join([
+            entry.get("user", ""),
+            entry.get("yesterday_work") or "",
+            entry.get("today_plan") or "",
+            entry.get("blockers") or ""
+        ]))
+    
+    for update in sorted(jira_updates or [], key=lambda u: u.get("key") or ""):
+        lines.append(f"{update.get('key')}:{update.get('status')}")
+    
+    return "\n".join(lines)
+
+async def _collect_slack_messages(channel_id: str, since_hours: int) -> List[dict]:
+    """Collect unfiltered Slack messages, memoized per 5-minute window."""
+    bucket = int(time.time()) // SLACK_COLLECT_BUCKET_SECONDS
+    return await _cached_collect(channel_id, since_hours, bucket)
+
+@async_cached(slack_messages_cache)
+async def _cached_collect(channel_id: str, since_hours: int, bucket: int) -> List[dict]:
+    """Fetch channel history from Slack; `bucket` only varies the cache key."""
+    return await slack_service.collect_standup_messages(
+        channel_id=channel_id,
+        since_hours=since_hours
+    )
+
 async def _get_jira_updates(team_id: int) -> List[dict]:
     """Get recent Jira updates for the team."""
     try:
@@ -304,9 +459,10 @@ async def _get_jira_updates(team_id: int) -> List[dict]:
         
         return updates
     except Exception as e:
-        print(f"Failed to get Jira updates: {e}")
+        logger.warning("Failed to get Jira updates: %s", e)
         return []
 
+@async_cached(team_context_cache, key=lambda team_id: team_id)
 async def _get_team_context(team_id: int) -> dict:
     """Get team configuration and context."""
     # TODO: Get from database
@@ -331,9 +487,9 @@ async def _post_summary_to_slack(channel_id: str, summary: str, summary_id: int)
             channel_id=channel_id,
             summary=summary
         )
-        print(f"Posted summary {summary_id} to Slack channel {channel_id}")
+        logger.info("Posted summary %s to Slack channel %s", summary_id, channel_id)
     except Exception as e:
-        print(f"Failed to post to Slack: {e}")
+        logger.warning("Failed to post to Slack: %s", e)
 
 async def _store_summary_context(team_id: int, ai_summary):
     """Store summary context in vector database."""
@@ -342,11 +498,11 @@ async def _store_summary_context(team_id: int, ai_summary):
         if ai_summary.blockers:
             context_text += f" Blockers: {', '.join([b.get('description', '') for b in ai_summary.blockers])}"
         
-        await vector_service.store_standup_summary(
+        await get_vector_service().store_standup_summary(
             summary=context_text,
             team_id=team_id,
             date=datetime.now()
         )
-        print(f"Stored context for team {team_id}")
+        logger.info("Stored context for team %s", team_id)
     except Exception as e:
-        print(f"Failed to store context: {e}")
\ No newline at end of file
+        logger.warning("Failed to store context: %s", e)
\ No newline at end of file
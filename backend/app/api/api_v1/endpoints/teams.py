@@ -1,12 +1,13 @@
 """
 Team management endpoints.
 """
-from typing import List, Any
+from typing import List, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.core.database import get_db
+from app.api.api_v1.endpoints.standup import team_context_cache
 
 router = APIRouter()
 
@@ -19,6 +20,13 @@ class TeamResponse(BaseModel):
     slack_channel_name: str
     standup_time: str
 
+class TeamUpdate(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    slack_channel_name: Optional[str] = None
+    standup_time: Optional[str] = None
+    ai_tone: Optional[str] = None
+
 @router.get("/")
 async def get_teams(db: Session = Depends(get_db)) -> List[TeamResponse]:
     """Get all teams."""
@@ -47,4 +55,22 @@ async def get_team(team_id: int, db: Session = Depends(get_db)) -> TeamResponse:
         is_active=True,
         slack_channel_name="#dev-standup",
         standup_time="09:00"
-    )
\ No newline at end of file
+    )
+
+@router.put("/{team_id}")
+async def update_team(team_id: int, team: TeamUpdate, db: Session = Depends(get_db)) -> TeamResponse:
+    """Update team configuration."""
+    # TODO: Implement database update
+    
+    # Drop the cached standup context so the next summary sees the new config
+    team_context_cache.pop(team_id, None)
+    
+    return TeamResponse(
+        id=team_id,
+        name=team.name or "Development Team",
+        description=team.description or "Main development team working on core features",
+        team_size=5,
+        is_active=True,
+        slack_channel_name=team.slack_channel_name or "#dev-standup",
+        standup_time=team.standup_time or "09:00"
+    )
@@ -0,0 +1,226 @@
+"""
+In-process caching helpers for async service and endpoint functions.
+"""
+import asyncio
+import functools
+import hashlib
+import sqlite3
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, MutableMapping, Optional, Sequence
+
+import numpy as np
+
+
+def async_cached(
+    cache: MutableMapping,
+    key: Optional[Callable[..., Any]] = None
+) -> Callable:
+    """
+    Cache the result of an async function in the given mapping.
+
+    Args:
+        cache: Mapping used as the backing store (e.g. cachetools.TTLCache)
+        key: Builds the cache key from the call arguments; defaults to the
+            positional and keyword arguments themselves
+
+    Concurrent misses for the same key are serialized behind a per-key
+    asyncio.Lock so only one caller does the underlying work, while misses
+    for other keys proceed in parallel. A None result (the services'
+    "not found / failed, see log" value) is returned but not stored, so a
+    transient failure isn't served from the cache until the entry expires.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        # asyncio locks belong to one event loop, and some callers (AnalyticsTool)
+        # run under asyncio.run() in worker threads, so locks are kept per loop.
+        # Weak values drop a key's lock once no caller is using it.
+        loop_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, weakref.WeakValueDictionary]" = (
+            weakref.WeakKeyDictionary()
+        )
+        registry_lock = threading.Lock()
+
+        def lock_for(cache_key: Any) -> asyncio.Lock:
+            loop = asyncio.get_running_loop()
+            with registry_lock:
+                locks = loop_locks.get(loop)
+                if locks is None:
+                    locks = loop_locks[loop] = weakref.WeakValueDictionary()
+                lock = locks.get(cache_key)
+                if lock is None:
+                    lock = locks[cache_key] = asyncio.Lock()
+                return lock
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            try:
+                return cache[cache_key]
+            except KeyError:
+                pass
+
+            async with lock_for(cache_key):
+                # Another caller may have filled the entry while we waited
+                try:
+                    return cache[cache_key]
+                except KeyError:
+                    pass
+                value = await func(*args, **kwargs)
+                if value is not None:
+                    cache[cache_key] = value
+                return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+class SemanticCache:
+    """
+    Bounded LRU cache keyed by embedding vectors instead of exact keys.
+
+    A lookup returns the value stored for the most similar vector when its
+    cosine similarity is at least ``threshold``.
+
+    With ``merge_threshold`` set, each row is a cluster centroid: an insert
+    within that similarity of an existing centroid folds into it (running
+    mean, latest value wins) instead of taking a new row, so near-duplicate
+    prompts share one entry and lookups scan clusters rather than prompts.
+    ``merge_threshold`` may not be below ``threshold``: a merged neighbour
+    would overwrite the value a distinct, non-matching entry is looked up by.
+    """
+
+    def __init__(self, maxsize: int = 256, threshold: float = 0.92, merge_threshold: Optional[float] = None):
+        if merge_threshold is not None and merge_threshold < threshold:
+            raise ValueError(
+                f"merge_threshold ({merge_threshold}) must not be below threshold ({threshold})"
+            )
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.merge_threshold = merge_threshold
+        self._vectors: Optional[np.ndarray] = None  # (maxsize, dim) unit vectors
+        self._values: List[Any] = []
+        self._counts = np.zeros(maxsize, dtype=np.int64)  # Embeddings merged into each row
+        self._last_used = np.zeros(maxsize, dtype=np.int64)
+        self._clock = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, embedding: Sequence[float]) -> Optional[Any]:
+        """Return the cached value for the nearest vector, or None below the threshold."""
+        if not self._values:
+            return None
+        query = self._normalize(embedding)
+        size = len(self._values)
+        # Rows are unit vectors, so a single BLAS matrix-vector product gives all cosines
+        similarities = self._vectors[:size] @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        self._touch(best)
+        return self._values[best]
+
+    def put(self, embedding: Sequence[float], value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        vector = self._normalize(embedding)
+        if self._vectors is None:
+            self._vectors = np.zeros((self.maxsize, vector.shape[0]), dtype=np.float32)
+        if self.merge_threshold is not None and self._values:
+            similarities = self._vectors[:len(self._values)] @ vector
+            nearest = int(np.argmax(similarities))
+            if similarities[nearest] >= self.merge_threshold:
+                self._merge(nearest, vector, value)
+                return
+        if len(self._values) < self.maxsize:
+            slot = len(self._values)
+            self._values.append(value)
+        else:
+            slot = int(np.argmin(self._last_used))
+            self._values[slot] = value
+        self._vectors[slot] = vector
+        self._counts[slot] = 1
+        self._touch(slot)
+
+    def _merge(self, slot: int, vector: np.ndarray, value: Any) -> None:
+        """Fold a vector into the centroid at ``slot`` and store the newer value."""
+        self._counts[slot] += 1
+        centroid = self._vectors[slot] + (vector - self._vectors[slot]) / self._counts[slot]
+        self._vectors[slot] = self._normalize(centroid)
+        self._values[slot] = value
+        self._touch(slot)
+
+    def _touch(self, slot: int) -> None:
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class EmbeddingCache:
+    """
+    Persistent text -> embedding cache backed by SQLite.
+
+    Rows are keyed by the SHA-256 of the model name and text, and vectors are
+    stored as float16 bytes; the rounding is far below what nearest-neighbour
+    ranking can notice. Entries older than ``ttl_seconds`` are ignored and the
+    least recently used rows are evicted beyond ``maxsize``.
+    """
+
+    def __init__(self, path: str, model: str, maxsize: int = 10_000, ttl_seconds: float = 30 * 86400):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.model = model
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # Used from worker threads; the lock serializes access to the single connection
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "sha256 BLOB PRIMARY KEY, model TEXT NOT NULL, vec BLOB NOT NULL, "
+                "created_at REAL NOT NULL, last_used REAL NOT NULL) WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_embeddings_last_used ON embeddings (last_used)"
+            )
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for text, or None if missing or expired."""
+        key = self._key(text)
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT vec FROM embeddings WHERE sha256 = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE embeddings SET last_used = ? WHERE sha256 = ?", (now, key))
+        return np.frombuffer(row[0], dtype=np.float16).astype(np.float32)
+
+    def put(self, text: str, embedding: Sequence[float]) -> None:
+        """Store an embedding, evicting the least recently used rows when full."""
+        vector = np.asarray(embedding, dtype=np.float16).tobytes()
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (sha256, model, vec, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self._key(text), self.model, vector, now, now)
+            )
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE sha256 IN ("
+                "SELECT sha256 FROM embeddings ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,)
+            )
+
+    def _key(self, text: str) -> bytes:
+        # The storage dtype is part of the key so rows written as float32 are never misread
+        return hashlib.sha256(f"{self.model}:f16:{text}".encode()).digest()
@@ -1,23 +1,27 @@
 """
 Application configuration management.
 """
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
-from pydantic import AnyHttpUrl, validator
-from pydantic_settings import BaseSettings
+from pydantic import AnyHttpUrl, Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
 from pathlib import Path
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+    
     # API Configuration
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "AI Scrum Master"
     VERSION: str = "1.0.0"
     
     # Security
-    SECRET_KEY: str = "your-secret-key-change-in-production"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    SECRET_KEY: str = Field(default="your-secret-key-change-in-production", frozen=True)
+    ALGORITHM: str = "HS256"
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = [
@@ -26,7 +30,8 @@ class Settings(BaseSettings):
         "http://localhost:5173",  # Vite dev server
     ]
 
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
         if isinstance(v, str):
             return [i.strip() for i in v.split(",")]
@@ -36,41 +41,74 @@ class Settings(BaseSettings):
 
     # Database (using SQLite for development)
     DATABASE_URL: str = "sqlite:///./scrum_db.sqlite"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is recycled
+    DB_POOL_PRE_PING: bool = False  # Enable when not running behind pgbouncer
+    SQLALCHEMY_RAISELOAD: bool = False  # Raise on lazy loads that emit SQL, to surface N+1s
+    SQL_QUERY_WARN_THRESHOLD: int = 50  # Warn when one analytics request issues more statements; 0 disables
     
     # Redis for caching and task queue
     REDIS_URL: str = "redis://localhost:6379"
     
     # OpenAI Configuration
-    OPENAI_API_KEY: str = ""
+    OPENAI_API_KEY: str = Field(default="", frozen=True)
     OPENAI_MODEL: str = "gpt-4"
     OPENAI_MAX_TOKENS: int = 2000
+    OPENAI_CONTEXT_WINDOW: int = 8192  # Prompt + completion limit of OPENAI_MODEL
     OPENAI_TEMPERATURE: float = 0.7
+    OPENAI_MAX_CONCURRENCY: int = 4  # Concurrent chat completions per process, to stay under rate limits
+    OPENAI_REQUESTS_PER_MINUTE: int = 500  # Account quota; calls are paced client-side to avoid 429s
+    OPENAI_TOKENS_PER_MINUTE: int = 40000
+    OPENAI_REQUEST_TIMEOUT: float = 30.0
+    OPENAI_HTTP_MAX_CONNECTIONS: int = 100
+    OPENAI_HTTP_MAX_KEEPALIVE: int = 50
     
     # Slack Integration
-    SLACK_BOT_TOKEN: str = ""
-    SLACK_SIGNING_SECRET: str = ""
-    SLACK_APP_TOKEN: str = ""
+    SLACK_BOT_TOKEN: str = Field(default="", frozen=True)
+    SLACK_SIGNING_SECRET: str = Field(default="", frozen=True)
+    SLACK_APP_TOKEN: str = Field(default="", frozen=True)
     SLACK_WEBHOOK_URL: str = ""
     
     # Jira Integration
     JIRA_URL: str = ""
     JIRA_USERNAME: str = ""
-    JIRA_API_TOKEN: str = ""
+    JIRA_API_TOKEN: str = Field(default="", frozen=True)
     JIRA_PROJECT_KEY: str = ""
+    JIRA_REQUEST_TIMEOUT: float = 30.0
+    JIRA_HTTP_MAX_CONNECTIONS: int = 20
+    JIRA_MAX_CONCURRENCY: int = 5  # Parallel requests per fan-out (e.g. per-sprint velocity fetches)
+    JIRA_MAX_RETRIES: int = 3  # Retries for connection errors, rate limiting (429) and 502/503/504
     
     # GitHub Integration
-    GITHUB_TOKEN: str = ""
+    GITHUB_TOKEN: str = Field(default="", frozen=True)
     GITHUB_OWNER: str = ""
     GITHUB_REPO: str = ""
     
     # Vector Database (ChromaDB)
     VECTOR_DB_PATH: str = "./data/chromadb"
     VECTOR_COLLECTION_NAME: str = "scrum_knowledge"
+    VECTOR_STANDUP_CACHE_COLLECTION_NAME: str = "standup_summary_cache"  # Kept apart so cached summaries never surface as knowledge
+    VECTOR_BATCH_WINDOW_MS: int = 5  # Concurrent context lookups within this window share one query
+    # HNSW index parameters; only applied when the collection is first created
+    VECTOR_HNSW_M: int = 16
+    VECTOR_HNSW_CONSTRUCTION_EF: int = 100
+    VECTOR_HNSW_SEARCH_EF: int = 16  # Context lookups ask for at most a handful of neighbours
+    EMBEDDING_CACHE_PATH: str = "./data/embedding_cache.db"  # SQLite store for query embeddings
+    EMBEDDING_CACHE_SIZE: int = 10000  # Max cached embeddings (LRU)
+    EMBEDDING_CACHE_TTL_DAYS: int = 30
     
     # AI Configuration
     AI_CONTEXT_WINDOW: int = 4000
     AI_MAX_RETRIES: int = 3
     AI_TEMPERATURE: float = 0.3  # Lower for more consistent outputs
+    STANDUP_CACHE_SIMILARITY_THRESHOLD: float = 0.92  # Reuse summaries above this cosine similarity
+    LLM_SEMANTIC_CACHE_THRESHOLD: float = 0.92  # Reuse LLM results for prompts above this cosine similarity
+    LLM_SEMANTIC_CACHE_SIZE: int = 256  # Entries kept per analysis type (LRU)
+    LLM_SEMANTIC_CACHE_MERGE_THRESHOLD: float = 0.97  # Near-duplicate prompts above this share one cache cluster; must be >= LLM_SEMANTIC_CACHE_THRESHOLD
+    BACKLOG_BULK_BATCH_SIZE: int = 10  # Max backlog items analyzed per LLM call
+    AGENT_LLM_CACHE_PATH: str = "./data/agent_llm_cache.db"  # SQLite store for exact-match agent LLM calls; empty disables
+    AGENT_RESPONSE_CACHE_TTL_SECONDS: int = 60  # Reuse read-only agent answers about a sprint this long, like its metrics; 0 disables
     
     # Workflow Configuration
     STANDUP_TIME: str = "09:00"  # Daily standup time (24h format)
@@ -84,18 +122,12 @@ class Settings(BaseSettings):
     ENABLE_AUTO_STANDUP: bool = True
     ENABLE_BACKLOG_GROOMING: bool = True
     
+    # Analytics
+    BURNDOWN_SNAPSHOT_INTERVAL_MINUTES: int = 60  # How often today's burndown snapshot is refreshed; 0 disables
+    
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
-    
-    # Security
-    SECRET_KEY: str = "your-secret-key-change-in-production"
-    ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -129,6 +161,8 @@ class DevelopmentSettings(Settings):
     """Development environment settings."""
     LOG_LEVEL: str = "DEBUG"
     AI_TEMPERATURE: float = 0.5
+    SQLALCHEMY_RAISELOAD: bool = True
+    SQL_QUERY_WARN_THRESHOLD: int = 10
 
 class ProductionSettings(Settings):
     """Production environment settings."""
@@ -136,6 +170,7 @@ class ProductionSettings(Settings):
     AI_TEMPERATURE: float = 0.2
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 1 day in production
 
+@lru_cache
 def get_settings() -> Settings:
     """Get settings based on environment."""
     env = os.getenv("ENVIRONMENT", "development").lower()
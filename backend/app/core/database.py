@@ -1,30 +1,107 @@
 """
 Database configuration and session management.
 """
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 import logging
-from typing import Generator
+from typing import AsyncGenerator, Generator, Iterator, List, Optional
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 # SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    poolclass=StaticPool if "sqlite" in settings.DATABASE_URL else None,
-    pool_pre_ping=True,
-)
+if settings.DATABASE_URL.startswith("sqlite"):
+    # SQLite ignores pool sizing; share one connection across FastAPI's threadpool
+    engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+else:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        # Pre-ping costs a round-trip per checkout; unnecessary behind pgbouncer
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Base class for models
-Base = declarative_base()
+
+def _async_database_url(database_url: str) -> URL:
+    """Swap the configured driver for its asyncio counterpart."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    if url.get_backend_name() == "postgresql":
+        return url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+# Async engine for request handlers, so queries don't block the event loop
+if settings.DATABASE_URL.startswith("sqlite"):
+    async_engine = create_async_engine(_async_database_url(settings.DATABASE_URL))
+else:
+    async_engine = create_async_engine(
+        _async_database_url(settings.DATABASE_URL),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+# Lazy loads can't run under AsyncSession, so the raiseload guard below isn't needed here
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+if settings.SQLALCHEMY_RAISELOAD:
+    @event.listens_for(SessionLocal, "do_orm_execute")
+    def _raise_on_lazy_load(orm_execute_state):
+        """Fail loudly when a lazy="select" relationship emits SQL instead of using a loader option."""
+        state = orm_execute_state.lazy_loaded_from
+        if state is None or not orm_execute_state.is_relationship_load:
+            return
+        # Expired eager collections also reload through the lazy loader after a
+        # commit; only relationships configured as lazy are the N+1s to catch
+        relationship = orm_execute_state.loader_strategy_path[-1]
+        if relationship.lazy == "select":
+            raise InvalidRequestError(
+                f"Lazy load of {relationship} emitted SQL on {state.class_.__name__}; "
+                f"add selectinload()/joinedload() to the originating query"
+            )
+
+# Statements issued by the current request, when it is being tracked. The list
+# is shared by reference, so worker threads started with a copied context
+# (asyncio.to_thread, FastAPI's threadpool) still record into it.
+_tracked_statements: ContextVar[Optional[List[str]]] = ContextVar("tracked_statements", default=None)
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    statements = _tracked_statements.get()
+    if statements is not None:
+        statements.append(statement)
+
+@contextmanager
+def track_queries() -> Iterator[List[str]]:
+    """Collect the SQL statements executed, on any engine, within this context."""
+    statements: List[str] = []
+    token = _tracked_statements.set(statements)
+    try:
+        yield statements
+    finally:
+        _tracked_statements.reset(token)
+
+class Base(DeclarativeBase):
+    """Base class for models."""
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -37,6 +114,14 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async database session dependency.
+    Use this in async path operations instead of get_db.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
 def init_db() -> None:
     """
     Initialize database.
@@ -0,0 +1,94 @@
+"""
+Client-side rate limiting for calls to external APIs with published quotas.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    Continuously refilling budget of ``capacity`` units per minute.
+
+    Not thread-safe; callers on one event loop serialize access themselves.
+    """
+
+    def __init__(self, capacity_per_minute: float):
+        self.capacity = capacity_per_minute
+        self.rate = capacity_per_minute / 60.0  # units per second
+        self._available = capacity_per_minute
+        self._updated = time.monotonic()
+
+    def delay_for(self, amount: float) -> float:
+        """Seconds until ``amount`` units are available (0 if they already are)."""
+        now = time.monotonic()
+        self._available = min(self.capacity, self._available + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._available >= amount:
+            return 0.0
+        return (amount - self._available) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self._available -= amount
+
+
+class LLMQueue:
+    """
+    Admits LLM calls at a steady rate under requests- and tokens-per-minute quotas.
+
+    Callers are admitted in FIFO order once both budgets cover the request, so
+    bursts are smoothed out client-side instead of bouncing off 429 responses
+    and exponential backoff. Admitted calls are also capped at
+    ``max_concurrency`` in flight.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_concurrency: int):
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._admission = asyncio.Lock()  # FIFO, so large requests aren't starved by small ones
+        self._in_flight = asyncio.Semaphore(max_concurrency)
+
+    async def acquire(self, est_tokens: int) -> None:
+        """Wait until one request and ``est_tokens`` tokens fit in the budget, then spend them."""
+        # A single request larger than the whole budget would otherwise wait forever
+        est_tokens = min(est_tokens, self._tokens.capacity)
+        async with self._admission:
+            while True:
+                delay = max(self._requests.delay_for(1), self._tokens.delay_for(est_tokens))
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            self._requests.consume(1)
+            self._tokens.consume(est_tokens)
+
+    @asynccontextmanager
+    async def slot(self, est_tokens: int) -> AsyncIterator[None]:
+        """
+        Admit a call and hold one of the ``max_concurrency`` slots for the block.
+
+        Use this instead of ``submit`` for calls that outlive a single await,
+        such as streamed responses consumed chunk by chunk.
+
+        Args:
+            est_tokens: Estimated prompt plus completion tokens for the call
+        """
+        await self.acquire(est_tokens)
+        async with self._in_flight:
+            yield
+
+    async def submit(self, coro_factory: Callable[[], Awaitable[T]], est_tokens: int) -> T:
+        """
+        Run ``coro_factory()`` once it is admitted.
+
+        Args:
+            coro_factory: Zero-argument callable creating the call's coroutine
+            est_tokens: Estimated prompt plus completion tokens for the call
+
+        Returns:
+            Result of the awaited coroutine
+        """
+        async with self.slot(est_tokens):
+            return await coro_factory()
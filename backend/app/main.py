@@ -1,21 +1,45 @@
-from fastapi import FastAPI
+from collections import Counter
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
+import logging
+import os
+import sys
+import anyio
+import asyncio
+import orjson
 import uvicorn
 
 from app.core.config import settings
 from app.api.api_v1.api import api_router
-from app.core.database import init_db
+from app.core.database import init_db, track_queries
+from app.services.ai_service import get_ai_service
+from app.services.analytics_service import analytics_service
+from app.services.jira_service import jira_service
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("Starting up AI Scrum Master application...")
-    init_db()
+    # create_all does blocking DB I/O; keep the event loop free while it runs
+    await anyio.to_thread.run_sync(init_db)
+    snapshot_task = None
+    if settings.BURNDOWN_SNAPSHOT_INTERVAL_MINUTES > 0:
+        snapshot_task = asyncio.create_task(
+            analytics_service.run_snapshot_loop(settings.BURNDOWN_SNAPSHOT_INTERVAL_MINUTES * 60)
+        )
     yield
     # Shutdown
     print("Shutting down AI Scrum Master application...")
+    if snapshot_task:
+        snapshot_task.cancel()
+    await get_ai_service().aclose()
+    await jira_service.aclose()
 
 
 app = FastAPI(
@@ -23,40 +47,79 @@ app = FastAPI(
     description="A comprehensive AI-powered Scrum Master assistant",
     version="1.0.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+CORS_ORIGINS = tuple(str(origin).rstrip("/") for origin in settings.BACKEND_CORS_ORIGINS)
+CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+CORS_HEADERS = ("Authorization", "Content-Type", "If-None-Match")
+
 # Set all CORS enabled origins
-if settings.BACKEND_CORS_ORIGINS:
+if CORS_ORIGINS:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+        allow_origins=CORS_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=CORS_METHODS,
+        allow_headers=CORS_HEADERS,
     )
 
+# Burndown and summary payloads grow with sprint length; small bodies aren't worth compressing
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Analytics aggregates are where per-sprint N+1 queries tend to creep back in
+if settings.SQL_QUERY_WARN_THRESHOLD > 0:
+    _ANALYTICS_PREFIX = f"{settings.API_V1_STR}/analytics"
+
+    @app.middleware("http")
+    async def warn_on_query_hotspots(request: Request, call_next):
+        if not request.url.path.startswith(_ANALYTICS_PREFIX):
+            return await call_next(request)
+        with track_queries() as statements:
+            response = await call_next(request)
+        if len(statements) > settings.SQL_QUERY_WARN_THRESHOLD:
+            repeated = [
+                f"{count}x {statement[:120]}"
+                for statement, count in Counter(statements).most_common(3)
+            ]
+            logger.warning(
+                f"{request.method} {request.url.path} issued {len(statements)} SQL statements "
+                f"(threshold {settings.SQL_QUERY_WARN_THRESHOLD}); most frequent: {repeated}"
+            )
+        return response
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
-@app.get("/")
+# Static bodies for the probe endpoints, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "AI Scrum Master API",
+    "version": "1.0.0",
+    "docs": f"{settings.API_V1_STR}/docs"
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "ai-scrum-master"})
+
+
+@app.get("/", response_class=Response)
 async def root():
-    return {
-        "message": "AI Scrum Master API",
-        "version": "1.0.0",
-        "docs": f"{settings.API_V1_STR}/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health")
+@app.get("/health", response_class=Response)
 async def health_check():
-    return {"status": "healthy", "service": "ai-scrum-master"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
+    is_production = os.getenv("ENVIRONMENT", "development").lower() == "production"
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=not is_production,
+        # uvloop isn't available on Windows; fall back to the stock asyncio loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
     ) 
\ No newline at end of file
@@ -5,16 +5,33 @@ Database models for the AI Scrum Master application.
 from .user import User
 from .team import Team
 from .project import Project
-from .sprint import Sprint
+from .sprint import Sprint, SprintDailySnapshot
 from .standup import StandupEntry, StandupSummary
 from .backlog_item import BacklogItem
+from .enums import (
+    BacklogStatus,
+    BacklogPriority,
+    BacklogItemType,
+    EffortEstimate,
+    SprintStatus,
+    ProjectStatus,
+    EstimationScale,
+)
 
 __all__ = [
     "User",
     "Team", 
     "Project",
     "Sprint",
+    "SprintDailySnapshot",
     "StandupEntry",
     "StandupSummary",
     "BacklogItem",
+    "BacklogStatus",
+    "BacklogPriority",
+    "BacklogItemType",
+    "EffortEstimate",
+    "SprintStatus",
+    "ProjectStatus",
+    "EstimationScale",
 ]
\ No newline at end of file
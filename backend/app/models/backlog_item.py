@@ -1,77 +1,130 @@
 """
 Backlog item model for user stories, bugs, and tasks.
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Float
+from sqlalchemy import Integer, String, DateTime, Text, ForeignKey, Boolean, Float, Index, Computed, and_, case, or_, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from datetime import datetime
-from typing import Dict, Any, Optional
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+import orjson
 
 from app.core.database import Base
+from app.models.enums import (
+    DONE_STATUSES, BacklogItemType, BacklogPriority, BacklogStatus, EffortEstimate, sql_enum
+)
+from app.models.types import JSONList
+
+if TYPE_CHECKING:
+    from app.models.project import Project
+    from app.models.sprint import Sprint
+    from app.models.user import User
+
+# Story points assumed for each t-shirt size when no explicit points are set
+EFFORT_POINTS = {
+    EffortEstimate.XS: 1,
+    EffortEstimate.S: 2,
+    EffortEstimate.M: 3,
+    EffortEstimate.L: 5,
+    EffortEstimate.XL: 8,
+    EffortEstimate.XXL: 13,
+}
+DEFAULT_EFFORT_POINTS = 3
 
 class BacklogItem(Base):
     """Backlog item model for user stories, bugs, and tasks."""
     
     __tablename__ = "backlog_items"
+    __table_args__ = (
+        # Serves the per-project story point sums and product backlog lookups;
+        # story_points is included so Postgres can answer the sums index-only
+        Index(
+            "ix_backlog_project_status_sprint",
+            "project_id", "status", "sprint_id",
+            postgresql_include=["story_points"]
+        ),
+        Index("ix_backlog_sprint_status", "sprint_id", "status"),
+        Index("ix_backlog_assignee_status", "assignee_id", "status"),
+        Index("ix_backlog_depends_gin", "depends_on", postgresql_using="gin"),
+        # Partial indexes matching the needs_clarification / is_high_value filters
+        Index(
+            "ix_backlog_needs_clarification", "project_id",
+            postgresql_where=text(
+                "(ai_clarity_score IS NULL AND coalesce(length(description), 0) < 50) "
+                "OR ai_clarity_score < 0.6"
+            )
+        ),
+        Index("ix_backlog_high_value", "project_id", postgresql_where=text("business_value >= 80")),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     
     # Basic item information
-    title = Column(String, nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    acceptance_criteria = Column(Text, nullable=True)
+    title: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    acceptance_criteria: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Item classification
-    item_type = Column(String, default="story")  # story, bug, task, epic, spike
-    priority = Column(String, default="medium")  # critical, high, medium, low
-    status = Column(String, default="todo")  # todo, in_progress, review, done, blocked
+    item_type: Mapped[Optional[BacklogItemType]] = mapped_column(sql_enum(BacklogItemType, "backlog_item_type"), default=BacklogItemType.STORY)
+    priority: Mapped[Optional[BacklogPriority]] = mapped_column(sql_enum(BacklogPriority, "backlog_priority"), default=BacklogPriority.MEDIUM)
+    status: Mapped[Optional[BacklogStatus]] = mapped_column(sql_enum(BacklogStatus, "backlog_status"), default=BacklogStatus.TODO)
     
     # Estimation and effort
-    story_points = Column(Integer, nullable=True)
-    estimated_hours = Column(Float, nullable=True)
-    actual_hours = Column(Float, nullable=True)
+    story_points: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    estimated_hours: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    actual_hours: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
     # External system identifiers
-    jira_key = Column(String, nullable=True, unique=True, index=True)
-    jira_id = Column(String, nullable=True)
-    github_issue_number = Column(Integer, nullable=True)
+    jira_key: Mapped[Optional[str]] = mapped_column(String, nullable=True, unique=True, index=True)
+    jira_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    github_issue_number: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
     # AI analysis and suggestions
-    ai_suggested_points = Column(Integer, nullable=True)
-    ai_complexity_score = Column(Float, nullable=True)  # 0.0 to 1.0
-    ai_suggestions = Column(Text, nullable=True)  # JSON string with AI recommendations
-    ai_clarity_score = Column(Float, nullable=True)  # 0.0 to 1.0, how clear the description is
-    duplicate_candidates = Column(Text, nullable=True)  # JSON array of potentially duplicate item IDs
+    ai_suggested_points: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    ai_complexity_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # 0.0 to 1.0
+    ai_suggestions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string with AI recommendations
+    ai_clarity_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # 0.0 to 1.0, how clear the description is
+    duplicate_candidates: Mapped[Optional[List[int]]] = mapped_column(JSONList, nullable=True)  # Potentially duplicate item IDs
     
     # Workflow tracking
-    blocked_reason = Column(Text, nullable=True)
-    blocked_since = Column(DateTime(timezone=True), nullable=True)
+    blocked_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    blocked_since: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Business value and ranking
-    business_value = Column(Integer, nullable=True)  # 1-100 scale
-    effort_estimate = Column(String, nullable=True)  # XS, S, M, L, XL, XXL
-    value_effort_ratio = Column(Float, nullable=True)  # Calculated ratio for prioritization
+    business_value: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 1-100 scale
+    effort_estimate: Mapped[Optional[EffortEstimate]] = mapped_column(sql_enum(EffortEstimate, "effort_estimate"), nullable=True)
+    # Maintained by the database on every write; read-only from Python
+    value_effort_ratio: Mapped[Optional[float]] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN story_points IS NULL OR story_points = 0 OR business_value IS NULL "
+            "THEN NULL ELSE business_value * 1.0 / story_points END",
+            persisted=True
+        ),
+        nullable=True
+    )
     
     # Dependencies
-    depends_on = Column(Text, nullable=True)  # JSON array of item IDs this depends on
-    blocks = Column(Text, nullable=True)  # JSON array of item IDs this blocks
+    depends_on: Mapped[Optional[List[int]]] = mapped_column(JSONList, nullable=True)  # Item IDs this depends on
+    blocks: Mapped[Optional[List[int]]] = mapped_column(JSONList, nullable=True)  # Item IDs this blocks
     
     # Associations
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
-    sprint_id = Column(Integer, ForeignKey("sprints.id"), nullable=True)
-    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id"), nullable=False)
+    sprint_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("sprints.id"), nullable=True)
+    assignee_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
+    created_by_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    completed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
-    # Relationships
-    project = relationship("Project", back_populates="backlog_items")
-    sprint = relationship("Sprint", back_populates="backlog_items")
-    assignee = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_backlog_items")
-    created_by = relationship("User", foreign_keys=[created_by_id], back_populates="created_backlog_items")
+    # Relationships (single-row parents are cheap to join in the same query)
+    project: Mapped["Project"] = relationship("Project", back_populates="backlog_items", lazy="joined")
+    sprint: Mapped[Optional["Sprint"]] = relationship("Sprint", back_populates="backlog_items", lazy="joined")
+    assignee: Mapped[Optional["User"]] = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_backlog_items", lazy="joined")
+    created_by: Mapped["User"] = relationship("User", foreign_keys=[created_by_id], back_populates="created_backlog_items")
 
     def __repr__(self):
         return f"<BacklogItem(id={self.id}, title='{self.title[:50]}...', status='{self.status}')>"
@@ -79,88 +132,103 @@ class BacklogItem(Base):
     @property
     def is_blocked(self) -> bool:
         """Check if this item is currently blocked."""
-        return self.status == "blocked"
+        return self.status == BacklogStatus.BLOCKED
 
     @property
     def is_complete(self) -> bool:
         """Check if this item is completed."""
-        return self.status == "done"
+        return self.status in DONE_STATUSES
 
     @property
     def is_in_sprint(self) -> bool:
         """Check if this item is assigned to a sprint."""
         return self.sprint_id is not None
 
-    @property
+    @cached_property
     def age_days(self) -> int:
-        """Calculate age of the item in days."""
-        return (datetime.now() - self.created_at).days
+        """Calculate age of the item in days (computed once per instance)."""
+        created_at = self.created_at
+        if created_at.tzinfo is None:
+            # SQLite hands back naive UTC timestamps
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - created_at).days
 
-    @property
+    @hybrid_property
     def needs_clarification(self) -> bool:
         """Check if item needs clarification based on AI analysis."""
         if self.ai_clarity_score is None:
             return len(self.description or "") < 50  # Simple heuristic
         return self.ai_clarity_score < 0.6
 
+    @needs_clarification.inplace.expression
+    @classmethod
+    def _needs_clarification_expression(cls):
+        return or_(
+            and_(cls.ai_clarity_score.is_(None), func.coalesce(func.length(cls.description), 0) < 50),
+            cls.ai_clarity_score < 0.6
+        )
+
     @property
     def has_dependencies(self) -> bool:
         """Check if item has dependencies."""
-        return bool(self.depends_on and self.depends_on.strip())
+        return bool(self.depends_on)
 
-    @property
+    @hybrid_property
     def is_high_value(self) -> bool:
         """Check if item is considered high business value."""
         if self.business_value is None:
             return False
         return self.business_value >= 80
+
+    @is_high_value.inplace.expression
+    @classmethod
+    def _is_high_value_expression(cls):
+        # NULL business_value compares as unknown, i.e. not high value
+        return cls.business_value >= 80
     
-    @property
+    @hybrid_property
     def effort_estimate_numeric(self) -> int:
         """Convert effort estimate to numeric story points."""
         if self.story_points is not None:
             return self.story_points
         
-        # Convert t-shirt sizing to numeric values
-        effort_mapping = {
-            'XS': 1,
-            'S': 2,
-            'M': 3,
-            'L': 5,
-            'XL': 8,
-            'XXL': 13
-        }
-        
-        if self.effort_estimate and self.effort_estimate.upper() in effort_mapping:
-            return effort_mapping[self.effort_estimate.upper()]
-        
-        # Default to 3 if no estimate available
-        return 3
+        # Convert t-shirt sizing to numeric values, defaulting to 3 if no estimate available
+        return EFFORT_POINTS.get(self.effort_estimate, DEFAULT_EFFORT_POINTS)
+
+    @effort_estimate_numeric.inplace.expression
+    @classmethod
+    def _effort_estimate_numeric_expression(cls):
+        return func.coalesce(
+            cls.story_points,
+            case(EFFORT_POINTS, value=cls.effort_estimate, else_=DEFAULT_EFFORT_POINTS)
+        )
 
     def calculate_value_effort_ratio(self) -> Optional[float]:
-        """Calculate and update the value-effort ratio for prioritization."""
+        """
+        Calculate the value-effort ratio for prioritization.
+
+        The stored value_effort_ratio column is generated by the database; this
+        is only useful for items whose edits haven't been flushed yet.
+        """
         if self.business_value is None or self.story_points is None or self.story_points == 0:
             return None
-        
-        ratio = self.business_value / self.story_points
-        self.value_effort_ratio = ratio
-        return ratio
+        return self.business_value / self.story_points
 
     def mark_complete(self):
         """Mark the item as complete and set completion timestamp."""
-        self.status = "done"
-        self.completed_at = datetime.now()
+        self.status = BacklogStatus.DONE
+        self.completed_at = func.now()  # Stamped by the database at flush
 
     def mark_blocked(self, reason: str):
         """Mark the item as blocked with a reason."""
-        self.status = "blocked"
+        self.status = BacklogStatus.BLOCKED
         self.blocked_reason = reason
-        self.blocked_since = datetime.now()
+        self.blocked_since = func.now()
 
     def unblock(self):
         """Remove blocked status."""
-        if self.status == "blocked":
-            self.status = "todo"  # Reset to default
+        if self.status == BacklogStatus.BLOCKED:
+            self.status = BacklogStatus.TODO  # Reset to default
             self.blocked_reason = None
             self.blocked_since = None
 
@@ -169,30 +237,27 @@ class BacklogItem(Base):
         if not self.ai_suggestions:
             return {}
         try:
-            import json
-            return json.loads(self.ai_suggestions)
-        except:
+            return orjson.loads(self.ai_suggestions)
+        except (ValueError, TypeError):
             return {}
 
     def set_ai_suggestions(self, suggestions: Dict[str, Any]):
         """Set AI suggestions as JSON string."""
-        import json
-        self.ai_suggestions = json.dumps(suggestions)
+        self.ai_suggestions = orjson.dumps(suggestions).decode()
 
     def get_duplicate_candidates_list(self) -> list:
         """Get list of duplicate candidate IDs."""
-        if not self.duplicate_candidates:
-            return []
-        try:
-            import json
-            return json.loads(self.duplicate_candidates)
-        except:
-            return []
+        return list(self.duplicate_candidates or [])
 
     def add_duplicate_candidate(self, item_id: int):
         """Add an item ID to duplicate candidates."""
-        candidates = self.get_duplicate_candidates_list()
+        candidates = self.duplicate_candidates or []
         if item_id not in candidates:
-            candidates.append(item_id)
-            import json
-            self.duplicate_candidates = json.dumps(candidates)
\ No newline at end of file
+            # Assign a new list so SQLAlchemy sees the change
+            self.duplicate_candidates = candidates + [item_id]
+
+
+# Priority ordering for backlog views; SQLite rejects NULLS LAST in index definitions
+Index(
+    "ix_backlog_value_effort", BacklogItem.value_effort_ratio.desc().nullslast()
+).ddl_if(dialect="postgresql")
\ No newline at end of file
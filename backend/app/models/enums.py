@@ -0,0 +1,80 @@
+"""
+Enumerated column values shared by the database models.
+"""
+import enum
+from typing import List, Type
+
+from sqlalchemy import Enum
+
+
+class BacklogStatus(enum.StrEnum):
+    TODO = "todo"
+    IN_PROGRESS = "in_progress"
+    REVIEW = "review"
+    DONE = "done"
+    BLOCKED = "blocked"
+
+
+# Statuses that count as finished work. Use with ``in`` in Python and
+# ``.in_()`` in queries so both sides agree; the sprint filters are served
+# by ix_backlog_sprint_status.
+DONE_STATUSES = frozenset({BacklogStatus.DONE})
+
+
+class BacklogPriority(enum.StrEnum):
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+
+class BacklogItemType(enum.StrEnum):
+    STORY = "story"
+    BUG = "bug"
+    TASK = "task"
+    EPIC = "epic"
+    SPIKE = "spike"
+
+
+class EffortEstimate(enum.StrEnum):
+    XS = "XS"
+    S = "S"
+    M = "M"
+    L = "L"
+    XL = "XL"
+    XXL = "XXL"
+
+
+class SprintStatus(enum.StrEnum):
+    PLANNED = "planned"
+    ACTIVE = "active"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+class ProjectStatus(enum.StrEnum):
+    ACTIVE = "active"
+    ON_HOLD = "on_hold"
+    COMPLETED = "completed"
+    ARCHIVED = "archived"
+
+
+class EstimationScale(enum.StrEnum):
+    FIBONACCI = "fibonacci"
+    LINEAR = "linear"
+    T_SHIRT = "t_shirt"
+
+
+def _enum_values(enum_cls: Type[enum.Enum]) -> List[str]:
+    return [member.value for member in enum_cls]
+
+
+def sql_enum(enum_cls: Type[enum.Enum], name: str) -> Enum:
+    """
+    Column type for a StrEnum.
+
+    Stored as a native ENUM on PostgreSQL (4 bytes per row); the lowercase
+    values rather than member names are persisted so existing rows and plain
+    string comparisons keep working.
+    """
+    return Enum(enum_cls, name=name, values_callable=_enum_values)
@@ -1,48 +1,80 @@
 """
 Project model for organizing sprints and backlog items.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey
+import warnings
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import Integer, String, Boolean, DateTime, Text, ForeignKey, select
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 
 from app.core.database import Base
+from app.models.backlog_item import BacklogItem
+from app.models.enums import DONE_STATUSES, EstimationScale, ProjectStatus, SprintStatus, sql_enum
+from app.models.sprint import Sprint
+
+if TYPE_CHECKING:
+    from app.models.team import Team
 
 class Project(Base):
     """Project model for organizing sprints and backlog management."""
     
     __tablename__ = "projects"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    key = Column(String, unique=True, nullable=False, index=True)  # Like "PROJ"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    key: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)  # Like "PROJ"
     
     # Project status
-    is_active = Column(Boolean, default=True)
-    status = Column(String, default="active")  # active, on_hold, completed, archived
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    status: Mapped[Optional[ProjectStatus]] = mapped_column(sql_enum(ProjectStatus, "project_status"), default=ProjectStatus.ACTIVE)
     
     # Integration identifiers
-    jira_project_id = Column(String, nullable=True)
-    jira_project_key = Column(String, nullable=True)
-    github_repo_name = Column(String, nullable=True)
+    jira_project_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    jira_project_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    github_repo_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     
     # Project configuration
-    default_story_points = Column(Integer, default=1)
-    estimation_scale = Column(String, default="fibonacci")  # fibonacci, linear, t_shirt
+    default_story_points: Mapped[Optional[int]] = mapped_column(Integer, default=1)
+    estimation_scale: Mapped[Optional[EstimationScale]] = mapped_column(sql_enum(EstimationScale, "estimation_scale"), default=EstimationScale.FIBONACCI)
     
     # Associations
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    team_id: Mapped[int] = mapped_column(Integer, ForeignKey("teams.id"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    start_date = Column(DateTime(timezone=True), nullable=True)
-    end_date = Column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    start_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    end_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    team = relationship("Team", back_populates="projects")
-    sprints = relationship("Sprint", back_populates="project")
-    backlog_items = relationship("BacklogItem", back_populates="project")
+    # Collections grow for the life of the project and items/sprints join back
+    # to it eagerly, so load them per query with selectinload() when needed
+    team: Mapped["Team"] = relationship("Team", back_populates="projects", lazy="joined")
+    sprints: Mapped[List["Sprint"]] = relationship("Sprint", back_populates="project", lazy="select")
+    backlog_items: Mapped[List["BacklogItem"]] = relationship("BacklogItem", back_populates="project", lazy="select")
+
+    # Read-only slices of the collections above, filtered by the database
+    active_sprints: Mapped[List["Sprint"]] = relationship(
+        "Sprint",
+        primaryjoin="and_(Project.id == Sprint.project_id, Sprint.status == 'active')",
+        viewonly=True,
+        lazy="select"
+    )
+    unassigned_items: Mapped[List["BacklogItem"]] = relationship(
+        "BacklogItem",
+        primaryjoin="and_(Project.id == BacklogItem.project_id, BacklogItem.sprint_id.is_(None))",
+        viewonly=True,
+        lazy="select"
+    )
+    completed_items: Mapped[List["BacklogItem"]] = relationship(
+        "BacklogItem",
+        primaryjoin="and_(Project.id == BacklogItem.project_id, BacklogItem.status == 'done')",
+        viewonly=True,
+        lazy="select"
+    )
 
     def __repr__(self):
         return f"<Project(id={self.id}, key='{self.key}', name='{self.name}')>"
@@ -50,23 +82,67 @@ class Project(Base):
     @property
     def active_sprint(self):
         """Get the currently active sprint for this project."""
-        return next((sprint for sprint in self.sprints if sprint.status == "active"), None)
+        return self.active_sprints[0] if self.active_sprints else None
     
     @property
     def product_backlog(self):
         """Get all backlog items not assigned to any sprint."""
-        return [item for item in self.backlog_items if item.sprint_id is None]
+        return self.unassigned_items
     
     @property
     def total_story_points(self):
-        """Calculate total story points across all backlog items."""
+        """Deprecated: loads every backlog item. Use get_total_story_points()."""
+        _warn_python_scan("total_story_points", "get_total_story_points")
         return sum(item.story_points or 0 for item in self.backlog_items)
     
     @property
     def completed_story_points(self):
-        """Calculate completed story points."""
-        return sum(
-            item.story_points or 0 
-            for item in self.backlog_items 
-            if item.status == "done"
-        )
\ No newline at end of file
+        """Sum story points of completed items; use get_completed_story_points() to skip loading them."""
+        return sum(item.story_points or 0 for item in self.completed_items)
+
+    @classmethod
+    def get_active_sprint(cls, session: Session, project_id: int) -> Optional[Sprint]:
+        """Get the currently active sprint for a project."""
+        return session.scalar(
+            select(Sprint)
+            .where(Sprint.project_id == project_id, Sprint.status == SprintStatus.ACTIVE)
+            .limit(1)
+        )
+
+    @classmethod
+    def get_product_backlog(cls, session: Session, project_id: int) -> List[BacklogItem]:
+        """Get all backlog items not assigned to any sprint."""
+        return list(session.scalars(
+            select(BacklogItem).where(
+                BacklogItem.project_id == project_id,
+                BacklogItem.sprint_id.is_(None)
+            )
+        ))
+
+    @classmethod
+    def get_total_story_points(cls, session: Session, project_id: int) -> int:
+        """Sum story points across all backlog items in the database."""
+        return session.scalar(
+            select(func.coalesce(func.sum(BacklogItem.story_points), 0))
+            .where(BacklogItem.project_id == project_id)
+        )
+
+    @classmethod
+    def get_completed_story_points(cls, session: Session, project_id: int) -> int:
+        """Sum story points of completed backlog items in the database."""
+        return session.scalar(
+            select(func.coalesce(func.sum(BacklogItem.story_points), 0))
+            .where(
+                BacklogItem.project_id == project_id,
+                BacklogItem.status.in_(DONE_STATUSES)
+            )
+        )
+
+
+def _warn_python_scan(name: str, replacement: str) -> None:
+    """Flag callers still using the in-Python aggregate properties."""
+    warnings.warn(
+        f"Project.{name} loads the whole collection; use Project.{replacement}(session, project_id)",
+        DeprecationWarning,
+        stacklevel=3
+    )
\ No newline at end of file
@@ -1,53 +1,69 @@
 """
 Sprint model for managing sprint cycles and tracking progress.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Integer, String, Boolean, Date, DateTime, Text, ForeignKey, Float, Index, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from datetime import datetime, timedelta
-from typing import Dict, Any
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+import numpy as np
 
 from app.core.database import Base
+from app.models.enums import SprintStatus, sql_enum
+
+if TYPE_CHECKING:
+    from app.models.backlog_item import BacklogItem
+    from app.models.project import Project
+    from app.models.standup import StandupSummary
+    from app.models.team import Team
 
 class Sprint(Base):
     """Sprint model for managing sprint cycles."""
     
     __tablename__ = "sprints"
+    __table_args__ = (
+        Index("ix_sprint_project_status", "project_id", "status"),
+        Index("ix_sprint_team_status", "team_id", "status"),
+        # At most one active sprint per project, so this stays tiny
+        Index("ix_sprint_active", "project_id", postgresql_where=text("status = 'active'")),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
-    goal = Column(Text, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    goal: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Sprint timing
-    start_date = Column(DateTime(timezone=True), nullable=False)
-    end_date = Column(DateTime(timezone=True), nullable=False)
+    start_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     
     # Sprint status
-    status = Column(String, default="planned")  # planned, active, completed, cancelled
+    status: Mapped[Optional[SprintStatus]] = mapped_column(sql_enum(SprintStatus, "sprint_status"), default=SprintStatus.PLANNED)
     
     # Sprint metrics
-    planned_capacity = Column(Float, default=0.0)  # Total story points planned
-    actual_velocity = Column(Float, default=0.0)  # Story points completed
-    team_capacity_days = Column(Float, default=0.0)  # Total available person-days
+    planned_capacity: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # Total story points planned
+    actual_velocity: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # Story points completed
+    team_capacity_days: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # Total available person-days
     
     # AI insights and notes
-    ai_generated_goal = Column(Text, nullable=True)
-    ai_insights = Column(Text, nullable=True)  # JSON string with AI analysis
-    risk_factors = Column(Text, nullable=True)  # JSON string with identified risks
+    ai_generated_goal: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_insights: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string with AI analysis
+    risk_factors: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string with identified risks
     
     # Associations
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id"), nullable=False)
+    team_id: Mapped[int] = mapped_column(Integer, ForeignKey("teams.id"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    project = relationship("Project", back_populates="sprints")
-    team = relationship("Team", back_populates="sprints")
-    backlog_items = relationship("BacklogItem", back_populates="sprint")
-    standup_summaries = relationship("StandupSummary", back_populates="sprint")
+    project: Mapped["Project"] = relationship("Project", back_populates="sprints", lazy="joined")
+    team: Mapped["Team"] = relationship("Team", back_populates="sprints", lazy="joined")
+    backlog_items: Mapped[List["BacklogItem"]] = relationship("BacklogItem", back_populates="sprint", lazy="selectin")
+    # Sprints are joined onto every backlog item; opt in with selectinload() where summaries are read
+    standup_summaries: Mapped[List["StandupSummary"]] = relationship("StandupSummary", back_populates="sprint", lazy="select")
 
     def __repr__(self):
         return f"<Sprint(id={self.id}, name='{self.name}', status='{self.status}')>"
@@ -60,9 +76,13 @@ class Sprint(Base):
     @property
     def days_remaining(self) -> int:
         """Calculate days remaining in sprint."""
-        if self.status != "active":
+        if self.status != SprintStatus.ACTIVE:
             return 0
-        remaining = (self.end_date - datetime.now()).days
+        end_date = self.end_date
+        if end_date.tzinfo is None:
+            # SQLite hands back naive UTC timestamps
+            end_date = end_date.replace(tzinfo=timezone.utc)
+        remaining = (end_date - datetime.now(timezone.utc)).days
         return max(0, remaining)
 
     @property
@@ -85,19 +105,12 @@ class Sprint(Base):
             "actual_burndown": self._calculate_actual_burndown()
         }
 
-    def _calculate_ideal_burndown(self) -> list:
-        """Calculate ideal burndown line."""
-        if self.duration_days == 0:
-            return []
-        
-        daily_burn = self.planned_capacity / self.duration_days
-        return [
-            {
-                "day": i,
-                "remaining": self.planned_capacity - (daily_burn * i)
-            }
-            for i in range(self.duration_days + 1)
-        ]
+    def _calculate_ideal_burndown(self) -> Dict[str, np.ndarray]:
+        """Calculate ideal burndown line as parallel day/remaining arrays."""
+        days, remaining = _ideal_burndown(
+            max(0, self.duration_days), round(self.planned_capacity or 0.0, 2)
+        )
+        return {"days": days, "remaining": remaining}
 
     def _calculate_actual_burndown(self) -> list:
         """Calculate actual burndown based on completed work."""
@@ -140,4 +153,37 @@ class Sprint(Base):
         current_velocity = self.actual_velocity / days_elapsed
         forecasted_total = current_velocity * self.duration_days
         
-        return min(100.0, (forecasted_total / self.planned_capacity) * 100)
\ No newline at end of file
+        return min(100.0, (forecasted_total / self.planned_capacity) * 100)
+
+
+class SprintDailySnapshot(Base):
+    """Story points remaining and completed in a sprint at the end of a day, for real burndown charts."""
+    
+    __tablename__ = "sprint_daily_snapshots"
+
+    sprint_id: Mapped[int] = mapped_column(Integer, ForeignKey("sprints.id", ondelete="CASCADE"), primary_key=True)
+    snapshot_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    remaining_points: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_points: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<SprintDailySnapshot(sprint_id={self.sprint_id}, date={self.snapshot_date}, remaining={self.remaining_points})>"
+
+
+@lru_cache(maxsize=256)
+def _ideal_burndown(duration_days: int, planned_capacity: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the ideal burndown arrays for a sprint shape.
+
+    Sprints mostly share a handful of lengths and capacities, so results are
+    memoized; the arrays are read-only because they are shared between callers.
+    """
+    if duration_days == 0:
+        days = np.arange(0)
+        remaining = np.zeros(0)
+    else:
+        days = np.arange(duration_days + 1)
+        remaining = np.linspace(planned_capacity, 0.0, duration_days + 1)
+    days.flags.writeable = False
+    remaining.flags.writeable = False
+    return days, remaining
\ No newline at end of file
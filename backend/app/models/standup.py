@@ -1,41 +1,53 @@
 """
 Standup models for daily standup entries and AI-generated summaries.
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Integer, String, DateTime, Text, ForeignKey, Boolean, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, List, Optional
+import orjson
 
 from app.core.database import Base
+from app.models.types import JSONList
+
+if TYPE_CHECKING:
+    from app.models.sprint import Sprint
+    from app.models.team import Team
+    from app.models.user import User
 
 class StandupEntry(Base):
     """Individual team member's standup entry."""
     
     __tablename__ = "standup_entries"
+    __table_args__ = (
+        Index("ix_standup_entry_team_date", "team_id", "entry_date"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     
     # Standup content
-    yesterday_work = Column(Text, nullable=True)
-    today_plan = Column(Text, nullable=True)
-    blockers = Column(Text, nullable=True)
-    additional_notes = Column(Text, nullable=True)
+    yesterday_work: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    today_plan: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    blockers: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    additional_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Entry metadata
-    entry_date = Column(DateTime(timezone=True), nullable=False)
-    source = Column(String, default="manual")  # manual, slack, web_form, ai_detected
-    confidence_score = Column(Integer, default=100)  # AI confidence if auto-generated
+    entry_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    source: Mapped[Optional[str]] = mapped_column(String, default="manual")  # manual, slack, web_form, ai_detected
+    confidence_score: Mapped[Optional[int]] = mapped_column(Integer, default=100)  # AI confidence if auto-generated
     
     # Associations
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    team_id: Mapped[int] = mapped_column(Integer, ForeignKey("teams.id"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="standup_entries")
+    user: Mapped["User"] = relationship("User", back_populates="standup_entries")
 
     def __repr__(self):
         return f"<StandupEntry(id={self.id}, user_id={self.user_id}, date={self.entry_date})>"
@@ -57,46 +69,49 @@ class StandupSummary(Base):
     """AI-generated daily standup summary for the team."""
     
     __tablename__ = "standup_summaries"
+    __table_args__ = (
+        Index("ix_standup_summary_team_date", "team_id", "summary_date"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     
     # Summary content
-    summary_text = Column(Text, nullable=False)
-    key_achievements = Column(Text, nullable=True)  # JSON array of achievements
-    active_blockers = Column(Text, nullable=True)  # JSON array of blockers
-    focus_areas = Column(Text, nullable=True)  # JSON array of today's focus
-    action_items = Column(Text, nullable=True)  # JSON array of follow-up actions
+    summary_text: Mapped[str] = mapped_column(Text, nullable=False)
+    key_achievements: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON array of achievements
+    active_blockers: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON array of blockers
+    focus_areas: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON array of today's focus
+    action_items: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON array of follow-up actions
     
     # Summary metadata
-    summary_date = Column(DateTime(timezone=True), nullable=False)
-    participants_count = Column(Integer, default=0)
-    missing_members = Column(Text, nullable=True)  # JSON array of user IDs
+    summary_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    participants_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    missing_members: Mapped[Optional[List[int]]] = mapped_column(JSONList, nullable=True)  # User IDs
     
     # AI generation details
-    ai_model_used = Column(String, default="gpt-4")
-    generation_prompt = Column(Text, nullable=True)
-    confidence_score = Column(Integer, default=100)
-    human_reviewed = Column(Boolean, default=False)
-    human_reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    ai_model_used: Mapped[Optional[str]] = mapped_column(String, default="gpt-4")
+    generation_prompt: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    confidence_score: Mapped[Optional[int]] = mapped_column(Integer, default=100)
+    human_reviewed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    human_reviewer_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
     
     # Status and delivery
-    status = Column(String, default="generated")  # generated, reviewed, published, archived
-    posted_to_slack = Column(Boolean, default=False)
-    slack_message_ts = Column(String, nullable=True)
-    slack_channel_id = Column(String, nullable=True)
+    status: Mapped[Optional[str]] = mapped_column(String, default="generated")  # generated, reviewed, published, archived
+    posted_to_slack: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    slack_message_ts: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    slack_channel_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     
     # Associations
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
-    sprint_id = Column(Integer, ForeignKey("sprints.id"), nullable=True)
+    team_id: Mapped[int] = mapped_column(Integer, ForeignKey("teams.id"), nullable=False)
+    sprint_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("sprints.id"), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    published_at = Column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    team = relationship("Team", back_populates="standup_summaries")
-    sprint = relationship("Sprint", back_populates="standup_summaries")
+    team: Mapped["Team"] = relationship("Team", back_populates="standup_summaries")
+    sprint: Mapped[Optional["Sprint"]] = relationship("Sprint", back_populates="standup_summaries")
 
     def __repr__(self):
         return f"<StandupSummary(id={self.id}, team_id={self.team_id}, date={self.summary_date})>"
@@ -104,39 +119,56 @@ class StandupSummary(Base):
     @property
     def is_current(self) -> bool:
         """Check if this summary is for today."""
-        return self.summary_date.date() == datetime.now().date()
+        return self.summary_date.date() == datetime.now(timezone.utc).date()
     
+    @validates("active_blockers", "action_items")
+    def _invalidate_parsed(self, key: str, value: Any) -> Any:
+        """Drop the cached parse when the underlying JSON column is reassigned."""
+        self.__dict__.pop(_PARSED_CACHE_ATTRS[key], None)
+        return value
+
+    @cached_property
+    def _parsed_blockers(self) -> List[Any]:
+        return _parse_json_list(self.active_blockers)
+
+    @cached_property
+    def _parsed_actions(self) -> List[Any]:
+        return _parse_json_list(self.action_items)
+
     @property
     def blockers_count(self) -> int:
         """Count active blockers."""
-        if not self.active_blockers:
-            return 0
-        try:
-            import json
-            blockers = json.loads(self.active_blockers)
-            return len(blockers) if isinstance(blockers, list) else 0
-        except:
-            return 0
+        return len(self._parsed_blockers)
 
     @property
     def action_items_count(self) -> int:
         """Count action items."""
-        if not self.action_items:
-            return 0
-        try:
-            import json
-            items = json.loads(self.action_items)
-            return len(items) if isinstance(items, list) else 0
-        except:
-            return 0
+        return len(self._parsed_actions)
 
     def mark_as_published(self):
         """Mark summary as published and set timestamp."""
         self.status = "published"
-        self.published_at = datetime.now()
+        self.published_at = func.now()  # Stamped by the database at flush
 
     def mark_slack_posted(self, message_ts: str, channel_id: str):
         """Mark as posted to Slack with message details."""
         self.posted_to_slack = True
         self.slack_message_ts = message_ts
-        self.slack_channel_id = channel_id
\ No newline at end of file
+        self.slack_channel_id = channel_id
+
+
+_PARSED_CACHE_ATTRS = {
+    "active_blockers": "_parsed_blockers",
+    "action_items": "_parsed_actions",
+}
+
+
+def _parse_json_list(raw: str) -> List[Any]:
+    """Parse a JSON array column, treating empty or malformed values as empty."""
+    if not raw:
+        return []
+    try:
+        parsed = orjson.loads(raw)
+    except (ValueError, TypeError):
+        return []
+    return parsed if isinstance(parsed, list) else []
\ No newline at end of file
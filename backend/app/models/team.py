@@ -1,11 +1,21 @@
 """
 Team model for organizing users and projects.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Table, ForeignKey
+import warnings
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Table, ForeignKey, select, update
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 
 from app.core.database import Base
+from app.models.user import User
+
+if TYPE_CHECKING:
+    from app.models.project import Project
+    from app.models.sprint import Sprint
+    from app.models.standup import StandupSummary
 
 # Association table for team members
 team_members = Table(
@@ -22,61 +32,109 @@ class Team(Base):
     
     __tablename__ = "teams"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False, index=True)
-    description = Column(Text, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Team configuration
-    is_active = Column(Boolean, default=True)
-    team_size = Column(Integer, default=0)
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    team_size: Mapped[Optional[int]] = mapped_column(Integer, default=0)
     
     # Scrum configuration
-    sprint_length_days = Column(Integer, default=14)  # 2-week sprints by default
-    standup_time = Column(String, default="09:00")  # 24h format
-    standup_timezone = Column(String, default="UTC")
-    standup_days = Column(String, default="1,2,3,4,5")  # Mon-Fri (1=Monday)
+    sprint_length_days: Mapped[Optional[int]] = mapped_column(Integer, default=14)  # 2-week sprints by default
+    standup_time: Mapped[Optional[str]] = mapped_column(String, default="09:00")  # 24h format
+    standup_timezone: Mapped[Optional[str]] = mapped_column(String, default="UTC")
+    standup_days: Mapped[Optional[str]] = mapped_column(String, default="1,2,3,4,5")  # Mon-Fri (1=Monday)
     
     # Integration settings
-    slack_channel_id = Column(String, nullable=True)
-    slack_channel_name = Column(String, nullable=True)
-    jira_project_key = Column(String, nullable=True)
-    github_repo = Column(String, nullable=True)
+    slack_channel_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    slack_channel_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    jira_project_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    github_repo: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     
     # AI preferences
-    ai_tone = Column(String, default="professional")  # professional, casual, formal
-    ai_detail_level = Column(String, default="medium")  # low, medium, high
-    auto_standup_enabled = Column(Boolean, default=True)
-    auto_grooming_enabled = Column(Boolean, default=True)
+    ai_tone: Mapped[Optional[str]] = mapped_column(String, default="professional")  # professional, casual, formal
+    ai_detail_level: Mapped[Optional[str]] = mapped_column(String, default="medium")  # low, medium, high
+    auto_standup_enabled: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    auto_grooming_enabled: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    members = relationship("User", secondary=team_members, back_populates="teams")
-    projects = relationship("Project", back_populates="team")
-    sprints = relationship("Sprint", back_populates="team")
-    standup_summaries = relationship("StandupSummary", back_populates="team")
+    # Teams are joined onto sprints, projects and backlog items, so an eager
+    # collection here fires once per path; load any of these per query with
+    # selectinload() when needed
+    members: Mapped[List["User"]] = relationship("User", secondary=team_members, back_populates="teams", lazy="select")
+    projects: Mapped[List["Project"]] = relationship("Project", back_populates="team", lazy="select")
+    sprints: Mapped[List["Sprint"]] = relationship("Sprint", back_populates="team", lazy="select")
+    standup_summaries: Mapped[List["StandupSummary"]] = relationship("StandupSummary", back_populates="team", lazy="select")
 
     def __repr__(self):
         return f"<Team(id={self.id}, name='{self.name}', size={self.team_size})>"
 
     @property
     def scrum_masters(self):
-        """Get all Scrum Masters for this team."""
+        """Deprecated: filters every member in Python. Use get_scrum_masters()."""
+        _warn_python_scan("scrum_masters", "get_scrum_masters")
         return [member for member in self.members if member.is_scrum_master]
     
     @property
     def product_owners(self):
-        """Get all Product Owners for this team."""
+        """Deprecated: filters every member in Python. Use get_product_owners()."""
+        _warn_python_scan("product_owners", "get_product_owners")
         return [member for member in self.members if member.is_product_owner]
 
+    @classmethod
+    def get_scrum_masters(cls, session: Session, team_id: int) -> List[User]:
+        """Get all Scrum Masters for a team."""
+        return cls._members_with_roles(session, team_id, ("scrum_master", "admin"))
+
+    @classmethod
+    def get_product_owners(cls, session: Session, team_id: int) -> List[User]:
+        """Get all Product Owners for a team."""
+        return cls._members_with_roles(session, team_id, ("product_owner", "admin"))
+
+    @staticmethod
+    def _members_with_roles(session: Session, team_id: int, roles: tuple) -> List[User]:
+        return list(session.scalars(
+            select(User)
+            .join(team_members, team_members.c.user_id == User.id)
+            .where(team_members.c.team_id == team_id, User.role.in_(roles))
+        ))
+
     def get_member_role(self, user_id: int) -> str:
         """Get the role of a specific member in this team."""
         # This would require a query to the team_members association table
         # Implementation would depend on your specific requirements
         return "member"
 
-    def update_team_size(self):
+    def update_team_size(self, session: Session):
         """Update the team_size field based on active members."""
-        self.team_size = len([m for m in self.members if m.is_active])
\ No newline at end of file
+        self.team_size = session.scalar(_active_member_count(self.id))
+
+    @classmethod
+    def update_all_team_sizes(cls, session: Session) -> None:
+        """Recompute team_size for every team in a single UPDATE."""
+        session.execute(
+            update(cls).values(team_size=_active_member_count(cls.id).scalar_subquery())
+        )
+
+
+def _active_member_count(team_id):
+    """SELECT counting active members of a team (a value or a correlated column)."""
+    return (
+        select(func.count())
+        .select_from(team_members.join(User, team_members.c.user_id == User.id))
+        .where(team_members.c.team_id == team_id, User.is_active.is_(True))
+    )
+
+
+def _warn_python_scan(name: str, replacement: str) -> None:
+    """Flag callers still using the in-Python member filters."""
+    warnings.warn(
+        f"Team.{name} filters members in Python; use Team.{replacement}(session, team_id)",
+        DeprecationWarning,
+        stacklevel=3
+    )
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""
+Column types shared by the database models.
+"""
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# JSON array column: JSONB (GIN-indexable) on PostgreSQL, plain JSON elsewhere.
+# Values come back as Python lists with no manual json.loads.
+JSONList = JSON().with_variant(JSONB(), "postgresql")
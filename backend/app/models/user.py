@@ -1,51 +1,59 @@
 """
 User model for authentication and team management.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import Integer, String, Boolean, DateTime, Text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
+if TYPE_CHECKING:
+    from app.models.backlog_item import BacklogItem
+    from app.models.standup import StandupEntry
+    from app.models.team import Team
+
 class User(Base):
     """User model for team members and Scrum Masters."""
     
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    username = Column(String, unique=True, index=True, nullable=False)
-    full_name = Column(String, nullable=False)
-    role = Column(String, default="team_member")  # team_member, scrum_master, product_owner, admin
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
+    username: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
+    full_name: Mapped[str] = mapped_column(String, nullable=False)
+    role: Mapped[Optional[str]] = mapped_column(String, default="team_member")  # team_member, scrum_master, product_owner, admin
     
     # Authentication
-    hashed_password = Column(String, nullable=True)  # OAuth users might not have passwords
-    is_active = Column(Boolean, default=True)
-    is_verified = Column(Boolean, default=False)
+    hashed_password: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # OAuth users might not have passwords
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    is_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     # External IDs for integrations
-    slack_user_id = Column(String, nullable=True, unique=True)
-    jira_account_id = Column(String, nullable=True)
-    github_username = Column(String, nullable=True)
+    slack_user_id: Mapped[Optional[str]] = mapped_column(String, nullable=True, unique=True)
+    jira_account_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    github_username: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     
     # Profile information
-    avatar_url = Column(String, nullable=True)
-    timezone = Column(String, default="UTC")
+    avatar_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    timezone: Mapped[Optional[str]] = mapped_column(String, default="UTC")
     
     # Preferences
-    notification_preferences = Column(Text, nullable=True)  # JSON string
-    ai_interaction_preferences = Column(Text, nullable=True)  # JSON string
+    notification_preferences: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
+    ai_interaction_preferences: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    last_login = Column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    teams = relationship("Team", secondary="team_members", back_populates="members")
-    standup_entries = relationship("StandupEntry", back_populates="user")
-    assigned_backlog_items = relationship("BacklogItem", foreign_keys="BacklogItem.assignee_id", back_populates="assignee")
-    created_backlog_items = relationship("BacklogItem", foreign_keys="BacklogItem.created_by_id", back_populates="created_by")
+    teams: Mapped[List["Team"]] = relationship("Team", secondary="team_members", back_populates="members")
+    standup_entries: Mapped[List["StandupEntry"]] = relationship("StandupEntry", back_populates="user")
+    assigned_backlog_items: Mapped[List["BacklogItem"]] = relationship("BacklogItem", foreign_keys="BacklogItem.assignee_id", back_populates="assignee")
+    created_backlog_items: Mapped[List["BacklogItem"]] = relationship("BacklogItem", foreign_keys="BacklogItem.created_by_id", back_populates="created_by")
 
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', role='{self.role}')>"
@@ -3,24 +3,50 @@ AI service for LLM interactions and intelligent analysis.
 This service handles all AI-powered features like standup summaries,
 backlog analysis, and sprint planning assistance.
 """
+import asyncio
+import hashlib
+import io
+from collections import Counter
 import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from typing import AsyncIterator, Dict, Hashable, List, Any, Optional, Tuple, Type
+from datetime import datetime, timedelta, timezone
 
+import httpx
+import jiter
+import tiktoken
+from cachetools import LRUCache
+from json_repair import repair_json
 from langchain_openai import OpenAI, ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, AIMessage
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
 from langchain.chains import LLMChain
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain.output_parsers import OutputFixingParser
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
+from app.core.cache import SemanticCache
 from app.core.config import settings
-from app.services.vector_service import VectorService
+from app.core.rate_limit import LLMQueue
+from app.services.vector_service import VectorContextBatcher, VectorService, get_vector_service
 
 logger = logging.getLogger(__name__)
 
+FALLBACK_STANDUP_SUMMARY = "Failed to generate AI summary. Please review standup entries manually."
+
+# Below these sizes retrieved context rarely changes the output, so the vector lookup is skipped
+MIN_CONTEXT_DESCRIPTION_LENGTH = 20
+MIN_CONTEXT_STANDUP_ENTRIES = 2
+MIN_CONTEXT_SPRINT_ITEMS = 3
+
+# Tokens kept free in the context window for the system prompt and message overhead
+PROMPT_RESERVED_TOKENS = 500
+
+# Analysis types whose results may be reused for similar (not identical) input
+# within the same exact scope; the rest only reuse byte-identical prompts
+SEMANTIC_CACHE_KINDS = ("standup", "backlog")
+SEMANTIC_CACHE_ENTRIES_PER_SCOPE = 8
+
 class StandupSummary(BaseModel):
     """Structured output for standup summaries."""
     summary: str = Field(description="Overall summary of the standup")
@@ -30,6 +56,15 @@ class StandupSummary(BaseModel):
     action_items: List[Dict[str, str]] = Field(description="Follow-up action items")
     team_sentiment: str = Field(description="Overall team sentiment: positive, neutral, concerned")
 
+class PartialStandupSummary(BaseModel):
+    """StandupSummary fields parsed so far from a streamed response; fields not yet started are None."""
+    summary: Optional[str] = None
+    key_achievements: Optional[List[str]] = None
+    today_focus: Optional[List[str]] = None
+    blockers: Optional[List[Dict[str, str]]] = None
+    action_items: Optional[List[Dict[str, str]]] = None
+    team_sentiment: Optional[str] = None
+
 class BacklogAnalysis(BaseModel):
     """Structured output for backlog item analysis."""
     clarity_score: float = Field(description="Clarity score from 0.0 to 1.0")
@@ -38,6 +73,10 @@ class BacklogAnalysis(BaseModel):
     potential_risks: List[str] = Field(description="Potential risks or blockers")
     acceptance_criteria_suggestions: List[str] = Field(description="Suggested acceptance criteria")
 
+class BulkBacklogAnalysis(BaseModel):
+    """Structured output for analyzing several backlog items in one call."""
+    analyses: List[BacklogAnalysis] = Field(description="One analysis per item, in the order given")
+
 class SprintPlanSuggestion(BaseModel):
     """Structured output for sprint planning suggestions."""
     recommended_items: List[int] = Field(description="Recommended backlog item IDs")
@@ -46,6 +85,59 @@ class SprintPlanSuggestion(BaseModel):
     risks: List[str] = Field(description="Identified risks or concerns")
     capacity_utilization: float = Field(description="Percentage of capacity utilized")
 
+# Result model requested from the chat model for each analysis type
+STRUCTURED_OUTPUT_MODELS: Dict[str, Type[BaseModel]] = {
+    "standup": StandupSummary,
+    "backlog": BacklogAnalysis,
+    "backlog_bulk": BulkBacklogAnalysis,
+    "sprint": SprintPlanSuggestion,
+}
+
+class IncrementalJSONParser:
+    """
+    Parses a JSON object out of streamed model output as the tokens arrive.
+    
+    Text before the opening brace (e.g. a markdown fence) is ignored. By
+    default the buffer is only re-parsed when a chunk closes a container, so
+    the object is complete as soon as its final brace is fed. With ``eager``
+    it is re-parsed on every chunk and unfinished strings are kept, so
+    callers can render fields while they are still being written.
+    """
+    
+    def __init__(self, eager: bool = False):
+        self.eager = eager
+        self._chunks: List[str] = []
+        self._buffer = bytearray()
+        self.value: Dict[str, Any] = {}
+    
+    @property
+    def text(self) -> str:
+        """Everything fed so far, including any text around the JSON."""
+        return "".join(self._chunks)
+    
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        """Add a streamed chunk and return the object parsed so far."""
+        self._chunks.append(chunk)
+        if not self._buffer:
+            start = chunk.find("{")
+            if start < 0:
+                return self.value
+            chunk = chunk[start:]
+        self._buffer += chunk.encode()
+        
+        if self.eager or "}" in chunk or "]" in chunk:
+            try:
+                parsed = jiter.from_json(
+                    bytes(self._buffer),
+                    partial_mode="trailing-strings" if self.eager else True
+                )
+            except ValueError:
+                # Trailing fence or prose after the object; keep the last good parse
+                return self.value
+            if isinstance(parsed, dict):
+                self.value = parsed
+        return self.value
+
 class AIService:
     """
     AI service for intelligent Scrum Master assistance.
@@ -53,36 +145,96 @@ class AIService:
     """
     
     def __init__(self):
-        # Only initialize OpenAI if API key is provided
-        if settings.OPENAI_API_KEY:
-            self.chat_model = ChatOpenAI(
-                model=settings.OPENAI_MODEL,
-                temperature=settings.OPENAI_TEMPERATURE,
-                max_tokens=settings.OPENAI_MAX_TOKENS,
-                openai_api_key=settings.OPENAI_API_KEY
-            )
-        else:
-            self.chat_model = None
-            logger.warning("OpenAI API key not provided. AI features will be disabled.")
+        # Model clients, the vector store and parsers are cached properties built on first use
+        self._skipped_context_lookups = Counter()
         
-        self.vector_service = VectorService()
+        # Prompt templates are static: compile them once
+        self._backlog_template = self._compile_template(
+            _backlog_analysis_system_prompt(), "{human_prompt}"
+        )
+        self._bulk_backlog_template = self._backlog_template
+        self._sprint_template = self._compile_template(
+            _sprint_planning_system_prompt(), "{human_prompt}"
+        )
         
-        # Output parsers for structured responses
-        self.standup_parser = PydanticOutputParser(pydantic_object=StandupSummary)
-        self.backlog_parser = PydanticOutputParser(pydantic_object=BacklogAnalysis)
-        self.sprint_parser = PydanticOutputParser(pydantic_object=SprintPlanSuggestion)
+        # Paces completions under the account's RPM/TPM quota and bounds those in flight
+        self._llm_queue = LLMQueue(
+            requests_per_minute=settings.OPENAI_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.OPENAI_TOKENS_PER_MINUTE,
+            max_concurrency=settings.OPENAI_MAX_CONCURRENCY
+        )
         
-        # Add fixing parsers to handle malformed outputs (only if chat model is available)
-        if self.chat_model:
-            self.standup_parser = OutputFixingParser.from_llm(
-                parser=self.standup_parser, llm=self.chat_model
-            )
-            self.backlog_parser = OutputFixingParser.from_llm(
-                parser=self.backlog_parser, llm=self.chat_model
-            )
-            self.sprint_parser = OutputFixingParser.from_llm(
-                parser=self.sprint_parser, llm=self.chat_model
+        # Parsed results of recent LLM calls. Semantic kinds keep a small
+        # SemanticCache per exact scope (team and day, backlog item); every kind
+        # also reuses results for byte-identical prompts.
+        self._semantic_caches = {
+            kind: LRUCache(maxsize=settings.LLM_SEMANTIC_CACHE_SIZE) for kind in SEMANTIC_CACHE_KINDS
+        }
+        self._exact_caches = {
+            kind: LRUCache(maxsize=settings.LLM_SEMANTIC_CACHE_SIZE) for kind in STRUCTURED_OUTPUT_MODELS
+        }
+
+    @cached_property
+    def chat_model(self) -> Optional[ChatOpenAI]:
+        """Chat model client, or None when no OpenAI API key is configured."""
+        if not settings.OPENAI_API_KEY:
+            logger.warning("OpenAI API key not provided. AI features will be disabled.")
+            return None
+        return ChatOpenAI(
+            model=settings.OPENAI_MODEL,
+            temperature=settings.OPENAI_TEMPERATURE,
+            max_tokens=settings.OPENAI_MAX_TOKENS,
+            openai_api_key=settings.OPENAI_API_KEY,
+            http_async_client=self._http_client
+        )
+
+    @cached_property
+    def _http_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP/2 client shared by every completion, so connections and TLS sessions are reused."""
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=settings.OPENAI_REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.OPENAI_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OPENAI_HTTP_MAX_KEEPALIVE
             )
+        )
+
+    async def aclose(self):
+        """Close the shared HTTP client if it was ever created."""
+        http_client = self.__dict__.pop("_http_client", None)
+        if http_client is not None:
+            await http_client.aclose()
+
+    @cached_property
+    def _structured_models(self) -> Dict[str, Any]:
+        """Chat model bound to each result schema, keyed by analysis type."""
+        if self.chat_model is None:
+            return {}
+        # The schema travels as a function definition, so prompts carry no format instructions
+        return {
+            kind: self.chat_model.with_structured_output(model_cls)
+            for kind, model_cls in STRUCTURED_OUTPUT_MODELS.items()
+        }
+
+    @cached_property
+    def vector_service(self) -> VectorService:
+        """Vector store used for prompt context and the semantic cache embeddings."""
+        return get_vector_service()
+
+    @cached_property
+    def _ctx_batcher(self) -> VectorContextBatcher:
+        return VectorContextBatcher(self.vector_service)
+
+    @cached_property
+    def standup_parser(self) -> PydanticOutputParser:
+        """Parser for streamed standup summaries, which are plain text."""
+        return PydanticOutputParser(pydantic_object=StandupSummary)
+
+    @cached_property
+    def _standup_format_instructions(self) -> str:
+        """Inline format instructions, needed only when streaming the standup summary."""
+        return self.standup_parser.get_format_instructions()
 
     async def generate_standup_summary(
         self, 
@@ -102,50 +254,268 @@ class AIService:
             Structured standup summary
         """
         try:
-            # Get relevant context from vector store
-            context = await self.vector_service.get_relevant_context(
-                f"standup team {team_context.get('name', '')} blockers progress",
-                limit=3
+            messages = await self._build_standup_messages(
+                standup_entries, team_context, jira_updates
             )
             
-            # Build the prompt
-            system_prompt = self._get_standup_system_prompt(team_context)
-            human_prompt = self._build_standup_human_prompt(
-                standup_entries, jira_updates, context
+            parsed_summary = await self._cached_llm_call(
+                "standup", messages,
+                scope=self._standup_cache_scope(standup_entries, team_context),
+                semantic_text=self._standup_entries_text(standup_entries)
             )
             
-            # Create prompt template
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", system_prompt),
-                ("human", human_prompt)
-            ])
+            logger.info(f"Generated standup summary for team {team_context.get('name')}")
+            return parsed_summary
             
-            # Format the prompt
-            formatted_prompt = prompt.format_prompt(
-                format_instructions=self.standup_parser.get_format_instructions()
+        except Exception as e:
+            logger.error(f"Failed to generate standup summary: {e}")
+            return self._fallback_standup_summary()
+
+    async def stream_standup_summary(
+        self, 
+        standup_entries: List[Dict[str, Any]], 
+        team_context: Dict[str, Any],
+        jira_updates: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the raw standup summary output token by token.
+        
+        Feed the chunks to an IncrementalJSONParser and finish with
+        standup_summary_from_stream once the stream is exhausted.
+        """
+        try:
+            messages = await self._build_standup_messages(
+                standup_entries, team_context, jira_updates, stream=True
             )
             
-            # Generate response
-            response = await self.chat_model.agenerate([formatted_prompt.to_messages()])
-            output = response.generations[0][0].text
-            
-            # Parse structured output
-            parsed_summary = self.standup_parser.parse(output)
+            async with self._llm_queue.slot(self._estimate_tokens(messages)):
+                async for chunk in self.chat_model.astream(messages):
+                    if chunk.content:
+                        yield chunk.content
             
-            logger.info(f"Generated standup summary for team {team_context.get('name')}")
-            return parsed_summary
+            logger.info(f"Streamed standup summary for team {team_context.get('name')}")
             
         except Exception as e:
-            logger.error(f"Failed to generate standup summary: {e}")
-            # Return fallback summary
-            return StandupSummary(
-                summary="Failed to generate AI summary. Please review standup entries manually.",
-                key_achievements=[],
-                today_focus=[],
-                blockers=[],
-                action_items=[],
-                team_sentiment="neutral"
+            logger.error(f"Failed to stream standup summary: {e}")
+
+    async def stream_standup_summary_partials(
+        self, 
+        standup_entries: List[Dict[str, Any]], 
+        team_context: Dict[str, Any],
+        jira_updates: Optional[List[Dict[str, Any]]] = None,
+        json_stream: Optional[IncrementalJSONParser] = None
+    ) -> AsyncIterator[Tuple[str, Optional[PartialStandupSummary]]]:
+        """
+        Stream the standup summary as (token, partial) pairs.
+        
+        ``partial`` holds the fields parsed so far, including partially written
+        strings, when the token changed them, and is None otherwise, so a UI
+        can render the summary progressively.
+        
+        Args:
+            json_stream: Eager parser to feed, so the caller can finish with
+                standup_summary_from_stream; a new one is used if None
+        """
+        if json_stream is None:
+            json_stream = IncrementalJSONParser(eager=True)
+        async for token in self.stream_standup_summary(standup_entries, team_context, jira_updates):
+            previous = json_stream.value
+            parsed = json_stream.feed(token)
+            partial = None
+            # Eager re-parses build a new dict even when nothing changed
+            if parsed != previous:
+                try:
+                    partial = PartialStandupSummary.model_validate(parsed)
+                except ValidationError:
+                    # A value of the wrong shape so far; later chunks usually settle it
+                    pass
+            yield token, partial
+
+    def standup_summary_from_stream(self, json_stream: IncrementalJSONParser) -> StandupSummary:
+        """Validate the object parsed while streaming, re-parsing the full text only if that fails."""
+        try:
+            return StandupSummary.model_validate(json_stream.value)
+        except ValidationError:
+            return self.parse_standup_summary(json_stream.text)
+
+    def parse_standup_summary(self, output: str) -> StandupSummary:
+        """Parse raw model output into a StandupSummary, falling back on failure."""
+        try:
+            return self._robust_parse(output, StandupSummary)
+        except Exception as e:
+            logger.error(f"Failed to parse standup summary: {e}")
+            return self._fallback_standup_summary()
+
+    async def _build_standup_messages(
+        self, 
+        standup_entries: List[Dict[str, Any]], 
+        team_context: Dict[str, Any],
+        jira_updates: Optional[List[Dict[str, Any]]],
+        stream: bool = False
+    ) -> List[BaseMessage]:
+        """Retrieve context and assemble the chat messages for a standup summary."""
+        # Get relevant context from vector store
+        context = await self._get_context(
+            "standup",
+            f"standup team {team_context.get('name', '')} blockers progress",
+            limit=3,
+            worthwhile=len(standup_entries) >= MIN_CONTEXT_STANDUP_ENTRIES
+        )
+        
+        human_prompt = self._build_standup_human_prompt(
+            standup_entries, jira_updates, context
+        )
+        if stream:
+            human_prompt = f"{human_prompt}\n{self._standup_format_instructions}"
+        return [
+            _standup_system_message(**self._get_standup_prompt_variables(team_context)),
+            HumanMessage(content=human_prompt)
+        ]
+
+    async def _get_context(self, kind: str, query: str, limit: int, worthwhile: bool) -> List[str]:
+        """Fetch vector context for a prompt, or nothing when the input is too thin to benefit."""
+        if not worthwhile:
+            self._skipped_context_lookups[kind] += 1
+            logger.debug(
+                f"Skipped {kind} context lookup for short input "
+                f"({self._skipped_context_lookups[kind]} skipped so far)"
             )
+            return []
+        return await self._ctx_batcher.get(query, limit=limit)
+
+    @staticmethod
+    def _estimate_tokens(messages: List[BaseMessage]) -> int:
+        """Prompt tokens plus the completion allowance, as counted against the TPM quota."""
+        encoding = _token_encoding(settings.OPENAI_MODEL)
+        prompt_tokens = sum(len(encoding.encode(str(message.content))) for message in messages)
+        return prompt_tokens + settings.OPENAI_MAX_TOKENS
+
+    @staticmethod
+    def _has_substantial_description(item: Dict[str, Any]) -> bool:
+        """Whether a backlog item says enough to find meaningfully similar context."""
+        return len(item.get('description') or '') >= MIN_CONTEXT_DESCRIPTION_LENGTH
+
+    @staticmethod
+    def _compile_template(system_prompt: str, human_template: str) -> ChatPromptTemplate:
+        """Build a chat template from a system prompt and a human message template."""
+        return ChatPromptTemplate.from_messages([
+            ("system", system_prompt),
+            ("human", human_template)
+        ])
+
+    async def _cached_llm_call(
+        self,
+        kind: str,
+        messages: List[BaseMessage],
+        scope: Optional[Hashable] = None,
+        semantic_text: Optional[str] = None
+    ) -> BaseModel:
+        """
+        Run the chat model with structured output, reusing earlier results.
+        
+        A byte-identical prompt under the same scope always reuses its result.
+        For semantic kinds with a scope, a result is also reused when
+        ``semantic_text`` embeds close to an earlier one in that scope. Only the
+        varying payload is embedded: the embedding model truncates long input,
+        and the static system prompt would otherwise crowd out the differences.
+        
+        Args:
+            kind: Analysis type; selects the result model and the cache
+            messages: Fully formatted prompt messages
+            scope: Exact-match part of the key (e.g. team and day, item id)
+            semantic_text: Varying payload to compare semantically within the scope
+            
+        Returns:
+            Parsed result, possibly from the cache
+        """
+        prompt_text = "\n".join(str(message.content) for message in messages)
+        exact_key = (scope, hashlib.sha256(prompt_text.encode()).hexdigest())
+        cached = self._exact_caches[kind].get(exact_key)
+        if cached is not None:
+            logger.info(f"Cache hit for identical {kind} prompt")
+            return cached
+        
+        semantic_cache = None
+        embedding = None
+        if scope is not None and semantic_text and kind in self._semantic_caches:
+            semantic_cache = self._semantic_caches[kind].get(scope)
+            try:
+                embedding = await asyncio.to_thread(self.vector_service.embed_text, semantic_text)
+            except Exception as e:
+                logger.warning(f"Skipping semantic cache for {kind}: {e}")
+        
+        if semantic_cache is not None and embedding is not None:
+            cached = semantic_cache.get(embedding)
+            if cached is not None:
+                logger.info(f"Semantic cache hit for {kind} prompt")
+                return cached
+        
+        parsed = await self._llm_queue.submit(
+            lambda: self._structured_models[kind].ainvoke(messages),
+            est_tokens=self._estimate_tokens(messages)
+        )
+        
+        # Only successful parses reach here, so fallbacks are never cached
+        self._exact_caches[kind][exact_key] = parsed
+        if embedding is not None:
+            if semantic_cache is None:
+                semantic_cache = self._semantic_caches[kind][scope] = SemanticCache(
+                    maxsize=SEMANTIC_CACHE_ENTRIES_PER_SCOPE,
+                    threshold=settings.LLM_SEMANTIC_CACHE_THRESHOLD,
+                    # Standup reruns repeat with small wording changes; backlog items
+                    # are analyzed individually, so their entries are never merged
+                    merge_threshold=(
+                        settings.LLM_SEMANTIC_CACHE_MERGE_THRESHOLD if kind == "standup" else None
+                    )
+                )
+            semantic_cache.put(embedding, parsed)
+        return parsed
+
+    @staticmethod
+    def _standup_cache_scope(
+        entries: List[Dict[str, Any]], team_context: Dict[str, Any]
+    ) -> Optional[Hashable]:
+        """Exact cache scope for a standup: team, day and who has posted."""
+        team_id = team_context.get('id')
+        if team_id is None:
+            return None
+        # A newly posted entry changes the scope even if it falls past the
+        # embedding model's input limit
+        users = tuple(sorted(str(entry.get('user', '')) for entry in entries))
+        return (team_id, datetime.now(timezone.utc).date(), users)
+
+    @staticmethod
+    def _standup_entries_text(entries: List[Dict[str, Any]]) -> str:
+        """The varying part of a standup prompt, for semantic comparison."""
+        return "\n".join(
+            f"{entry.get('user', '')}: {entry.get('yesterday_work') or ''} | "
+            f"{entry.get('today_plan') or ''} | {entry.get('blockers') or ''}"
+            for entry in entries
+        )
+
+    @staticmethod
+    def _robust_parse(output: str, model_cls: Type[BaseModel]) -> BaseModel:
+        """
+        Validate model output, repairing common JSON slips without another LLM call.
+        
+        Handles markdown fences, trailing commas, unquoted keys and truncated
+        objects. Raises ValidationError if the repaired JSON still doesn't fit.
+        """
+        try:
+            return model_cls.model_validate_json(output)
+        except ValidationError:
+            return model_cls.model_validate_json(repair_json(output))
+
+    def _fallback_standup_summary(self) -> StandupSummary:
+        """Summary returned when the AI summary could not be produced."""
+        return StandupSummary(
+            summary=FALLBACK_STANDUP_SUMMARY,
+            key_achievements=[],
+            today_focus=[],
+            blockers=[],
+            action_items=[],
+            team_sentiment="neutral"
+        )
 
     async def analyze_backlog_item(
         self, 
@@ -164,40 +534,148 @@ class AIService:
         """
         try:
             # Get relevant context from vector store
-            context = await self.vector_service.get_relevant_context(
+            context = await self._get_context(
+                "backlog",
                 f"user story {item.get('title', '')} {item.get('description', '')}",
-                limit=2
+                limit=2,
+                worthwhile=self._has_substantial_description(item)
             )
             
-            system_prompt = self._get_backlog_analysis_system_prompt()
             human_prompt = self._build_backlog_analysis_human_prompt(item, similar_items, context)
+            messages = self._backlog_template.format_messages(human_prompt=human_prompt)
             
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", system_prompt),
-                ("human", human_prompt)
-            ])
-            
-            formatted_prompt = prompt.format_prompt(
-                format_instructions=self.backlog_parser.get_format_instructions()
+            item_id = item.get('id')
+            parsed_analysis = await self._cached_llm_call(
+                "backlog", messages,
+                scope=("item", item_id) if item_id is not None else None,
+                semantic_text=f"{item.get('title', '')}\n{item.get('description') or ''}"
             )
             
-            response = await self.chat_model.agenerate([formatted_prompt.to_messages()])
-            output = response.generations[0][0].text
-            
-            parsed_analysis = self.backlog_parser.parse(output)
-            
             logger.info(f"Analyzed backlog item: {item.get('title', 'Unknown')}")
             return parsed_analysis
             
         except Exception as e:
             logger.error(f"Failed to analyze backlog item: {e}")
-            return BacklogAnalysis(
-                clarity_score=0.5,
-                suggested_improvements=["Unable to analyze - please review manually"],
-                estimated_complexity="M",
-                potential_risks=["Analysis failed"],
-                acceptance_criteria_suggestions=[]
+            return self._fallback_backlog_analysis()
+
+    async def analyze_backlog_items_bulk(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[BacklogAnalysis]:
+        """
+        Analyze many backlog items with one LLM call per batch.
+        
+        Items are packed into batches of at most BACKLOG_BULK_BATCH_SIZE items
+        and roughly OPENAI_MAX_TOKENS prompt tokens; batches run concurrently.
+        
+        Args:
+            items: Backlog items to analyze
+            
+        Returns:
+            One analysis per item, in input order
+        """
+        batches = self._batch_backlog_items(items)
+        results = await asyncio.gather(*(self._analyze_backlog_batch(batch) for batch in batches))
+        return [analysis for batch_result in results for analysis in batch_result]
+
+    async def _analyze_backlog_batch(self, items: List[Dict[str, Any]]) -> List[BacklogAnalysis]:
+        """Analyze one batch of backlog items in a single prompt."""
+        try:
+            titles = " ".join(item.get('title', '') for item in items)
+            context = await self._get_context(
+                "backlog_bulk",
+                f"user story {titles}",
+                limit=3,
+                worthwhile=any(self._has_substantial_description(item) for item in items)
+            )
+            
+            messages = self._bulk_backlog_template.format_messages(
+                human_prompt=self._build_bulk_backlog_analysis_human_prompt(items, context)
             )
+            
+            # Analyses are matched to items by position, so only an identical batch may reuse them
+            parsed = await self._cached_llm_call(
+                "backlog_bulk", messages, scope=tuple(item.get('id') for item in items)
+            )
+            if len(parsed.analyses) != len(items):
+                raise ValueError(f"expected {len(items)} analyses, got {len(parsed.analyses)}")
+            
+            logger.info(f"Analyzed batch of {len(items)} backlog items")
+            return parsed.analyses
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze backlog batch: {e}")
+            return [self._fallback_backlog_analysis() for _ in items]
+
+    def _batch_backlog_items(self, items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split items into batches bounded by item count and prompt token budget."""
+        encoding = _token_encoding(settings.OPENAI_MODEL)
+        batches: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_tokens = 0
+        
+        for item in items:
+            item_tokens = len(encoding.encode(
+                f"{item.get('title', '')} {item.get('description', '')} {item.get('acceptance_criteria', '')}"
+            ))
+            if current and (
+                len(current) >= settings.BACKLOG_BULK_BATCH_SIZE
+                or current_tokens + item_tokens > settings.OPENAI_MAX_TOKENS
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += item_tokens
+        
+        if current:
+            batches.append(current)
+        return batches
+
+    def _fallback_backlog_analysis(self) -> BacklogAnalysis:
+        """Analysis returned when the AI analysis could not be produced."""
+        return BacklogAnalysis(
+            clarity_score=0.5,
+            suggested_improvements=["Unable to analyze - please review manually"],
+            estimated_complexity="M",
+            potential_risks=["Analysis failed"],
+            acceptance_criteria_suggestions=[]
+        )
+
+    async def analyze_backlog_items(
+        self,
+        items: List[Dict[str, Any]],
+        similar_items: Optional[List[Dict[str, Any]]] = None
+    ) -> List[BacklogAnalysis]:
+        """Analyze several backlog items concurrently, preserving input order."""
+        return list(await asyncio.gather(
+            *(self.analyze_backlog_item(item, similar_items) for item in items)
+        ))
+
+    async def analyze_all(
+        self,
+        standup_entries: List[Dict[str, Any]],
+        team_context: Dict[str, Any],
+        backlog_items: List[Dict[str, Any]],
+        team_velocity: float,
+        capacity_days: float,
+        jira_updates: Optional[List[Dict[str, Any]]] = None,
+        sprint_goal_context: Optional[str] = None
+    ) -> Tuple[StandupSummary, List[BacklogAnalysis], SprintPlanSuggestion]:
+        """
+        Run the standup, backlog and sprint planning analyses concurrently.
+        
+        Each analysis falls back on its own failure, so one bad call doesn't
+        sink the others. Concurrency is capped by OPENAI_MAX_CONCURRENCY.
+        
+        Returns:
+            Standup summary, per-item backlog analyses and the sprint plan suggestion
+        """
+        standup, analyses, plan = await asyncio.gather(
+            self.generate_standup_summary(standup_entries, team_context, jira_updates),
+            self.analyze_backlog_items_bulk(backlog_items),
+            self.suggest_sprint_plan(backlog_items, team_velocity, capacity_days, sprint_goal_context)
+        )
+        return standup, analyses, plan
 
     async def suggest_sprint_plan(
         self,
@@ -220,29 +698,19 @@ class AIService:
         """
         try:
             # Get relevant context about past sprints
-            context = await self.vector_service.get_relevant_context(
+            context = await self._get_context(
+                "sprint",
                 f"sprint planning velocity {team_velocity} capacity",
-                limit=3
+                limit=3,
+                worthwhile=len(backlog_items) >= MIN_CONTEXT_SPRINT_ITEMS
             )
             
-            system_prompt = self._get_sprint_planning_system_prompt()
             human_prompt = self._build_sprint_planning_human_prompt(
                 backlog_items, team_velocity, capacity_days, sprint_goal_context, context
             )
+            messages = self._sprint_template.format_messages(human_prompt=human_prompt)
             
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", system_prompt),
-                ("human", human_prompt)
-            ])
-            
-            formatted_prompt = prompt.format_prompt(
-                format_instructions=self.sprint_parser.get_format_instructions()
-            )
-            
-            response = await self.chat_model.agenerate([formatted_prompt.to_messages()])
-            output = response.generations[0][0].text
-            
-            parsed_suggestion = self.sprint_parser.parse(output)
+            parsed_suggestion = await self._cached_llm_call("sprint", messages)
             
             logger.info(f"Generated sprint plan suggestion with {len(parsed_suggestion.recommended_items)} items")
             return parsed_suggestion
@@ -257,23 +725,14 @@ class AIService:
                 capacity_utilization=0.0
             )
 
-    def _get_standup_system_prompt(self, team_context: Dict[str, Any]) -> str:
-        """Build system prompt for standup summaries."""
-        tone = team_context.get('ai_tone', 'professional')
-        team_name = team_context.get('name', 'the team')
-        
-        return f"""You are an AI Scrum Master assistant helping {team_name}. 
-        Your role is to create concise, actionable daily standup summaries.
-        
-        Guidelines:
-        - Use a {tone} tone
-        - Focus on progress, blockers, and next steps
-        - Identify potential risks or dependencies
-        - Suggest concrete action items where helpful
-        - Maintain team anonymity unless specifically needed
-        - Be objective and supportive
-        
-        The summary will be shared with the team and stakeholders, so ensure it's clear and actionable."""
+    def _get_standup_prompt_variables(self, team_context: Dict[str, Any]) -> Dict[str, str]:
+        """Per-team values for the standup system prompt template."""
+        return {
+            "team_name": team_context.get('name', 'the team'),
+            "tone": team_context.get('ai_tone', 'professional'),
+            # Sorted keys keep the serialized context byte-identical between calls
+            "team_context": json.dumps(team_context, sort_keys=True, default=str),
+        }
 
     def _build_standup_human_prompt(
         self, 
@@ -281,53 +740,46 @@ class AIService:
         jira_updates: Optional[List[Dict[str, Any]]], 
         context: List[str]
     ) -> str:
-        """Build human prompt with standup data."""
-        prompt_parts = []
+        """Build human prompt with standup data, ending with today's entries."""
+        buf = io.StringIO()
+        
+        # Add Jira updates if available
+        if jira_updates:
+            buf.write("Jira ticket updates from yesterday:\n")
+            for update in jira_updates:
+                buf.write(f"- {update.get('key', 'Unknown')}: {update.get('summary', 'No summary')}\n")
+            buf.write("\n")
         
         # Add context if available
         if context:
-            prompt_parts.append("Relevant context from previous standups:")
+            buf.write("Relevant context from previous standups:\n")
             for ctx in context:
-                prompt_parts.append(f"- {ctx}")
-            prompt_parts.append("")
+                buf.write(f"- {ctx}\n")
+            buf.write("\n")
         
-        # Add standup entries
-        prompt_parts.append("Today's standup entries:")
-        for entry in entries:
+        # Add standup entries, stopping before the prompt outgrows the context window
+        buf.write("Today's standup entries:\n")
+        encoding = _token_encoding(settings.OPENAI_MODEL)
+        budget = _human_prompt_token_budget() - len(encoding.encode(buf.getvalue()))
+        for included, entry in enumerate(entries):
             user = entry.get('user', 'Team member')
-            prompt_parts.append(f"\n**{user}:**")
+            block = f"\n**{user}:**\n"
             if entry.get('yesterday_work'):
-                prompt_parts.append(f"Yesterday: {entry['yesterday_work']}")
+                block += f"Yesterday: {entry['yesterday_work']}\n"
             if entry.get('today_plan'):
-                prompt_parts.append(f"Today: {entry['today_plan']}")
+                block += f"Today: {entry['today_plan']}\n"
             if entry.get('blockers'):
-                prompt_parts.append(f"Blockers: {entry['blockers']}")
-        
-        # Add Jira updates if available
-        if jira_updates:
-            prompt_parts.append("\nJira ticket updates from yesterday:")
-            for update in jira_updates:
-                prompt_parts.append(f"- {update.get('key', 'Unknown')}: {update.get('summary', 'No summary')}")
-        
-        prompt_parts.append("\nGenerate a comprehensive standup summary following the specified format.")
-        prompt_parts.append("{format_instructions}")
-        
-        return "\n".join(prompt_parts)
-
-    def _get_backlog_analysis_system_prompt(self) -> str:
-        """Build system prompt for backlog analysis."""
-        return """You are an expert agile coach analyzing user stories and backlog items.
-        Your role is to assess clarity, identify improvements, and estimate complexity.
+                block += f"Blockers: {entry['blockers']}\n"
+            
+            budget -= len(encoding.encode(block))
+            if budget < 0:
+                logger.warning(f"Dropped {len(entries) - included} standup entries to fit the context window")
+                break
+            buf.write(block)
         
-        Guidelines:
-        - Evaluate description clarity and completeness
-        - Suggest specific improvements for unclear items
-        - Estimate complexity based on scope and technical requirements
-        - Identify potential risks or dependencies
-        - Suggest concrete acceptance criteria
-        - Use standard estimation scale: XS, S, M, L, XL
+        buf.write("\nGenerate a comprehensive standup summary following the specified format.")
         
-        Be constructive and specific in your feedback."""
+        return buf.getvalue()
 
     def _build_backlog_analysis_human_prompt(
         self, 
@@ -336,51 +788,65 @@ class AIService:
         context: List[str]
     ) -> str:
         """Build human prompt for backlog item analysis."""
-        prompt_parts = []
+        buf = io.StringIO()
         
         # Add context
         if context:
-            prompt_parts.append("Relevant context from similar items:")
+            buf.write("Relevant context from similar items:\n")
             for ctx in context:
-                prompt_parts.append(f"- {ctx}")
-            prompt_parts.append("")
+                buf.write(f"- {ctx}\n")
+            buf.write("\n")
         
         # Add item details
-        prompt_parts.append("Backlog item to analyze:")
-        prompt_parts.append(f"Title: {item.get('title', 'No title')}")
-        prompt_parts.append(f"Description: {item.get('description', 'No description')}")
+        buf.write("Backlog item to analyze:\n")
+        buf.write(f"Title: {item.get('title', 'No title')}\n")
+        buf.write(f"Description: {item.get('description', 'No description')}\n")
         
         if item.get('acceptance_criteria'):
-            prompt_parts.append(f"Acceptance Criteria: {item['acceptance_criteria']}")
+            buf.write(f"Acceptance Criteria: {item['acceptance_criteria']}\n")
         
         if item.get('story_points'):
-            prompt_parts.append(f"Current Story Points: {item['story_points']}")
+            buf.write(f"Current Story Points: {item['story_points']}\n")
         
         # Add similar items for reference
         if similar_items:
-            prompt_parts.append("\nSimilar items for reference:")
+            buf.write("\nSimilar items for reference:\n")
             for similar in similar_items[:3]:  # Limit to 3 for brevity
-                prompt_parts.append(f"- {similar.get('title', 'Unknown')}: {similar.get('story_points', 'No points')} points")
+                buf.write(f"- {similar.get('title', 'Unknown')}: {similar.get('story_points', 'No points')} points\n")
         
-        prompt_parts.append("\nAnalyze this item following the specified format.")
-        prompt_parts.append("{format_instructions}")
+        buf.write("\nAnalyze this item following the specified format.")
         
-        return "\n".join(prompt_parts)
+        return buf.getvalue()
 
-    def _get_sprint_planning_system_prompt(self) -> str:
-        """Build system prompt for sprint planning."""
-        return """You are an expert Scrum Master helping with sprint planning.
-        Your role is to recommend optimal backlog items for the sprint based on capacity and priorities.
+    def _build_bulk_backlog_analysis_human_prompt(
+        self,
+        items: List[Dict[str, Any]],
+        context: List[str]
+    ) -> str:
+        """Build human prompt analyzing a numbered list of backlog items."""
+        buf = io.StringIO()
         
-        Guidelines:
-        - Consider team velocity and capacity constraints
-        - Prioritize high-value, well-defined items
-        - Ensure sprint goal coherence
-        - Identify risks and dependencies
-        - Aim for 80-90% capacity utilization for sustainable pace
-        - Consider item complexity and team skills
+        if context:
+            buf.write("Relevant context from similar items:\n")
+            for ctx in context:
+                buf.write(f"- {ctx}\n")
+            buf.write("\n")
         
-        Provide realistic recommendations that promote team success."""
+        buf.write(f"Backlog items to analyze ({len(items)}):\n")
+        for i, item in enumerate(items, 1):
+            buf.write(f"\n{i}. Title: {item.get('title', 'No title')}\n")
+            buf.write(f"   Description: {item.get('description', 'No description')}\n")
+            if item.get('acceptance_criteria'):
+                buf.write(f"   Acceptance Criteria: {item['acceptance_criteria']}\n")
+            if item.get('story_points'):
+                buf.write(f"   Current Story Points: {item['story_points']}\n")
+        
+        buf.write(
+            f"\nReturn exactly {len(items)} analyses, one per item, in the same order, "
+            "following the specified format."
+        )
+        
+        return buf.getvalue()
 
     def _build_sprint_planning_human_prompt(
         self,
@@ -391,41 +857,124 @@ class AIService:
         context: List[str]
     ) -> str:
         """Build human prompt for sprint planning."""
-        prompt_parts = []
+        buf = io.StringIO()
         
         # Add context
         if context:
-            prompt_parts.append("Context from previous sprints:")
+            buf.write("Context from previous sprints:\n")
             for ctx in context:
-                prompt_parts.append(f"- {ctx}")
-            prompt_parts.append("")
+                buf.write(f"- {ctx}\n")
+            buf.write("\n")
         
         # Add team capacity info
-        prompt_parts.append("Team capacity information:")
-        prompt_parts.append(f"- Average velocity: {team_velocity} story points")
-        prompt_parts.append(f"- Available capacity: {capacity_days} person-days")
+        buf.write("Team capacity information:\n")
+        buf.write(f"- Average velocity: {team_velocity} story points\n")
+        buf.write(f"- Available capacity: {capacity_days} person-days\n")
         
         if sprint_goal_context:
-            prompt_parts.append(f"- Sprint goal context: {sprint_goal_context}")
+            buf.write(f"- Sprint goal context: {sprint_goal_context}\n")
         
-        # Add backlog items
-        prompt_parts.append("\nAvailable backlog items (ordered by priority):")
+        # Add backlog items; they're priority-ordered, so the lowest priorities are dropped first
+        buf.write("\nAvailable backlog items (ordered by priority):\n")
+        encoding = _token_encoding(settings.OPENAI_MODEL)
+        budget = _human_prompt_token_budget() - len(encoding.encode(buf.getvalue()))
         for i, item in enumerate(backlog_items, 1):
             points = item.get('story_points', 'No estimate')
             priority = item.get('priority', 'medium')
-            prompt_parts.append(
+            line = (
                 f"{i}. [{item.get('id')}] {item.get('title', 'No title')} "
-                f"({points} points, {priority} priority)"
+                f"({points} points, {priority} priority)\n"
             )
-            if item.get('description'):
+            description = item.get('description')
+            if description:
                 # Truncate long descriptions
-                desc = item['description'][:100] + "..." if len(item['description']) > 100 else item['description']
-                prompt_parts.append(f"   Description: {desc}")
+                line += f"   Description: {description[:100]}{'...' if len(description) > 100 else ''}\n"
+            
+            budget -= len(encoding.encode(line))
+            if budget < 0:
+                logger.warning(f"Dropped {len(backlog_items) - i + 1} backlog items to fit the context window")
+                break
+            buf.write(line)
+        
+        buf.write("\nRecommend items for the sprint following the specified format.")
+        
+        return buf.getvalue()
+
+@lru_cache(maxsize=1)
+def _standup_system_prompt() -> str:
+    """
+    System prompt template for standup summaries.
+    
+    Everything here is static per team so it forms a stable prompt prefix
+    the provider can cache across days; per-day data goes in the human prompt.
+    """
+    return """You are an AI Scrum Master assistant helping {team_name}. 
+        Your role is to create concise, actionable daily standup summaries.
+        
+        Guidelines:
+        - Use a {tone} tone
+        - Focus on progress, blockers, and next steps
+        - Identify potential risks or dependencies
+        - Suggest concrete action items where helpful
+        - Maintain team anonymity unless specifically needed
+        - Be objective and supportive
+        
+        The summary will be shared with the team and stakeholders, so ensure it's clear and actionable.
+        
+        Team context: {team_context}"""
+
+@lru_cache(maxsize=1)
+def _backlog_analysis_system_prompt() -> str:
+    """Build system prompt for backlog analysis."""
+    return """You are an expert agile coach analyzing user stories and backlog items.
+        Your role is to assess clarity, identify improvements, and estimate complexity.
+        
+        Guidelines:
+        - Evaluate description clarity and completeness
+        - Suggest specific improvements for unclear items
+        - Estimate complexity based on scope and technical requirements
+        - Identify potential risks or dependencies
+        - Suggest concrete acceptance criteria
+        - Use standard estimation scale: XS, S, M, L, XL
+        
+        Be constructive and specific in your feedback."""
+
+@lru_cache(maxsize=1)
+def _sprint_planning_system_prompt() -> str:
+    """Build system prompt for sprint planning."""
+    return """You are an expert Scrum Master helping with sprint planning.
+        Your role is to recommend optimal backlog items for the sprint based on capacity and priorities.
         
-        prompt_parts.append("\nRecommend items for the sprint following the specified format.")
-        prompt_parts.append("{format_instructions}")
+        Guidelines:
+        - Consider team velocity and capacity constraints
+        - Prioritize high-value, well-defined items
+        - Ensure sprint goal coherence
+        - Identify risks and dependencies
+        - Aim for 80-90% capacity utilization for sustainable pace
+        - Consider item complexity and team skills
         
-        return "\n".join(prompt_parts)
+        Provide realistic recommendations that promote team success."""
+
+@lru_cache(maxsize=32)
+def _standup_system_message(team_name: str, tone: str, team_context: str) -> SystemMessage:
+    """Rendered standup system message; identical for every run of a team, so it's reused."""
+    return SystemMessage(content=_standup_system_prompt().format(
+        team_name=team_name, tone=tone, team_context=team_context
+    ))
+
+def _human_prompt_token_budget() -> int:
+    """Tokens available to a human prompt after the completion allowance and reserved overhead."""
+    return settings.OPENAI_CONTEXT_WINDOW - settings.OPENAI_MAX_TOKENS - PROMPT_RESERVED_TOKENS
+
+@lru_cache(maxsize=None)
+def _token_encoding(model: str) -> tiktoken.Encoding:
+    """Tokenizer for the configured model, falling back for models tiktoken doesn't know."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
 
-# Global AI service instance
-ai_service = AIService()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_ai_service() -> AIService:
+    """Shared AIService instance; inject with Depends(get_ai_service)."""
+    return AIService()
\ No newline at end of file
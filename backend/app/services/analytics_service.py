@@ -4,24 +4,122 @@ Analytics Service for Sprint Metrics and Burndown Charts.
 This service handles velocity tracking, burndown chart generation,
 and sprint analytics for the AI Scrum Master.
 """
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta, date
 from dataclasses import dataclass
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy.orm import Session, lazyload, load_only
+from sqlalchemy import event, func, and_, or_, case, insert, inspect
+from cachetools import TTLCache
 
-from app.core.database import get_db
-from app.models.sprint import Sprint
+from app.core.cache import async_cached
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.sprint import Sprint, SprintDailySnapshot
 from app.models.backlog_item import BacklogItem
 from app.models.standup import StandupEntry
 from app.models.team import Team
 from app.models.project import Project
+from app.models.enums import DONE_STATUSES, SprintStatus
 from app.services.jira_service import jira_service
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Dashboards poll the same sprint every few seconds; keep its metrics briefly.
+# ORM writes to sprints and backlog items invalidate the entry (see listeners below),
+# bulk query.update()/delete() calls don't and are covered by the TTL.
+sprint_metrics_cache: TTLCache = TTLCache(maxsize=512, ttl=60)
+
+# Final answers of read-only agent runs about a sprint (see
+# ScrumMasterAgent.process_request), keyed by sprint ID and then request text.
+# They are built from the same figures, so they are invalidated with them.
+sprint_agent_response_cache: TTLCache = TTLCache(
+    maxsize=256, ttl=max(settings.AGENT_RESPONSE_CACHE_TTL_SECONDS, 1)
+)
+
+def _invalidate_sprint(sprint_id: int) -> None:
+    sprint_metrics_cache.pop(sprint_id, None)
+    sprint_agent_response_cache.pop(sprint_id, None)
+
+@event.listens_for(Sprint, "after_insert")
+@event.listens_for(Sprint, "after_update")
+@event.listens_for(Sprint, "after_delete")
+def _invalidate_sprint_metrics(mapper, connection, target):
+    _invalidate_sprint(target.id)
+
+@event.listens_for(BacklogItem, "after_insert")
+@event.listens_for(BacklogItem, "after_update")
+@event.listens_for(BacklogItem, "after_delete")
+def _invalidate_backlog_item_sprint_metrics(mapper, connection, target):
+    # An item moved between sprints affects both the old and the new sprint
+    history = inspect(target).attrs.sprint_id.history
+    for sprint_id in (target.sprint_id, *history.deleted):
+        if sprint_id is not None:
+            _invalidate_sprint(sprint_id)
+
+def _story_point_sums():
+    """SUM expressions for (total, completed) story points over backlog items."""
+    return (
+        # The id check keeps the empty row of an outer join from counting as a default-sized item
+        func.coalesce(func.sum(case(
+            (BacklogItem.id.is_not(None), BacklogItem.effort_estimate_numeric)
+        )), 0),
+        func.coalesce(func.sum(case(
+            (BacklogItem.status.in_(DONE_STATUSES), BacklogItem.effort_estimate_numeric),
+            else_=0
+        )), 0),
+    )
+
+@lru_cache(maxsize=256)
+def _ideal_remaining(total_points: int, sprint_days: int, num_days: int) -> np.ndarray:
+    """
+    Ideal (linear) remaining points for the first ``num_days`` days of a sprint.
+
+    A pure function of the sprint's shape, so it is memoized; the array is
+    read-only because it is shared between callers.
+    """
+    days = np.arange(num_days)
+    ideal = np.maximum(0, total_points - total_points * days / sprint_days).astype(int)
+    ideal.flags.writeable = False
+    return ideal
+
+# Per-sprint change in velocity (points/day) below which the trend counts as stable
+VELOCITY_TREND_TOLERANCE = 0.1
+
+def velocity_trend(velocities: Sequence[float]) -> str:
+    """
+    Classify the velocity trend from the least-squares slope across sprints.
+
+    Args:
+        velocities: Sprint velocities newest first, as returned by
+            get_team_velocity_history (ordered by end_date descending)
+
+    Returns:
+        "improving", "declining" or "stable"
+    """
+    if len(velocities) < 2:
+        return "stable"
+    # Fit oldest to newest so a positive slope means velocity is going up
+    slope = np.polyfit(np.arange(len(velocities)), np.asarray(velocities, dtype=float)[::-1], 1)[0]
+    if slope > VELOCITY_TREND_TOLERANCE:
+        return "improving"
+    if slope < -VELOCITY_TREND_TOLERANCE:
+        return "declining"
+    return "stable"
+
+# Sprint report insight messages
+INSIGHT_HIGH_COMPLETION = "🎯 Sprint is performing well with high completion rate"
+INSIGHT_LOW_COMPLETION = "⚠️ Sprint completion rate is below expectations"
+INSIGHT_AT_RISK = "📅 Sprint may miss deadline based on current progress"
+INSIGHT_ON_TRACK = "✅ Sprint is on track to meet its goals"
+INSIGHT_VELOCITY_ABOVE_AVERAGE = "🚀 Team velocity is above historical average"
+INSIGHT_VELOCITY_BELOW_AVERAGE = "🐌 Team velocity is below historical average"
+INSIGHT_VELOCITY_INCREASE_NEEDED = "⚡ Remaining work requires increased daily velocity"
+
+@dataclass(slots=True, frozen=True)
 class BurndownPoint:
     """Data point for burndown chart."""
     date: date
@@ -29,7 +127,7 @@ class BurndownPoint:
     ideal_remaining: int
     completed_points: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VelocityData:
     """Velocity tracking data."""
     sprint_name: str
@@ -40,11 +138,12 @@ class VelocityData:
     start_date: date
     end_date: date
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SprintMetrics:
     """Complete sprint metrics."""
     sprint_id: int
     sprint_name: str
+    team_id: int
     team_name: str
     start_date: date
     end_date: date
@@ -59,65 +158,55 @@ class SprintMetrics:
     is_on_track: bool
 
 class AnalyticsService:
-    """Service for generating sprint analytics and burndown charts."""
-    
-    def __init__(self):
-        self.db = next(get_db())
+    """
+    Service for generating sprint analytics and burndown charts.
+
+    Stateless; callers pass in their own (request-scoped) database session.
+    """
     
-    async def get_sprint_metrics(self, sprint_id: int) -> Optional[SprintMetrics]:
+    @async_cached(sprint_metrics_cache, key=lambda self, db, sprint_id: sprint_id)
+    async def get_sprint_metrics(self, db: Session, sprint_id: int) -> Optional[SprintMetrics]:
         """Get comprehensive metrics for a sprint."""
         try:
-            # Get sprint data
-            sprint = self.db.query(Sprint).filter(Sprint.id == sprint_id).first()
-            if not sprint:
+            # Blocking SQLAlchemy calls run in a worker thread to keep the event loop free
+            loaded = await asyncio.to_thread(self._load_sprint_totals, db, sprint_id)
+            if not loaded:
                 logger.error(f"Sprint {sprint_id} not found")
                 return None
-            
-            # Get team data
-            team = self.db.query(Team).filter(Team.id == sprint.team_id).first()
-            team_name = team.name if team else "Unknown Team"
-            
-            # Get backlog items in this sprint
-            backlog_items = self.db.query(BacklogItem).filter(
-                BacklogItem.sprint_id == sprint_id
-            ).all()
-            
-            # Calculate story points
-            total_points = sum(item.effort_estimate_numeric or 0 for item in backlog_items)
-            completed_points = sum(
-                item.effort_estimate_numeric or 0 
-                for item in backlog_items 
-                if item.status in ['Done', 'Completed', 'Closed']
-            )
+            sprint, team_name, total_points, completed_points, snapshots = loaded
             remaining_points = total_points - completed_points
             
+            # One reading of the clock for the whole request, so every figure agrees
+            # even if it straddles midnight
+            today = date.today()
+            
             # Calculate velocity (completed points over sprint duration)
             sprint_days = (sprint.end_date - sprint.start_date).days + 1
             velocity = completed_points / sprint_days if sprint_days > 0 else 0
             
             # Generate burndown data
-            burndown_data = await self._generate_burndown_data(sprint, backlog_items)
+            burndown_data = self._generate_burndown_data(sprint, total_points, completed_points, today, snapshots)
             
             # Calculate completion percentage
             completion_pct = (completed_points / total_points * 100) if total_points > 0 else 0
             
             # Calculate days remaining
-            today = date.today()
-            days_remaining = max(0, (sprint.end_date - today).days)
+            days_remaining = max(0, (sprint.end_date.date() - today).days)
             
             # Predict completion date based on current velocity
-            predicted_completion = await self._predict_completion_date(
+            predicted_completion = self._predict_completion_date(
                 remaining_points, velocity, today
             )
             
             # Determine if sprint is on track
-            is_on_track = await self._is_sprint_on_track(
+            is_on_track = self._is_sprint_on_track(
                 sprint, completion_pct, days_remaining
             )
             
             return SprintMetrics(
                 sprint_id=sprint.id,
                 sprint_name=sprint.name,
+                team_id=sprint.team_id,
                 team_name=team_name,
                 start_date=sprint.start_date,
                 end_date=sprint.end_date,
@@ -136,49 +225,89 @@ class AnalyticsService:
             logger.error(f"Failed to get sprint metrics: {e}")
             return None
     
-    async def _generate_burndown_data(self, sprint: Sprint, backlog_items: List[BacklogItem]) -> List[BurndownPoint]:
-        """Generate burndown chart data points."""
-        burndown_points = []
+    def _load_sprint_totals(
+        self, db: Session, sprint_id: int
+    ) -> Optional[Tuple[Sprint, str, int, int, List[Tuple[date, int, int]]]]:
+        """Load a sprint with its team name, (total, completed) story points and daily snapshots."""
+        # Get sprint data with its team name in one round-trip; only the columns the
+        # metrics use, and none of the eagerly loaded relationships (backlog_items
+        # is selectin by default)
+        row = db.query(Sprint, Team.name).outerjoin(
+            Team, Team.id == Sprint.team_id
+        ).options(
+            load_only(Sprint.id, Sprint.name, Sprint.team_id, Sprint.start_date, Sprint.end_date),
+            lazyload("*")
+        ).filter(Sprint.id == sprint_id).first()
+        if not row:
+            return None
+        sprint, team_name = row
+        team_name = team_name or "Unknown Team"
+        
+        # Sum story points in the database rather than loading every item
+        total_points, completed_points = db.query(*_story_point_sums()).filter(
+            BacklogItem.sprint_id == sprint_id
+        ).one()
         
+        # Recorded (date, remaining, completed) history for the burndown
+        snapshots = db.query(
+            SprintDailySnapshot.snapshot_date,
+            SprintDailySnapshot.remaining_points,
+            SprintDailySnapshot.completed_points
+        ).filter(SprintDailySnapshot.sprint_id == sprint_id).all()
+        return sprint, team_name, total_points, completed_points, snapshots
+    
+    def _generate_burndown_data(
+        self,
+        sprint: Sprint,
+        total_points: int,
+        total_completed: int,
+        today: date,
+        snapshots: Sequence[Tuple[date, int, int]] = ()
+    ) -> List[BurndownPoint]:
+        """
+        Generate burndown chart data points.
+
+        Days with a recorded snapshot use it; days without one (before
+        snapshots were being taken) fall back to a linear estimate.
+        """
         try:
-            total_points = sum(item.effort_estimate_numeric or 0 for item in backlog_items)
-            sprint_days = (sprint.end_date - sprint.start_date).days + 1
+            # Sprint dates are stored as timestamps, the chart is per calendar day
+            start_date = sprint.start_date.date()
+            last_date = min(sprint.end_date.date(), today)
+            sprint_days = (sprint.end_date.date() - start_date).days + 1
+            days_to_today = (today - start_date).days
+            
+            # One vectorized pass over the sprint days instead of per-day scalar arithmetic
+            days = np.arange((last_date - start_date).days + 1)
+            ideal_remaining = _ideal_remaining(total_points, sprint_days, len(days))
+            
+            # Estimate historical completion (linear approximation) for days without a snapshot
+            if days_to_today > 0:
+                completed_by_date = (total_completed * np.minimum(1.0, days / days_to_today)).astype(int)
+            else:
+                completed_by_date = np.zeros(len(days), dtype=int)
+            if last_date == today and len(days):
+                completed_by_date[-1] = total_completed
+            remaining_points = total_points - completed_by_date
             
-            current_date = sprint.start_date
-            while current_date <= min(sprint.end_date, date.today()):
-                # Calculate ideal remaining (linear burndown)
-                days_elapsed = (current_date - sprint.start_date).days
-                ideal_remaining = max(0, total_points - (total_points * days_elapsed / sprint_days))
-                
-                # Calculate actual completed points by this date
-                # Note: In a real implementation, you'd track daily completion
-                # For now, we'll estimate based on current completion
-                if current_date == date.today():
-                    completed_by_date = sum(
-                        item.effort_estimate_numeric or 0 
-                        for item in backlog_items 
-                        if item.status in ['Done', 'Completed', 'Closed']
-                    )
-                else:
-                    # Estimate historical completion (linear approximation)
-                    total_completed = sum(
-                        item.effort_estimate_numeric or 0 
-                        for item in backlog_items 
-                        if item.status in ['Done', 'Completed', 'Closed']
-                    )
-                    completion_ratio = min(1.0, days_elapsed / (date.today() - sprint.start_date).days) if (date.today() - sprint.start_date).days > 0 else 0
-                    completed_by_date = int(total_completed * completion_ratio)
-                
-                remaining_points = total_points - completed_by_date
-                
-                burndown_points.append(BurndownPoint(
-                    date=current_date,
-                    remaining_points=remaining_points,
-                    ideal_remaining=int(ideal_remaining),
-                    completed_points=completed_by_date
-                ))
-                
-                current_date += timedelta(days=1)
+            # Overlay recorded history; today always reflects the live totals above
+            if snapshots:
+                offsets = np.array([(snapshot_date - start_date).days for snapshot_date, _, _ in snapshots])
+                recorded = (offsets >= 0) & (offsets < len(days)) & (offsets != days_to_today)
+                completed_by_date[offsets[recorded]] = np.array([completed for _, _, completed in snapshots])[recorded]
+                remaining_points[offsets[recorded]] = np.array([remaining for _, remaining, _ in snapshots])[recorded]
+            
+            burndown_points = [
+                BurndownPoint(
+                    date=start_date + timedelta(days=day),
+                    remaining_points=remaining,
+                    ideal_remaining=ideal,
+                    completed_points=completed
+                )
+                for day, remaining, ideal, completed in zip(
+                    days.tolist(), remaining_points.tolist(), ideal_remaining.tolist(), completed_by_date.tolist()
+                )
+            ]
             
             return burndown_points
             
@@ -186,7 +315,60 @@ class AnalyticsService:
             logger.error(f"Failed to generate burndown data: {e}")
             return []
     
-    async def _predict_completion_date(self, remaining_points: int, current_velocity: float, today: date) -> Optional[date]:
+    def record_daily_snapshots(self, db: Session, snapshot_date: Optional[date] = None) -> int:
+        """
+        Store the current burndown position of every active sprint.
+
+        Idempotent per day: re-running replaces that day's rows, so the last
+        run of a day leaves its end-of-day figures.
+
+        Args:
+            db: Database session
+            snapshot_date: Day to record; defaults to today
+
+        Returns:
+            Number of sprints snapshotted
+        """
+        snapshot_date = snapshot_date or date.today()
+        rows = db.query(Sprint.id, *_story_point_sums()).outerjoin(
+            BacklogItem, BacklogItem.sprint_id == Sprint.id
+        ).filter(
+            Sprint.status == SprintStatus.ACTIVE
+        ).group_by(Sprint.id).all()
+        if not rows:
+            return 0
+        
+        db.query(SprintDailySnapshot).filter(
+            SprintDailySnapshot.snapshot_date == snapshot_date,
+            SprintDailySnapshot.sprint_id.in_([sprint_id for sprint_id, _, _ in rows])
+        ).delete(synchronize_session=False)
+        db.execute(insert(SprintDailySnapshot), [
+            {
+                "sprint_id": sprint_id,
+                "snapshot_date": snapshot_date,
+                "remaining_points": total_points - completed_points,
+                "completed_points": completed_points
+            }
+            for sprint_id, total_points, completed_points in rows
+        ])
+        db.commit()
+        return len(rows)
+    
+    async def run_snapshot_loop(self, interval_seconds: int) -> None:
+        """Refresh today's burndown snapshots every ``interval_seconds`` until cancelled."""
+        def record() -> int:
+            with SessionLocal() as db:
+                return self.record_daily_snapshots(db)
+        
+        while True:
+            try:
+                count = await asyncio.to_thread(record)
+                logger.info(f"Recorded burndown snapshots for {count} active sprints")
+            except Exception as e:
+                logger.error(f"Failed to record burndown snapshots: {e}")
+            await asyncio.sleep(interval_seconds)
+    
+    def _predict_completion_date(self, remaining_points: int, current_velocity: float, today: date) -> Optional[date]:
         """Predict sprint completion date based on current velocity."""
         if current_velocity <= 0 or remaining_points <= 0:
             return None
@@ -196,7 +378,7 @@ class AnalyticsService:
         
         return predicted_date
     
-    async def _is_sprint_on_track(self, sprint: Sprint, completion_pct: float, days_remaining: int) -> bool:
+    def _is_sprint_on_track(self, sprint: Sprint, completion_pct: float, days_remaining: int) -> bool:
         """Determine if sprint is on track based on completion vs time remaining."""
         total_days = (sprint.end_date - sprint.start_date).days + 1
         days_elapsed = total_days - days_remaining
@@ -205,58 +387,67 @@ class AnalyticsService:
         # Sprint is on track if actual completion is within 10% of expected
         return abs(completion_pct - expected_completion) <= 10
     
-    async def get_team_velocity_history(self, team_id: int, num_sprints: int = 5) -> List[VelocityData]:
+    async def get_team_velocity_history(self, db: Session, team_id: int, num_sprints: int = 5) -> List[VelocityData]:
         """Get velocity history for a team."""
         try:
-            # Get recent sprints for the team
-            sprints = self.db.query(Sprint).filter(
+            # Recent completed sprints with their story point sums, in one round-trip
+            query = db.query(
+                Sprint.name, Sprint.start_date, Sprint.end_date, *_story_point_sums()
+            ).outerjoin(
+                BacklogItem, BacklogItem.sprint_id == Sprint.id
+            ).filter(
                 Sprint.team_id == team_id,
-                Sprint.status.in_(['Completed', 'Closed'])
-            ).order_by(Sprint.end_date.desc()).limit(num_sprints).all()
+                Sprint.status == SprintStatus.COMPLETED
+            ).group_by(Sprint.id).order_by(Sprint.end_date.desc()).limit(num_sprints)
+            rows = await asyncio.to_thread(query.all)
             
-            velocity_data = []
+            if not rows:
+                return []
             
-            for sprint in sprints:
-                # Get backlog items for this sprint
-                backlog_items = self.db.query(BacklogItem).filter(
-                    BacklogItem.sprint_id == sprint.id
-                ).all()
-                
-                planned_points = sum(item.effort_estimate_numeric or 0 for item in backlog_items)
-                completed_items = [item for item in backlog_items if item.status in ['Done', 'Completed', 'Closed']]
-                completed_points = sum(item.effort_estimate_numeric or 0 for item in completed_items)
-                spillover_points = planned_points - completed_points
-                
-                sprint_days = (sprint.end_date - sprint.start_date).days + 1
-                velocity = completed_points / sprint_days if sprint_days > 0 else 0
-                
-                velocity_data.append(VelocityData(
-                    sprint_name=sprint.name,
-                    planned_points=planned_points,
-                    completed_points=completed_points,
-                    spillover_points=spillover_points,
-                    velocity=velocity,
-                    start_date=sprint.start_date,
-                    end_date=sprint.end_date
-                ))
+            # Velocity arithmetic for all sprints at once
+            names, start_dates, end_dates, planned, completed = zip(*rows)
+            planned_points = np.array(planned, dtype=int)
+            completed_points = np.array(completed, dtype=int)
+            sprint_days = np.array([(end - start).days + 1 for start, end in zip(start_dates, end_dates)])
+            velocities = np.divide(
+                completed_points, sprint_days,
+                out=np.zeros(len(rows)), where=sprint_days > 0
+            )
+            spillover_points = planned_points - completed_points
             
-            return velocity_data
+            return [
+                VelocityData(
+                    sprint_name=name,
+                    planned_points=planned_total,
+                    completed_points=completed_total,
+                    spillover_points=spillover,
+                    velocity=velocity,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                for name, planned_total, completed_total, spillover, velocity, start_date, end_date in zip(
+                    names, planned_points.tolist(), completed_points.tolist(), spillover_points.tolist(),
+                    velocities.tolist(), start_dates, end_dates
+                )
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get velocity history: {e}")
             return []
     
-    async def get_burndown_chart_data(self, sprint_id: int) -> Dict[str, Any]:
+    async def get_burndown_chart_data(self, db: Session, sprint_id: int) -> Dict[str, Any]:
         """Get burndown chart data formatted for frontend visualization."""
         try:
-            metrics = await self.get_sprint_metrics(sprint_id)
+            metrics = await self.get_sprint_metrics(db, sprint_id)
             if not metrics:
                 return {"error": "Sprint not found"}
             
             # Format data for Chart.js or similar
-            dates = [point.date.isoformat() for point in metrics.burndown_data]
-            remaining_points = [point.remaining_points for point in metrics.burndown_data]
-            ideal_points = [point.ideal_remaining for point in metrics.burndown_data]
+            dates, remaining_points, ideal_points = [], [], []
+            for point in metrics.burndown_data:
+                dates.append(point.date.isoformat())
+                remaining_points.append(point.remaining_points)
+                ideal_points.append(point.ideal_remaining)
             
             return {
                 "sprint_name": metrics.sprint_name,
@@ -292,18 +483,22 @@ class AnalyticsService:
             logger.error(f"Failed to get burndown chart data: {e}")
             return {"error": str(e)}
     
-    async def get_velocity_chart_data(self, team_id: int) -> Dict[str, Any]:
+    async def get_velocity_chart_data(self, db: Session, team_id: int) -> Dict[str, Any]:
         """Get velocity chart data formatted for frontend visualization."""
         try:
-            velocity_history = await self.get_team_velocity_history(team_id)
+            velocity_history = await self.get_team_velocity_history(db, team_id)
             
-            sprint_names = [v.sprint_name for v in velocity_history]
-            planned_points = [v.planned_points for v in velocity_history]
-            completed_points = [v.completed_points for v in velocity_history]
-            velocities = [v.velocity for v in velocity_history]
+            # Split into chart columns in a single pass
+            sprint_names, planned_points, completed_points = [], [], []
+            velocities = np.empty(len(velocity_history))
+            for i, v in enumerate(velocity_history):
+                sprint_names.append(v.sprint_name)
+                planned_points.append(v.planned_points)
+                completed_points.append(v.completed_points)
+                velocities[i] = v.velocity
             
             # Calculate average velocity
-            avg_velocity = sum(velocities) / len(velocities) if velocities else 0
+            avg_velocity = float(velocities.mean()) if velocities.size else 0
             
             return {
                 "labels": sprint_names,
@@ -324,7 +519,7 @@ class AnalyticsService:
                 "metrics": {
                     "average_velocity": round(avg_velocity, 2),
                     "sprint_count": len(velocity_history),
-                    "trend": "improving" if len(velocities) >= 2 and velocities[0] > velocities[-1] else "stable"
+                    "trend": velocity_trend(velocities)
                 }
             }
             
@@ -332,16 +527,17 @@ class AnalyticsService:
             logger.error(f"Failed to get velocity chart data: {e}")
             return {"error": str(e)}
     
-    async def generate_sprint_report(self, sprint_id: int) -> Dict[str, Any]:
+    async def generate_sprint_report(self, db: Session, sprint_id: int) -> Dict[str, Any]:
         """Generate a comprehensive sprint report."""
         try:
-            metrics = await self.get_sprint_metrics(sprint_id)
+            metrics = await self.get_sprint_metrics(db, sprint_id)
             if not metrics:
                 return {"error": "Sprint not found"}
             
-            # Get team velocity history for context
-            team = self.db.query(Team).join(Sprint).filter(Sprint.id == sprint_id).first()
-            velocity_history = await self.get_team_velocity_history(team.id, 3) if team else []
+            # Get team velocity history for context. Deliberately sequential: both
+            # lookups share the request's Session, which can't be used from two
+            # threads at once, and the metrics are usually a cache hit anyway.
+            velocity_history = await self.get_team_velocity_history(db, metrics.team_id, 3)
             
             report = {
                 "sprint_overview": {
@@ -365,7 +561,7 @@ class AnalyticsService:
                     "on_track": metrics.is_on_track,
                     "predicted_completion": metrics.predicted_completion_date.isoformat() if metrics.predicted_completion_date else None
                 },
-                "insights": await self._generate_sprint_insights(metrics, velocity_history)
+                "insights": self._generate_sprint_insights(metrics, velocity_history)
             }
             
             return report
@@ -374,21 +570,21 @@ class AnalyticsService:
             logger.error(f"Failed to generate sprint report: {e}")
             return {"error": str(e)}
     
-    async def _generate_sprint_insights(self, metrics: SprintMetrics, velocity_history: List[VelocityData]) -> List[str]:
+    def _generate_sprint_insights(self, metrics: SprintMetrics, velocity_history: List[VelocityData]) -> List[str]:
         """Generate AI insights about sprint performance."""
         insights = []
         
         # Completion rate insights
         if metrics.completion_percentage > 80:
-            insights.append("🎯 Sprint is performing well with high completion rate")
+            insights.append(INSIGHT_HIGH_COMPLETION)
         elif metrics.completion_percentage < 50:
-            insights.append("⚠️ Sprint completion rate is below expectations")
+            insights.append(INSIGHT_LOW_COMPLETION)
         
         # Timeline insights
         if not metrics.is_on_track and metrics.days_remaining > 0:
-            insights.append("📅 Sprint may miss deadline based on current progress")
+            insights.append(INSIGHT_AT_RISK)
         elif metrics.is_on_track:
-            insights.append("✅ Sprint is on track to meet its goals")
+            insights.append(INSIGHT_ON_TRACK)
         
         # Velocity insights
         if velocity_history and len(velocity_history) >= 2:
@@ -396,15 +592,15 @@ class AnalyticsService:
             avg_historical = sum(v.velocity for v in velocity_history) / len(velocity_history)
             
             if current_velocity > avg_historical * 1.2:
-                insights.append("🚀 Team velocity is above historical average")
+                insights.append(INSIGHT_VELOCITY_ABOVE_AVERAGE)
             elif current_velocity < avg_historical * 0.8:
-                insights.append("🐌 Team velocity is below historical average")
+                insights.append(INSIGHT_VELOCITY_BELOW_AVERAGE)
         
         # Workload insights
         if metrics.days_remaining > 0:
             daily_required = metrics.remaining_story_points / metrics.days_remaining if metrics.days_remaining > 0 else 0
             if daily_required > metrics.velocity * 1.5:
-                insights.append("⚡ Remaining work requires increased daily velocity")
+                insights.append(INSIGHT_VELOCITY_INCREASE_NEEDED)
         
         return insights
 
@@ -2,45 +2,334 @@
 Jira integration service for issue tracking and project management.
 Handles ticket retrieval, updates, and sprint management.
 """
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import random
+import re
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Sequence, Tuple
 
-from atlassian import Jira
-from atlassian.errors import ApiError
+import httpx
+import orjson
+from cachetools import TTLCache
 
+from app.core.cache import async_cached
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Names Jira uses for the story points custom field (company- and team-managed projects)
+STORY_POINTS_FIELD_NAMES = frozenset({"story points", "story point estimate"})
+DEFAULT_STORY_POINTS_FIELD = "customfield_10002"
+FIELD_CACHE_TTL_SECONDS = 600
+PROJECT_PAGE_SIZE = 50  # project/search maximum
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+MAX_RETRY_BACKOFF_SECONDS = 30.0
+# Shared stand-in for issues without a fields object, so projection never allocates one
+NO_FIELDS = MappingProxyType({})
+# Fields fetched for issue listings unless the caller asks for more; description
+# is left out because it usually dominates the response size
+DEFAULT_ISSUE_FIELDS = ("summary", "status", "assignee", "issuetype", "updated")
+
+# Project list and current user rarely change but are fetched on every settings
+# page load. Only successful lookups are cached; auth failures clear the cache
+# so rotated credentials take effect immediately.
+jira_metadata_cache: TTLCache = TTLCache(maxsize=8, ttl=300)
+
+PROJECT_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]+$")
+
+
+def _jql_value(value: Any) -> str:
+    """Render a JQL operand; None means EMPTY, strings are quoted and escaped."""
+    if value is None:
+        return "EMPTY"
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _build_jql(
+    project_key: str,
+    conditions: List[Tuple[str, str, Any]],
+    order_by: Optional[str] = None
+) -> str:
+    """
+    Build a JQL query scoped to one project.
+    
+    Args:
+        project_key: Jira project key; rejected unless it looks like one
+        conditions: (field, operator, value) clauses joined with AND
+        order_by: Optional ORDER BY clause, e.g. "priority DESC"
+        
+    Returns:
+        JQL string
+        
+    Raises:
+        ValueError: If project_key is not a valid Jira project key
+    """
+    if not PROJECT_KEY_PATTERN.match(project_key):
+        raise ValueError(f"Invalid Jira project key: {project_key!r}")
+    clauses = [f"project = {project_key}"]
+    clauses.extend(f"{field} {operator} {_jql_value(value)}" for field, operator, value in conditions)
+    jql = " AND ".join(clauses)
+    return f"{jql} ORDER BY {order_by}" if order_by else jql
+
+
+# The queries below depend only on their arguments, so each distinct one is
+# validated and formatted once per process
+
+@lru_cache(maxsize=128)
+def _recent_updates_jql(project_key: str, hours_back: int, assignee: Optional[str]) -> str:
+    """JQL for issues updated in the last ``hours_back`` hours."""
+    # Relative date, evaluated by Jira itself; avoids local/server timezone skew
+    conditions = [("updated", ">=", f"-{hours_back}h")]
+    if assignee:
+        conditions.append(("assignee", "=", assignee))
+    return _build_jql(project_key, conditions)
+
+
+@lru_cache(maxsize=128)
+def _backlog_jql(project_key: str) -> str:
+    """JQL for open issues not in any sprint, in backlog order."""
+    return _build_jql(
+        project_key,
+        [("sprint", "is", None), ("status", "!=", "Done")],
+        order_by="priority DESC, created ASC"
+    )
+
+
+def _name_of(obj: Optional[Dict[str, Any]], default: str) -> str:
+    """Name of a Jira status/issuetype/priority object."""
+    return obj.get('name', default) if obj else default
+
+
+def _user_name(user_obj: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Extract user name from Jira user object."""
+    if not user_obj:
+        return None
+    return user_obj.get('displayName') or user_obj.get('name', 'Unknown User')
+
+
+# (output key, Jira field, converter) for every column an issue listing can carry
+ISSUE_COLUMNS = (
+    ('summary', 'summary', lambda value: value or ''),
+    ('status', 'status', lambda value: _name_of(value, 'Unknown')),
+    ('assignee', 'assignee', _user_name),
+    ('issue_type', 'issuetype', lambda value: _name_of(value, 'Unknown')),
+    ('priority', 'priority', lambda value: _name_of(value, 'Medium')),
+    ('description', 'description', lambda value: value or ''),
+    ('created', 'created', lambda value: value),
+    ('updated', 'updated', lambda value: value),
+)
+
+
+def _issue_projector(
+    requested: Sequence[str],
+    story_points_field: Optional[str] = None,
+    story_points_default: Optional[float] = None
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function that flattens Jira issues into the service's issue dict.
+    
+    The requested columns are resolved once per listing rather than per issue.
+    Only fields that were requested are included, so a missing description is
+    never reported as an empty one.
+    """
+    columns = tuple(column for column in ISSUE_COLUMNS if column[1] in requested)
+    browse_url = f"{settings.JIRA_URL}/browse/"
+
+    def project(issue: Dict[str, Any]) -> Dict[str, Any]:
+        get = (issue.get('fields') or NO_FIELDS).get
+        key = issue.get('key')
+        issue_info = {'key': key}
+        for name, field, convert in columns:
+            issue_info[name] = convert(get(field))
+        if story_points_field:
+            issue_info['story_points'] = get(story_points_field) or story_points_default
+        issue_info['url'] = f"{browse_url}{key}"
+        return issue_info
+
+    return project
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that retries rate-limited and transiently failing Jira requests.
+    
+    Jira Cloud enforces per-tenant rate limits, so concurrent fan-outs hit 429s
+    regularly; those are retried after the server's Retry-After delay.
+    502/503/504 are retried with jittered exponential backoff, but only for
+    requests that are safe to repeat. Connection failures are retried by the
+    wrapped transport.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_retries: int):
+        self._transport = transport
+        self._max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._transport.handle_async_request(request)
+            if attempt >= self._max_retries or not self._should_retry(request, response):
+                return response
+            delay = self._retry_delay(response, attempt)
+            await response.aclose()
+            attempt += 1
+            logger.warning(
+                f"Jira {request.method} {request.url.path} returned {response.status_code} "
+                f"(request id {response.headers.get('X-Arequestid', 'unknown')}); "
+                f"retry {attempt}/{self._max_retries} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    @staticmethod
+    def _should_retry(request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code == 429:
+            # Rate-limited requests were never processed, so any method is safe
+            return True
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            return False
+        # Searches are POSTed but read-only
+        return request.method in IDEMPOTENT_METHODS or request.url.path.endswith("/search")
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return min(2 ** attempt + random.random(), MAX_RETRY_BACKOFF_SECONDS)
+
+
 class JiraService:
     """
     Jira integration service for AI Scrum Master functionality.
     Handles ticket operations, sprint management, and project data retrieval.
     """
     
-    def __init__(self):
-        if not all([settings.JIRA_URL, settings.JIRA_USERNAME, settings.JIRA_API_TOKEN]):
+    def __init__(self, batch_size: int = 100):
+        """
+        Args:
+            batch_size: Issues requested per search page (Jira Cloud caps this at 100)
+        """
+        self.batch_size = batch_size
+        self._story_points_field: Optional[str] = None
+        self._story_points_field_expires = 0.0
+        self._field_lock = asyncio.Lock()
+        self.is_configured = all([settings.JIRA_URL, settings.JIRA_USERNAME, settings.JIRA_API_TOKEN])
+        if not self.is_configured:
             logger.warning("Jira credentials not fully configured")
-            self.client = None
-        else:
-            try:
-                self.client = Jira(
-                    url=settings.JIRA_URL,
-                    username=settings.JIRA_USERNAME,
-                    password=settings.JIRA_API_TOKEN,
-                    cloud=True
-                )
-                logger.info("Jira client initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize Jira client: {e}")
-                self.client = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+        
+        Built lazily because the singleton is created at import time, before an
+        event loop exists. One HTTP/2 client multiplexes every concurrent Jira
+        call over a single pooled TLS connection.
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=settings.JIRA_URL.rstrip("/"),
+                        auth=(settings.JIRA_USERNAME, settings.JIRA_API_TOKEN),
+                        headers={"Accept": "application/json"},
+                        timeout=settings.JIRA_REQUEST_TIMEOUT,
+                        transport=RetryTransport(
+                            httpx.AsyncHTTPTransport(
+                                http2=True,
+                                retries=settings.JIRA_MAX_RETRIES,
+                                limits=httpx.Limits(
+                                    max_connections=settings.JIRA_HTTP_MAX_CONNECTIONS,
+                                    max_keepalive_connections=settings.JIRA_HTTP_MAX_CONNECTIONS
+                                )
+                            ),
+                            max_retries=settings.JIRA_MAX_RETRIES
+                        )
+                    )
+                    logger.info("Jira client initialized successfully")
+        return self._client
+
+    async def aclose(self):
+        """Close the HTTP client's pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """
+        Send a request to the Jira REST API.
+        
+        Args:
+            method: HTTP method
+            path: API path relative to JIRA_URL (e.g. "/rest/api/2/search")
+            **kwargs: Passed through to httpx (params, json, ...)
+            
+        Returns:
+            Decoded JSON body, or None for empty responses
+            
+        Raises:
+            httpx.HTTPStatusError: On 4xx/5xx responses
+        """
+        client = await self._ensure_client()
+        response = await client.request(method, path, **kwargs)
+        if response.status_code in (401, 403):
+            jira_metadata_cache.clear()
+        response.raise_for_status()
+        # orjson decodes straight from bytes, skipping httpx's text decode + stdlib json
+        return orjson.loads(response.content) if response.content else None
+
+    async def _paginated_search(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every issue matching a JQL query, fetching ``batch_size`` per page.
+        
+        Args:
+            jql: JQL query
+            fields: Issue fields to return
+            max_results: Stop after this many issues (all matches if None)
+        """
+        # POST keeps long field lists out of the URL; only startAt/maxResults change per page
+        body = {"jql": jql, "fields": fields, "startAt": 0, "maxResults": self.batch_size}
+        while max_results is None or body["startAt"] < max_results:
+            if max_results is not None:
+                body["maxResults"] = min(self.batch_size, max_results - body["startAt"])
+            page = await self._request("POST", "/rest/api/2/search", json=body)
+            issues = page.get('issues', [])
+            for issue in issues:
+                yield issue
+            body["startAt"] += len(issues)
+            if not issues or body["startAt"] >= page.get('total', 0):
+                break
+
+    async def _get_sprints(self, board_id: int, state: str) -> List[Dict[str, Any]]:
+        """Get a board's sprints in the given state."""
+        data = await self._request(
+            "GET", f"/rest/agile/1.0/board/{board_id}/sprint", params={"state": state}
+        )
+        return data.get('values', [])
 
     async def get_recent_ticket_updates(
         self, 
         project_key: str, 
         hours_back: int = 24,
-        assignee: Optional[str] = None
+        assignee: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get tickets updated in the last N hours.
@@ -49,57 +338,31 @@ class JiraService:
             project_key: Jira project key (e.g., "PROJ")
             hours_back: Look back this many hours
             assignee: Optional filter by assignee
+            fields: Issue fields to fetch (DEFAULT_ISSUE_FIELDS if None)
             
         Returns:
             List of ticket updates with metadata
         """
-        if not self.client:
+        if not self.is_configured:
             logger.error("Jira client not initialized")
             return []
             
         try:
-            # Calculate cutoff time
-            cutoff_time = datetime.now() - timedelta(hours=hours_back)
-            cutoff_str = cutoff_time.strftime("%Y-%m-%d %H:%M")
-            
-            # Build JQL query
-            jql_parts = [
-                f"project = {project_key}",
-                f"updated >= '{cutoff_str}'"
-            ]
-            
-            if assignee:
-                jql_parts.append(f"assignee = '{assignee}'")
-            
-            jql = " AND ".join(jql_parts)
+            # Built once and reused for every page of the search
+            jql = _recent_updates_jql(project_key, hours_back, assignee)
             
             # Execute search
-            issues = self.client.jql(
-                jql,
-                fields=['key', 'summary', 'status', 'assignee', 'updated', 'description', 'issuetype']
-            )
+            requested = list(fields or DEFAULT_ISSUE_FIELDS)
+            issues = self._paginated_search(jql, fields=requested)
             
             # Process results
-            updates = []
-            for issue in issues.get('issues', []):
-                fields = issue.get('fields', {})
-                
-                update_info = {
-                    'key': issue.get('key'),
-                    'summary': fields.get('summary', ''),
-                    'status': fields.get('status', {}).get('name', 'Unknown'),
-                    'assignee': self._extract_user_name(fields.get('assignee')),
-                    'updated': fields.get('updated'),
-                    'issue_type': fields.get('issuetype', {}).get('name', 'Unknown'),
-                    'url': f"{settings.JIRA_URL}/browse/{issue.get('key')}"
-                }
-                
-                updates.append(update_info)
+            project = _issue_projector(requested)
+            updates = [project(issue) async for issue in issues]
             
             logger.info(f"Retrieved {len(updates)} recent ticket updates from {project_key}")
             return updates
             
-        except ApiError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"Jira API error getting recent updates: {e}")
             return []
         except Exception as e:
@@ -110,7 +373,8 @@ class JiraService:
         self, 
         board_id: int, 
         sprint_id: Optional[int] = None,
-        state: str = "active"
+        state: str = "active",
+        fields: Optional[Sequence[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get issues from a specific sprint or active sprint.
@@ -119,62 +383,77 @@ class JiraService:
             board_id: Jira board ID
             sprint_id: Optional specific sprint ID
             state: Sprint state (active, closed, future)
+            fields: Issue fields to fetch (DEFAULT_ISSUE_FIELDS if None);
+                story points are always included
             
         Returns:
             List of sprint issues
         """
-        if not self.client:
+        if not self.is_configured:
             return []
             
         try:
             # Get sprint if not provided
             if not sprint_id:
-                sprints = self.client.sprints(board_id, state=state)
+                sprints = await self._get_sprints(board_id, state)
                 if not sprints:
                     logger.warning(f"No {state} sprints found for board {board_id}")
                     return []
                 sprint_id = sprints[0]['id']
             
             # Get sprint issues
-            issues = self.client.sprint_issues(sprint_id, fields=[
-                'key', 'summary', 'status', 'assignee', 'storyPoints', 
-                'description', 'issuetype', 'priority', 'updated'
-            ])
-            
-            # Process issues
-            sprint_issues = []
-            for issue in issues.get('issues', []):
-                fields = issue.get('fields', {})
-                
-                issue_info = {
-                    'key': issue.get('key'),
-                    'summary': fields.get('summary', ''),
-                    'status': fields.get('status', {}).get('name', 'Unknown'),
-                    'assignee': self._extract_user_name(fields.get('assignee')),
-                    'story_points': fields.get(self._get_story_points_field_id(), 0),
-                    'issue_type': fields.get('issuetype', {}).get('name', 'Unknown'),
-                    'priority': fields.get('priority', {}).get('name', 'Medium'),
-                    'description': fields.get('description', ''),
-                    'updated': fields.get('updated'),
-                    'url': f"{settings.JIRA_URL}/browse/{issue.get('key')}"
-                }
-                
-                sprint_issues.append(issue_info)
+            sprint_issues = [issue async for issue in self.iter_sprint_issues(sprint_id, fields)]
             
             logger.info(f"Retrieved {len(sprint_issues)} issues from sprint {sprint_id}")
             return sprint_issues
             
-        except ApiError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"Jira API error getting sprint issues: {e}")
             return []
         except Exception as e:
             logger.error(f"Error getting sprint issues: {e}")
             return []
 
+    async def iter_sprint_issues(
+        self,
+        sprint_id: int,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a sprint's issues a page at a time.
+        
+        Only one page of the response is held in memory, so large sprints can
+        be scanned without building the whole list.
+        
+        Args:
+            sprint_id: Jira sprint ID
+            fields: Issue fields to fetch (DEFAULT_ISSUE_FIELDS if None);
+                story points are always included
+            
+        Raises:
+            httpx.HTTPStatusError: On Jira API errors
+        """
+        if not self.is_configured:
+            return
+        
+        story_points_field = await self._get_story_points_field_id()
+        requested = [*(fields or DEFAULT_ISSUE_FIELDS), story_points_field]
+        project = _issue_projector(requested, story_points_field, story_points_default=0)
+        params = {"fields": ",".join(requested), "startAt": 0, "maxResults": self.batch_size}
+        while True:
+            page = await self._request("GET", f"/rest/agile/1.0/sprint/{sprint_id}/issue", params=params)
+            issues = page.get('issues', [])
+            for issue in issues:
+                yield project(issue)
+            params["startAt"] += len(issues)
+            if not issues or params["startAt"] >= page.get('total', 0):
+                break
+
     async def get_backlog_issues(
         self, 
         project_key: str, 
-        max_results: int = 50
+        max_results: int = 50,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get product backlog issues (not in any sprint).
@@ -182,57 +461,64 @@ class JiraService:
         Args:
             project_key: Jira project key
             max_results: Maximum number of results
+            fields: Issue fields to fetch (DEFAULT_ISSUE_FIELDS if None);
+                story points are always included
             
         Returns:
             List of backlog issues
         """
-        if not self.client:
+        if not self.is_configured:
             return []
             
         try:
-            # JQL for backlog items (not in sprint, not done)
-            jql = f'project = {project_key} AND sprint is EMPTY AND status != Done ORDER BY priority DESC, created ASC'
-            
-            issues = self.client.jql(
-                jql,
-                fields=[
-                    'key', 'summary', 'status', 'assignee', 'storyPoints',
-                    'description', 'issuetype', 'priority', 'created', 'updated'
-                ],
-                limit=max_results
-            )
-            
-            # Process backlog issues
-            backlog_issues = []
-            for issue in issues.get('issues', []):
-                fields = issue.get('fields', {})
-                
-                issue_info = {
-                    'key': issue.get('key'),
-                    'summary': fields.get('summary', ''),
-                    'status': fields.get('status', {}).get('name', 'Unknown'),
-                    'assignee': self._extract_user_name(fields.get('assignee')),
-                    'story_points': fields.get(self._get_story_points_field_id()),
-                    'issue_type': fields.get('issuetype', {}).get('name', 'Unknown'),
-                    'priority': fields.get('priority', {}).get('name', 'Medium'),
-                    'description': fields.get('description', ''),
-                    'created': fields.get('created'),
-                    'updated': fields.get('updated'),
-                    'url': f"{settings.JIRA_URL}/browse/{issue.get('key')}"
-                }
-                
-                backlog_issues.append(issue_info)
+            backlog_issues = [
+                issue async for issue in self.iter_backlog_issues(project_key, max_results, fields)
+            ]
             
             logger.info(f"Retrieved {len(backlog_issues)} backlog issues from {project_key}")
             return backlog_issues
             
-        except ApiError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"Jira API error getting backlog: {e}")
             return []
         except Exception as e:
             logger.error(f"Error getting backlog issues: {e}")
             return []
 
+    async def iter_backlog_issues(
+        self,
+        project_key: str,
+        max_results: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream product backlog issues (not in any sprint) a page at a time.
+        
+        Only one search page is held in memory, so whole backlogs can be
+        scanned without building the full list.
+        
+        Args:
+            project_key: Jira project key
+            max_results: Stop after this many issues (whole backlog if None)
+            fields: Issue fields to fetch (DEFAULT_ISSUE_FIELDS if None);
+                story points are always included
+            
+        Raises:
+            httpx.HTTPStatusError: On Jira API errors
+            ValueError: If project_key is not a valid Jira project key
+        """
+        if not self.is_configured:
+            return
+        
+        # JQL for backlog items (not in sprint, not done)
+        jql = _backlog_jql(project_key)
+        
+        story_points_field = await self._get_story_points_field_id()
+        requested = [*(fields or DEFAULT_ISSUE_FIELDS), story_points_field]
+        project = _issue_projector(requested, story_points_field)
+        async for issue in self._paginated_search(jql, fields=requested, max_results=max_results):
+            yield project(issue)
+
     async def update_issue_description(
         self, 
         issue_key: str, 
@@ -248,25 +534,55 @@ class JiraService:
         Returns:
             True if successful, False otherwise
         """
-        if not self.client:
+        if not self.is_configured:
             return False
             
         try:
-            self.client.issue_update(
-                issue_key,
-                fields={'description': new_description}
+            await self._request(
+                "PUT", f"/rest/api/2/issue/{issue_key}",
+                json={'fields': {'description': new_description}}
             )
             
             logger.info(f"Updated description for issue {issue_key}")
             return True
             
-        except ApiError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"Jira API error updating issue {issue_key}: {e}")
             return False
         except Exception as e:
             logger.error(f"Error updating issue {issue_key}: {e}")
             return False
 
+    async def bulk_update_descriptions(
+        self,
+        updates: Dict[str, str],
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """
+        Update several issue descriptions concurrently.
+        
+        Each update is independent; a failure doesn't affect the others.
+        
+        Args:
+            updates: Mapping of issue key to new description text
+            max_concurrency: Updates in flight at once (JIRA_MAX_CONCURRENCY if None)
+            
+        Returns:
+            Mapping of issue key to whether its update succeeded
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.JIRA_MAX_CONCURRENCY)
+
+        async def update_one(issue_key: str, description: str) -> bool:
+            async with semaphore:
+                return await self.update_issue_description(issue_key, description)
+
+        results = await asyncio.gather(
+            *(update_one(issue_key, description) for issue_key, description in updates.items())
+        )
+        succeeded = sum(results)
+        logger.info(f"Bulk description update: {succeeded}/{len(results)} issues updated")
+        return dict(zip(updates, results))
+
     async def create_issue(
         self, 
         project_key: str, 
@@ -290,7 +606,7 @@ class JiraService:
         Returns:
             Issue key if successful, None otherwise
         """
-        if not self.client:
+        if not self.is_configured:
             return None
             
         try:
@@ -305,14 +621,14 @@ class JiraService:
             if assignee:
                 fields['assignee'] = {'name': assignee}
             
-            response = self.client.issue_create(fields=fields)
+            response = await self._request("POST", "/rest/api/2/issue", json={'fields': fields})
             issue_key = response.get('key')
             
             if issue_key:
                 logger.info(f"Created new issue: {issue_key}")
                 return issue_key
             
-        except ApiError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"Jira API error creating issue: {e}")
         except Exception as e:
             logger.error(f"Error creating issue: {e}")
@@ -334,32 +650,33 @@ class JiraService:
         Returns:
             Velocity statistics
         """
-        if not self.client:
+        if not self.is_configured:
             return {}
             
         try:
             # Get recent completed sprints
-            sprints = self.client.sprints(board_id, state='closed')
+            sprints = await self._get_sprints(board_id, 'closed')
             recent_sprints = sprints[:sprint_count] if sprints else []
             
+            # Fetch every sprint's issues concurrently, a few at a time to stay polite to Jira
+            semaphore = asyncio.Semaphore(settings.JIRA_MAX_CONCURRENCY)
+            story_points_field = await self._get_story_points_field_id()
+            results = await asyncio.gather(
+                *(
+                    self._fetch_sprint_points(sprint['id'], story_points_field, semaphore)
+                    for sprint in recent_sprints
+                ),
+                return_exceptions=True
+            )
+            
             velocities = []
             sprint_details = []
             
-            for sprint in recent_sprints:
-                sprint_id = sprint['id']
-                issues = self.client.sprint_issues(sprint_id, fields=['storyPoints'])
-                
-                # Calculate completed story points
-                total_points = 0
-                completed_issues = 0
-                
-                for issue in issues.get('issues', []):
-                    fields = issue.get('fields', {})
-                    story_points = fields.get(self._get_story_points_field_id(), 0)
-                    
-                    if story_points:
-                        total_points += story_points
-                        completed_issues += 1
+            for sprint, result in zip(recent_sprints, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Skipping sprint {sprint['id']} in velocity: {result}")
+                    continue
+                total_points, completed_issues = result
                 
                 velocities.append(total_points)
                 sprint_details.append({
@@ -384,34 +701,80 @@ class JiraService:
                 'recent_sprints': sprint_details
             }
             
-        except ApiError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"Jira API error calculating velocity: {e}")
             return {}
         except Exception as e:
             logger.error(f"Error calculating velocity: {e}")
             return {}
 
-    def _extract_user_name(self, user_obj: Optional[Dict[str, Any]]) -> Optional[str]:
-        """Extract user name from Jira user object."""
-        if not user_obj:
-            return None
-        return user_obj.get('displayName') or user_obj.get('name', 'Unknown User')
+    async def _fetch_sprint_points(
+        self, sprint_id: int, story_points_field: str, semaphore: asyncio.Semaphore
+    ) -> Tuple[float, int]:
+        """Return (story points, issues with points) for a sprint."""
+        total_points = 0
+        estimated_issues = 0
+        # Only the story points field is requested; the agile API pages at 50 by
+        # default, so ask for full batches and keep going until the sprint is covered
+        params = {"fields": story_points_field, "startAt": 0, "maxResults": self.batch_size}
+        while True:
+            async with semaphore:
+                page = await self._request(
+                    "GET", f"/rest/agile/1.0/sprint/{sprint_id}/issue", params=params
+                )
+            issues = page.get('issues', [])
+            # Sum estimates straight off the decoded payload; no per-issue dicts needed
+            estimates = [
+                points for points in (
+                    (issue.get('fields') or NO_FIELDS).get(story_points_field) for issue in issues
+                ) if points
+            ]
+            total_points += sum(estimates)
+            estimated_issues += len(estimates)
+            params["startAt"] += len(issues)
+            if not issues or params["startAt"] >= page.get('total', 0):
+                return total_points, estimated_issues
 
-    def _get_story_points_field_id(self) -> str:
-        """Get the field ID for story points (varies by Jira setup)."""
-        # This is typically a custom field in Jira
-        # Common field IDs for story points: customfield_10002, customfield_10016
-        # You may need to adjust this based on your Jira configuration
-        return 'customfield_10002'
+    async def _get_story_points_field_id(self) -> str:
+        """
+        Get the field ID for story points (varies by Jira setup).
+        
+        Discovered from the instance's field list and cached for
+        FIELD_CACHE_TTL_SECONDS; falls back to the common customfield_10002.
+        """
+        if self._story_points_field and time.monotonic() < self._story_points_field_expires:
+            return self._story_points_field
+        
+        async with self._field_lock:
+            # Another caller may have refreshed it while we waited
+            if self._story_points_field and time.monotonic() < self._story_points_field_expires:
+                return self._story_points_field
+            
+            field_id = DEFAULT_STORY_POINTS_FIELD
+            try:
+                fields = await self._request("GET", "/rest/api/2/field")
+                field_id = next(
+                    (
+                        field['id'] for field in fields
+                        if field.get('custom') and field.get('name', '').lower() in STORY_POINTS_FIELD_NAMES
+                    ),
+                    DEFAULT_STORY_POINTS_FIELD
+                )
+            except Exception as e:
+                logger.warning(f"Could not discover Jira story points field, using {field_id}: {e}")
+            
+            self._story_points_field = field_id
+            self._story_points_field_expires = time.monotonic() + FIELD_CACHE_TTL_SECONDS
+            return field_id
 
     async def test_connection(self) -> bool:
         """Test Jira connection."""
-        if not self.client:
+        if not self.is_configured:
             return False
             
         try:
             # Try to get current user info
-            user = self.client.myself()
+            user = await self._get_myself()
             logger.info(f"Jira connection test successful. User: {user.get('displayName', 'Unknown')}")
             return True
         except Exception as e:
@@ -420,22 +783,48 @@ class JiraService:
 
     async def get_projects(self) -> List[Dict[str, Any]]:
         """Get list of available projects."""
-        if not self.client:
+        if not self.is_configured:
             return []
             
         try:
-            projects = self.client.projects()
-            return [
-                {
-                    'key': project.get('key'),
-                    'name': project.get('name'),
-                    'id': project.get('id')
-                }
-                for project in projects
-            ]
+            return list(await self._fetch_projects())
         except Exception as e:
             logger.error(f"Error getting projects: {e}")
             return []
 
+    @async_cached(jira_metadata_cache, key=lambda self: "myself")
+    async def _get_myself(self) -> Dict[str, Any]:
+        """Current user's profile; raises on failure so errors aren't cached."""
+        return await self._request("GET", "/rest/api/2/myself")
+
+    @async_cached(jira_metadata_cache, key=lambda self: "projects")
+    async def _fetch_projects(self) -> List[Dict[str, Any]]:
+        """Project summaries; raises on failure so errors aren't cached."""
+        # The first page tells us the total; fetch the rest concurrently
+        first = await self._request("GET", "/rest/api/2/project/search", params={
+            "startAt": 0, "maxResults": PROJECT_PAGE_SIZE
+        })
+        semaphore = asyncio.Semaphore(settings.JIRA_MAX_CONCURRENCY)
+        
+        async def fetch_page(start_at: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._request("GET", "/rest/api/2/project/search", params={
+                    "startAt": start_at, "maxResults": PROJECT_PAGE_SIZE
+                })
+        
+        rest = await asyncio.gather(*(
+            fetch_page(start_at)
+            for start_at in range(PROJECT_PAGE_SIZE, first.get('total', 0), PROJECT_PAGE_SIZE)
+        ))
+        projects = [project for page in (first, *rest) for project in page.get('values', [])]
+        return [
+            {
+                'key': project.get('key'),
+                'name': project.get('name'),
+                'id': project.get('id')
+            }
+            for project in projects
+        ]
+
 # Global Jira service instance
 jira_service = JiraService()
\ No newline at end of file
@@ -4,10 +4,13 @@ LangChain Agents and Tools for advanced AI automation.
 This module provides sophisticated AI agents that can make decisions,
 use tools, and perform complex workflows for Scrum Master tasks.
 """
+import asyncio
 import logging
+from functools import partial
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, date
 
+import anyio
 from langchain.agents import Tool, AgentExecutor, create_openai_tools_agent
 from langchain.schema import HumanMessage, AIMessage, SystemMessage
 from langchain.tools import BaseTool
@@ -15,16 +18,31 @@ from langchain.callbacks.manager import CallbackManagerForToolRun
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.memory import ConversationBufferMemory
+from langchain_core.caches import BaseCache
+from langchain_community.cache import SQLiteCache
 from pydantic import BaseModel, Field
 
 from app.core.config import settings
+from app.core.database import SessionLocal
 from app.services.slack_service import slack_service
 from app.services.jira_service import jira_service
-from app.services.analytics_service import analytics_service
-from app.services.vector_service import vector_service
+from app.services.analytics_service import analytics_service, sprint_agent_response_cache
+from app.services.vector_service import get_vector_service
 
 logger = logging.getLogger(__name__)
 
+# Agent steps with an identical prompt (e.g. repeated standup workflows over the
+# same collected text) are answered from disk instead of another GPT-4 call.
+# Scoped to the agent's model rather than set_llm_cache() so the AI service's
+# own caching and regeneration behaviour is unaffected.
+agent_llm_cache: Optional[BaseCache] = (
+    SQLiteCache(database_path=settings.AGENT_LLM_CACHE_PATH) if settings.AGENT_LLM_CACHE_PATH else None
+)
+
+# AgentExecutor's answer when it gives up at max_iterations/max_execution_time,
+# which must not be reused as if it were a real answer
+AGENT_STOPPED_PREFIX = "Agent stopped"
+
 class SlackTool(BaseTool):
     """Tool for interacting with Slack."""
     
@@ -112,8 +130,8 @@ class JiraTool(BaseTool):
                     return f"Sync failed: {sync_results['error']}"
             
             elif action == "get_tickets":
-                tickets = jira_service.get_recent_ticket_updates(project_key, hours_back=24)
-                return f"Retrieved {len(tickets)} recent tickets from {project_key}"
+                # Needs the async Jira client, which is only usable from the event loop
+                return "Error: get_tickets is only available when the agent runs asynchronously"
             
             else:
                 return f"Unknown Jira action: {action}. Available actions: create_ticket, update_status, sync_project, get_tickets"
@@ -122,6 +140,31 @@ class JiraTool(BaseTool):
             logger.error(f"Jira tool error: {e}")
             return f"Jira tool error: {str(e)}"
 
+    async def _arun(
+        self,
+        action: str,
+        project_key: str = settings.JIRA_PROJECT_KEY,
+        ticket_key: str = "",
+        ticket_data: Dict[str, Any] = None,
+        status: str = "",
+        run_manager: Optional[CallbackManagerForToolRun] = None
+    ) -> str:
+        """Execute Jira actions from the agent's event loop."""
+        if action == "get_tickets":
+            # The Jira client is async; await it here rather than from a worker thread
+            try:
+                tickets = await jira_service.get_recent_ticket_updates(project_key, hours_back=24)
+                return f"Retrieved {len(tickets)} recent tickets from {project_key}"
+            except Exception as e:
+                logger.error(f"Jira tool error: {e}")
+                return f"Jira tool error: {str(e)}"
+        
+        # Everything else is synchronous; keep it off the event loop
+        return await anyio.to_thread.run_sync(partial(
+            self._run, action, project_key=project_key, ticket_key=ticket_key,
+            ticket_data=ticket_data, status=status
+        ))
+
 class AnalyticsTool(BaseTool):
     """Tool for generating analytics and reports."""
     
@@ -137,49 +180,50 @@ class AnalyticsTool(BaseTool):
     ) -> str:
         """Execute analytics actions."""
         try:
-            if action == "sprint_metrics":
-                if not sprint_id:
-                    return "Error: sprint_id is required for sprint_metrics action"
+            with SessionLocal() as db:
+                if action == "sprint_metrics":
+                    if not sprint_id:
+                        return "Error: sprint_id is required for sprint_metrics action"
                 
-                metrics = analytics_service.get_sprint_metrics(sprint_id)
-                if metrics:
-                    return f"Sprint {metrics.sprint_name}: {metrics.completion_percentage:.1f}% complete, {metrics.days_remaining} days remaining"
-                else:
-                    return f"Failed to get metrics for sprint {sprint_id}"
+                    metrics = asyncio.run(analytics_service.get_sprint_metrics(db, sprint_id))
+                    if metrics:
+                        return f"Sprint {metrics.sprint_name}: {metrics.completion_percentage:.1f}% complete, {metrics.days_remaining} days remaining"
+                    else:
+                        return f"Failed to get metrics for sprint {sprint_id}"
             
-            elif action == "burndown_chart":
-                if not sprint_id:
-                    return "Error: sprint_id is required for burndown_chart action"
+                elif action == "burndown_chart":
+                    if not sprint_id:
+                        return "Error: sprint_id is required for burndown_chart action"
                 
-                chart_data = analytics_service.get_burndown_chart_data(sprint_id)
-                if "error" not in chart_data:
-                    return f"Generated burndown chart for sprint {chart_data.get('sprint_name', sprint_id)}"
-                else:
-                    return f"Failed to generate burndown chart: {chart_data['error']}"
+                    chart_data = asyncio.run(analytics_service.get_burndown_chart_data(db, sprint_id))
+                    if "error" not in chart_data:
+                        return f"Generated burndown chart for sprint {chart_data.get('sprint_name', sprint_id)}"
+                    else:
+                        return f"Failed to generate burndown chart: {chart_data['error']}"
             
-            elif action == "velocity_analysis":
-                if not team_id:
-                    return "Error: team_id is required for velocity_analysis action"
+                elif action == "velocity_analysis":
+                    if not team_id:
+                        return "Error: team_id is required for velocity_analysis action"
                 
-                velocity_data = analytics_service.get_team_velocity_history(team_id)
-                if velocity_data:
-                    avg_velocity = sum(v.velocity for v in velocity_data) / len(velocity_data)
-                    return f"Team velocity analysis: {len(velocity_data)} sprints analyzed, average velocity {avg_velocity:.2f}"
-                else:
-                    return f"No velocity data found for team {team_id}"
+                    velocity_data = asyncio.run(analytics_service.get_team_velocity_history(db, team_id))
+                    if velocity_data:
+                        avg_velocity = sum(v.velocity for v in velocity_data) / len(velocity_data)
+                        return f"Team velocity analysis: {len(velocity_data)} sprints analyzed, average velocity {avg_velocity:.2f}"
+                    else:
+                        return f"No velocity data found for team {team_id}"
             
-            elif action == "sprint_report":
-                if not sprint_id:
-                    return "Error: sprint_id is required for sprint_report action"
+                elif action == "sprint_report":
+                    if not sprint_id:
+                        return "Error: sprint_id is required for sprint_report action"
                 
-                report = analytics_service.generate_sprint_report(sprint_id)
-                if "error" not in report:
-                    return f"Generated comprehensive sprint report for {report.get('sprint_overview', {}).get('name', sprint_id)}"
-                else:
-                    return f"Failed to generate sprint report: {report['error']}"
+                    report = asyncio.run(analytics_service.generate_sprint_report(db, sprint_id))
+                    if "error" not in report:
+                        return f"Generated comprehensive sprint report for {report.get('sprint_overview', {}).get('name', sprint_id)}"
+                    else:
+                        return f"Failed to generate sprint report: {report['error']}"
             
-            else:
-                return f"Unknown analytics action: {action}. Available actions: sprint_metrics, burndown_chart, velocity_analysis, sprint_report"
+                else:
+                    return f"Unknown analytics action: {action}. Available actions: sprint_metrics, burndown_chart, velocity_analysis, sprint_report"
                 
         except Exception as e:
             logger.error(f"Analytics tool error: {e}")
@@ -206,7 +250,7 @@ class KnowledgeTool(BaseTool):
                 if not query:
                     return "Error: query is required for search action"
                 
-                results = vector_service.get_relevant_context(query, limit=5)
+                results = get_vector_service().get_relevant_context(query, limit=5)
                 if results:
                     return f"Found {len(results)} relevant knowledge items for query: '{query}'"
                 else:
@@ -216,7 +260,7 @@ class KnowledgeTool(BaseTool):
                 if not content:
                     return "Error: content is required for store action"
                 
-                doc_id = vector_service.store_context(
+                doc_id = get_vector_service().store_context(
                     content, 
                     metadata or {"timestamp": datetime.now().isoformat()}, 
                     doc_type
@@ -228,7 +272,7 @@ class KnowledgeTool(BaseTool):
                 if not team_id:
                     return "Error: team_id is required in metadata for get_team_context action"
                 
-                context = vector_service.get_team_context(team_id)
+                context = get_vector_service().get_team_context(team_id)
                 return f"Retrieved team context: {len(context)} items found"
             
             else:
@@ -241,12 +285,19 @@ class KnowledgeTool(BaseTool):
 class ScrumMasterAgent:
     """AI Scrum Master agent with decision-making capabilities."""
     
-    def __init__(self):
-        """Initialize the Scrum Master agent with tools."""
+    def __init__(self, cache: Optional[BaseCache] = None):
+        """
+        Initialize the Scrum Master agent with tools.
+        
+        Args:
+            cache: LLM response cache (agent_llm_cache if None), e.g. an
+                InMemoryCache in tests
+        """
         self.llm = ChatOpenAI(
             model="gpt-4",
             temperature=0.3,
-            openai_api_key=settings.OPENAI_API_KEY
+            openai_api_key=settings.OPENAI_API_KEY,
+            cache=cache or agent_llm_cache
         )
         
         # Initialize tools
@@ -315,20 +366,52 @@ class ScrumMasterAgent:
 
 You are operating with human oversight - provide recommendations and execute approved actions."""
     
-    async def process_request(self, request: str, context: Dict[str, Any] = None) -> str:
-        """Process a request using the agent's tools and reasoning."""
+    async def process_request(
+        self,
+        request: str,
+        context: Dict[str, Any] = None,
+        cache_sprint_id: Optional[int] = None
+    ) -> str:
+        """
+        Process a request using the agent's tools and reasoning.
+        
+        Args:
+            request: Natural-language request
+            context: Extra context appended to the request
+            cache_sprint_id: Sprint the answer is about. An identical request
+                for it is then answered from sprint_agent_response_cache until
+                the TTL passes or the sprint or its items change. A cached answer
+                skips the agent's tool calls entirely, so only pass this for
+                read-only requests; None disables reuse.
+        """
         try:
             # Add context to the request if provided
             if context:
                 context_str = f"\nContext: {context}"
                 request += context_str
             
+            answers = None
+            if cache_sprint_id is not None and settings.AGENT_RESPONSE_CACHE_TTL_SECONDS > 0:
+                answers = sprint_agent_response_cache.setdefault(cache_sprint_id, {})
+                if request in answers:
+                    logger.info(f"Reusing cached agent answer for sprint {cache_sprint_id}")
+                    return answers[request]
+            
             # Execute the agent
             result = await self.agent_executor.ainvoke({
                 "input": request
             })
             
-            return result["output"]
+            # Skip the store if the sprint changed while the agent was running
+            output = result["output"]
+            if (
+                answers is not None
+                and sprint_agent_response_cache.get(cache_sprint_id) is answers
+                and not output.startswith(AGENT_STOPPED_PREFIX)
+            ):
+                answers[request] = output
+            
+            return output
             
         except Exception as e:
             logger.error(f"Agent processing error: {e}")
@@ -372,7 +455,8 @@ You are operating with human oversight - provide recommendations and execute app
             
             Please provide a comprehensive health assessment with specific insights and recommendations."""
             
-            return await self.process_request(request)
+            # Read-only: the agent only queries analytics and the knowledge base
+            return await self.process_request(request, cache_sprint_id=sprint_id)
             
         except Exception as e:
             logger.error(f"Sprint health check error: {e}")
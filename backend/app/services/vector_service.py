@@ -2,16 +2,23 @@
 Vector database service for semantic search and context retrieval.
 Handles storing and retrieving knowledge for AI context enhancement.
 """
+import asyncio
+from functools import lru_cache
 import chromadb
+from chromadb.utils import embedding_functions
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import hashlib
 
+from app.core.cache import EmbeddingCache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Model behind chromadb's DefaultEmbeddingFunction; part of the embedding cache key
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
 class VectorService:
     """
     Vector database service using ChromaDB for semantic search and knowledge storage.
@@ -22,10 +29,38 @@ class VectorService:
         # Initialize ChromaDB client
         self.client = chromadb.PersistentClient(path=settings.VECTOR_DB_PATH)
         
+        # Kept on the service so callers can embed text without a collection query
+        self.embedding_function = embedding_functions.DefaultEmbeddingFunction()
+        
+        # Context queries are mostly fixed strings, so their embeddings are persisted across runs
+        self.embedding_cache = EmbeddingCache(
+            settings.EMBEDDING_CACHE_PATH,
+            EMBEDDING_MODEL_NAME,
+            maxsize=settings.EMBEDDING_CACHE_SIZE,
+            ttl_seconds=settings.EMBEDDING_CACHE_TTL_DAYS * 86400
+        )
+        
+        # Lookups go through each collection's HNSW index, not a linear scan
+        index_metadata = {
+            "hnsw:space": "cosine",  # Use cosine similarity
+            "hnsw:M": settings.VECTOR_HNSW_M,
+            "hnsw:construction_ef": settings.VECTOR_HNSW_CONSTRUCTION_EF,
+            "hnsw:search_ef": settings.VECTOR_HNSW_SEARCH_EF,
+        }
+        
         # Get or create the main collection
         self.collection = self.client.get_or_create_collection(
             name=settings.VECTOR_COLLECTION_NAME,
-            metadata={"hnsw:space": "cosine"}  # Use cosine similarity
+            metadata=index_metadata,
+            embedding_function=self.embedding_function
+        )
+        
+        # Generated standup summaries keyed by their input, separate so unfiltered
+        # context queries never return cache entries as knowledge
+        self.standup_cache_collection = self.client.get_or_create_collection(
+            name=settings.VECTOR_STANDUP_CACHE_COLLECTION_NAME,
+            metadata=index_metadata,
+            embedding_function=self.embedding_function
         )
         
         logger.info(f"Vector service initialized with collection: {settings.VECTOR_COLLECTION_NAME}")
@@ -47,6 +82,16 @@ class VectorService:
         Returns:
             Document ID for the stored content
         """
+        return self._add_document(self.collection, content, metadata, document_type)
+
+    def _add_document(
+        self,
+        collection,
+        content: str,
+        metadata: Dict[str, Any],
+        document_type: str
+    ) -> str:
+        """Add one document with type and timestamp metadata to a collection."""
         try:
             # Generate unique document ID
             doc_id = self._generate_doc_id(content, metadata)
@@ -59,7 +104,7 @@ class VectorService:
             }
             
             # Store in ChromaDB
-            self.collection.add(
+            collection.add(
                 documents=[content],
                 metadatas=[full_metadata],
                 ids=[doc_id]
@@ -101,7 +146,7 @@ class VectorService:
             
             # Perform semantic search
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=self._embed_queries([query]),
                 n_results=limit,
                 where=where_clause if where_clause else None
             )
@@ -118,6 +163,53 @@ class VectorService:
             logger.error(f"Failed to retrieve context: {e}")
             return []
 
+    async def get_relevant_context_batch(self, queries: List[str], limit: int = 5) -> List[List[str]]:
+        """
+        Retrieve relevant context for several queries with one collection query.
+        
+        Args:
+            queries: Query texts for semantic search
+            limit: Maximum number of results per query
+            
+        Returns:
+            One list of context strings per query, in the same order
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        try:
+            embeddings = await asyncio.to_thread(self._embed_queries, unique_queries)
+            results = await asyncio.to_thread(
+                self.collection.query,
+                query_embeddings=embeddings,
+                n_results=limit
+            )
+            documents = results['documents'] if results and results['documents'] else []
+        except Exception as e:
+            logger.error(f"Failed to retrieve batched context: {e}")
+            documents = []
+        
+        by_query = dict(zip(unique_queries, documents))
+        logger.info(f"Retrieved context for {len(unique_queries)} queries in one batch")
+        return [by_query.get(query, []) for query in queries]
+
+    def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed query texts, computing only those missing from the embedding cache."""
+        embeddings = [self.embedding_cache.get(query) for query in queries]
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if misses:
+            computed = self.embedding_function([queries[i] for i in misses])
+            for i, embedding in zip(misses, computed):
+                self.embedding_cache.put(queries[i], embedding)
+                embeddings[i] = embedding
+        return [list(map(float, embedding)) for embedding in embeddings]
+
+    def embed_text(self, text: str) -> List[float]:
+        """
+        Embed a single text with the collection's embedding function.
+        
+        Runs the model synchronously; call through a thread from async code.
+        """
+        return list(self.embedding_function([text])[0])
+
     async def store_standup_summary(
         self, 
         summary: str, 
@@ -136,6 +228,59 @@ class VectorService:
         
         return await self.store_context(summary, metadata, "standup")
 
+    async def get_cached_standup_summary(
+        self,
+        canonical_input: str,
+        team_id: int,
+        threshold: float = 0.92
+    ) -> Optional[str]:
+        """
+        Look up a previously generated standup summary for near-identical input.
+        
+        Args:
+            canonical_input: Canonicalized standup entries for the team
+            team_id: Team the standup belongs to
+            threshold: Minimum cosine similarity to count as a hit
+            
+        Returns:
+            JSON-encoded summary if a close enough match exists, otherwise None
+        """
+        try:
+            results = self.standup_cache_collection.query(
+                query_texts=[canonical_input],
+                n_results=1,
+                where={"team_id": team_id},
+                include=["metadatas", "distances"]
+            )
+            
+            if not results or not results['distances'] or not results['distances'][0]:
+                return None
+            
+            similarity = 1.0 - results['distances'][0][0]
+            if similarity < threshold:
+                return None
+            
+            logger.info(f"Standup summary cache hit for team {team_id} (similarity {similarity:.3f})")
+            return results['metadatas'][0][0].get("summary_json")
+            
+        except Exception as e:
+            logger.error(f"Failed to query standup summary cache: {e}")
+            return None
+
+    async def cache_standup_summary(
+        self,
+        canonical_input: str,
+        summary_json: str,
+        team_id: int
+    ) -> str:
+        """Store a generated summary keyed by the embedding of its canonical input."""
+        metadata = {
+            "team_id": team_id,
+            "summary_json": summary_json,
+            "source": "standup_summary_cache"
+        }
+        return self._add_document(self.standup_cache_collection, canonical_input, metadata, "standup_cache")
+
     async def store_backlog_insights(
         self, 
         insights: str, 
@@ -279,5 +424,48 @@ class VectorService:
             logger.error(f"Failed to get collection stats: {e}")
             return {"error": str(e)}
 
-# Global vector service instance
-vector_service = VectorService()
\ No newline at end of file
+class VectorContextBatcher:
+    """
+    Coalesces concurrent context lookups into a single batched collection query.
+    
+    The first lookup in a window schedules a flush; every lookup arriving before
+    it fires shares the same query and gets its own slice of the results.
+    """
+    
+    def __init__(self, vector_service: VectorService, window_ms: int = settings.VECTOR_BATCH_WINDOW_MS):
+        self.vector_service = vector_service
+        self.window = window_ms / 1000
+        self._pending: List[Tuple[str, int, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def get(self, query: str, limit: int = 5) -> List[str]:
+        """Queue a lookup for the next batch and wait for its results."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, limit, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self):
+        """Dispatch everything queued during the window and hand each caller its results."""
+        await asyncio.sleep(self.window)
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+        
+        queries = [query for query, _, _ in batch]
+        max_limit = max(limit for _, limit, _ in batch)
+        results = await self.vector_service.get_relevant_context_batch(queries, limit=max_limit)
+        
+        for (_, limit, future), contexts in zip(batch, results):
+            if not future.done():
+                future.set_result(contexts[:limit])
+
+@lru_cache(maxsize=None)
+def get_vector_service() -> VectorService:
+    """
+    Shared VectorService instance, created on first use.
+    
+    Use as a FastAPI dependency so the Chroma client and embedding model are
+    loaded once per process and shared with AIService.
+    """
+    return VectorService()
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""
+Shared pytest setup.
+"""
+import os
+
+# Lazy relationship loads raise under test, so a query missing its
+# selectinload()/joinedload() fails instead of quietly issuing N+1 queries.
+# Set before any app module is imported, since database.py reads it once.
+os.environ.setdefault("SQLALCHEMY_RAISELOAD", "true")
@@ -0,0 +1,92 @@
+"""
+Tests for reuse of read-only Scrum Master agent answers.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.core.database import Base, SessionLocal
+from app.models import Project, Sprint, Team
+from app.services.analytics_service import sprint_agent_response_cache
+from app.services.langchain_agents import ScrumMasterAgent
+
+
+class FakeExecutor:
+    """Stands in for AgentExecutor, returning canned outputs and counting runs."""
+
+    def __init__(self, *outputs):
+        self.outputs = list(outputs)
+        self.calls = 0
+
+    async def ainvoke(self, inputs):
+        self.calls += 1
+        return {"output": self.outputs.pop(0)}
+
+
+def make_agent(*outputs) -> ScrumMasterAgent:
+    # Skip __init__, which builds the OpenAI model and tools
+    agent = ScrumMasterAgent.__new__(ScrumMasterAgent)
+    agent.agent_executor = FakeExecutor(*outputs)
+    return agent
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    sprint_agent_response_cache.clear()
+    yield
+    sprint_agent_response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_identical_request_for_same_sprint_is_reused():
+    agent = make_agent("healthy", "at risk")
+
+    assert await agent.process_request("check", cache_sprint_id=1) == "healthy"
+    assert await agent.process_request("check", cache_sprint_id=1) == "healthy"
+    assert await agent.process_request("check", cache_sprint_id=2) == "at risk"
+    assert agent.agent_executor.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_requests_without_sprint_are_not_cached():
+    agent = make_agent("first", "second")
+
+    assert await agent.process_request("check") == "first"
+    assert await agent.process_request("check") == "second"
+
+
+@pytest.mark.asyncio
+async def test_stopped_agent_output_is_not_cached():
+    agent = make_agent("Agent stopped due to iteration limit or time limit.", "healthy")
+
+    await agent.process_request("check", cache_sprint_id=1)
+    assert await agent.process_request("check", cache_sprint_id=1) == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_sprint_update_invalidates_answer():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with SessionLocal(bind=engine) as db:
+        team = Team(name="Team")
+        db.add(team)
+        db.flush()
+        project = Project(name="Project", key="PRJ", team_id=team.id)
+        db.add(project)
+        db.flush()
+        now = datetime.now()
+        sprint = Sprint(
+            name="Sprint 1", start_date=now, end_date=now + timedelta(days=14),
+            project_id=project.id, team_id=team.id
+        )
+        db.add(sprint)
+        db.commit()
+
+        agent = make_agent("on track", "behind")
+        assert await agent.process_request("check", cache_sprint_id=sprint.id) == "on track"
+
+        sprint.name = "Sprint 1 (extended)"
+        db.commit()
+        assert await agent.process_request("check", cache_sprint_id=sprint.id) == "behind"
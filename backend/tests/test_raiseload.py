@@ -0,0 +1,36 @@
+"""
+Tests for the lazy-load guard enabled under pytest (see conftest.py).
+"""
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from app.core.database import Base, SessionLocal
+from app.models import Project, Team
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with SessionLocal(bind=engine) as session:
+        team = Team(name="Team")
+        session.add(team)
+        session.flush()
+        session.add(Project(name="Project", key="PRJ", team_id=team.id))
+        session.commit()
+        session.expunge_all()
+        yield session
+
+
+def test_lazy_relationship_load_raises(db):
+    team = db.scalars(select(Team)).one()
+    with pytest.raises(InvalidRequestError, match="Team.projects"):
+        team.projects
+
+
+def test_eagerly_loaded_relationship_does_not_raise(db):
+    team = db.scalars(select(Team).options(selectinload(Team.projects))).one()
+    assert [project.key for project in team.projects] == ["PRJ"]